@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Parallel Hash Cracking Engine - Hasher Micro-Benchmark
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Per-item overhead of batched vs single-item hashing
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory to path so we can import src
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from src.pipeline.hasher import Hasher
+
+ITEMS = [f"candidate{i}" for i in range(50000)]
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """
+    Return best wall time of several runs.
+    
+    Args:
+        func: Callable to time
+        repeat: Number of runs
+        
+    Returns:
+        float: Shortest run time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Compare hash() + compare against match_many() for a missing target."""
+    hasher = Hasher('SHA256')
+    target = hasher.hash('candidate-missing')
+    targets = {bytes.fromhex(target)}
+    
+    def single():
+        for item in ITEMS:
+            if hasher.hash(item).lower() == target:
+                pass
+    
+    def batched():
+        for _ in hasher.match_many(ITEMS, targets):
+            pass
+    
+    single_time = best_of(single)
+    batched_time = best_of(batched)
+    
+    print(f"Items:            {len(ITEMS)}")
+    print(f"hash() + compare: {single_time / len(ITEMS) * 1e9:.0f} ns/item")
+    print(f"match_many():     {batched_time / len(ITEMS) * 1e9:.0f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,14 @@ Date: November 2025
 Description: JSON configuration file loader with validation
 """
 
+import copy
 import json
 import os
 from typing import Dict, Any, Optional
 
 
 class ConfigLoader:
-    """Load and validate configuration from JSON file."""
+    """Load and validate configuration from JSON file or an in-memory dict."""
     
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
@@ -32,6 +33,22 @@ class ConfigLoader:
         self._validate()
         return self.config
     
+    def load_dict(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a configuration that is already in memory.
+        
+        The dict is copied, so the caller's config is never modified.
+        
+        Args:
+            config: Configuration dictionary
+        
+        Returns:
+            Validated copy of the configuration
+        """
+        self.config = copy.deepcopy(config)
+        self._validate()
+        return self.config
+    
     def _validate(self) -> None:
         """Validate required configuration fields."""
         required_sections = ['general', 'hash', 'input', 'output']
@@ -53,11 +70,43 @@ class ConfigLoader:
         if chunk_size < 1:
             raise ValueError("chunk_size must be at least 1")
         
+        # Validate queue_size (0 = unbounded)
+        queue_size = self.config['general'].get('queue_size', 1)
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        
+        # Validate task batching (1 = one task per queue message)
+        if self.config['general'].get('task_batch_size', 1) < 1:
+            raise ValueError("task_batch_size must be at least 1")
+        
+        # Validate adaptive chunk sizing (0 = static chunk_size)
+        if self.config['general'].get('adaptive_chunk_ms', 0) < 0:
+            raise ValueError("adaptive_chunk_ms must not be negative")
+        
+        min_chunk = self.config['general'].get('min_chunk_size', 1)
+        max_chunk = self.config['general'].get('max_chunk_size', min_chunk)
+        if min_chunk < 1 or max_chunk < min_chunk:
+            raise ValueError("Chunk size bounds must satisfy 1 <= min_chunk_size <= max_chunk_size")
+        
+        # Validate input mode
+        valid_modes = ['csv', 'sharded', 'wordlist', 'birth_numbers', 'mask']
+        mode = self.config['input'].get('mode', 'csv')
+        if mode not in valid_modes:
+            raise ValueError(f"Invalid input mode '{mode}'. Must be one of: {valid_modes}")
+        
         # Validate algorithm
         valid_algorithms = ['SHA256', 'SHA384', 'SHA512', 'PBKDF2']
         algorithm = self.config['hash'].get('algorithm', '')
         if algorithm not in valid_algorithms:
             raise ValueError(f"Invalid hash algorithm '{algorithm}'. Must be one of: {valid_algorithms}")
+        
+        # Validate optional algorithm list for mixed target sets
+        algorithms = self.config['hash'].get('algorithms', [])
+        if not isinstance(algorithms, list):
+            raise ValueError("hash.algorithms must be a list")
+        for name in algorithms:
+            if name not in valid_algorithms:
+                raise ValueError(f"Invalid hash algorithm '{name}'. Must be one of: {valid_algorithms}")
     
     def get(self, *keys: str, default: Any = None) -> Any:
         """Get nested configuration value."""
@@ -7,19 +7,29 @@ Date: November 2025
 Description: Main orchestrator for parallel hash cracking using multiprocessing
 """
 
+import argparse
+import copy
 import sys
 import os
-from multiprocessing import Manager, Semaphore
-from typing import List
+from multiprocessing import Semaphore
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Union
 
 from src.config_loader import ConfigLoader
+from src.pipeline.checkpoint import Checkpoint
+from src.pipeline.chunk_sizer import ChunkSizer
+from src.pipeline.file_source import FileRangeSource
+from src.pipeline.hash_index import HashIndex
+from src.pipeline.job import Job
 from src.pipeline.receiver import Receiver
-from src.pipeline.task_queue import TaskQueue
-from src.pipeline.worker import Worker
+from src.pipeline.result_cache import ResultCache
+from src.pipeline.rules import RuleEngine
+from src.pipeline.source import CandidateSource
+from src.pipeline.worker_pool import WorkerPool
 from src.pipeline.collector import Collector
 from src.pipeline.logger import Logger
+from src.pipeline.potfile import Potfile
+from src.pipeline.target_set import TargetSet
 from src.utils.timer import Timer
-from src.utils.validator import Validator
 
 
 class HashCrackingPipeline:
@@ -28,28 +38,67 @@ class HashCrackingPipeline:
     
     Coordinates multiple worker processes to perform parallel hash computation
     and comparison using the Producer-Consumer pattern.
+    
+    The run is executed as a job of a WorkerPool. Given a shared pool, the
+    pipeline only submits its job and the warmed-up workers stay alive
+    afterwards; without one it starts a private pool for this run.
+    
+    If `output.checkpoint_path` is set, progress is checkpointed while the
+    run is going and a run created with resume=True skips the tasks an
+    interrupted run already finished.
+    
+    The configuration may be a path or an already loaded dict, and CSV
+    candidates may be passed in memory (CSV text, a readable stream or an
+    iterable of records) instead of through `input.csv_path`. Matches of
+    the last run are kept in `results`, so embedding callers need no file
+    round trips.
+    
+    Targets cracked by earlier runs (`output.potfile_path`) or answered
+    by a ResultCache are not searched, and a run whose targets are all
+    answered starts no work at all. Every match is appended to the potfile.
     """
     
-    def __init__(self, config_path: str = "config.json"):
-        self.config_loader = ConfigLoader(config_path)
-        self.config = self.config_loader.load()
+    def __init__(self, config: Union[str, Dict[str, Any]] = "config.json",
+                 pool: Optional[WorkerPool] = None, resume: bool = False,
+                 candidates: Union[str, bytes, IO, Iterable[str], None] = None,
+                 cache: Optional[ResultCache] = None, potfile: Optional[Potfile] = None):
+        if isinstance(config, dict):
+            self.config_loader = ConfigLoader()
+            self.config = self.config_loader.load_dict(config)
+        else:
+            self.config_loader = ConfigLoader(config)
+            self.config = self.config_loader.load()
         
         self.logger = Logger(
             self.config['output']['log_path'],
             self.config['output']['verbose']
         )
         
-        self.receiver = Receiver(self.config)
-        self.task_queue = TaskQueue()
-        self.manager = Manager()
-        self.results_dict = self.manager.dict()
+        self.receiver = Receiver(self.config, candidates)
+        self.source = CandidateSource.create(self.config)
+        self.candidates = candidates
         
         self.worker_count = self.config['general']['worker_count']
         self.max_workers = self.config['general'].get('max_workers', 8)
         self.semaphore = Semaphore(min(self.worker_count, self.max_workers))
         
-        self.workers: List[Worker] = []
+        self.pool = pool
+        self.owns_pool = pool is None
+        self.job: Optional[Job] = None
         self.collector = None
+        self.targets = TargetSet(self.config['hash']['algorithm'])
+        self.resume = resume
+        self.checkpoint: Optional[Checkpoint] = None
+        self.finished: Optional[Checkpoint] = None
+        self.sizer: Optional[ChunkSizer] = None
+        self.results: List[Dict[str, Any]] = []
+        self.total_time = 0.0
+        self.cache = cache
+        self.potfile = potfile
+        self.pot_cracked: List[Dict[str, Any]] = []
+        self.cached: List[Dict[str, Any]] = []
+        self.cached_absent: List[str] = []
+        self.fingerprint: Optional[str] = None
         
         self.total_timer = Timer()
     
@@ -62,57 +111,297 @@ class HashCrackingPipeline:
         """
         self.logger.info("Validating pipeline setup...")
         
-        if not self.receiver.validate_file():
+        if self.source is not None:
+            if self.candidates is not None:
+                self.logger.error("In-memory candidates require input.mode 'csv'")
+                return False
+            
+            if not self.source.validate():
+                return False
+        elif not self.receiver.validate_file():
+            return False
+        
+        if not self.load_targets():
+            return False
+        
+        if not self.load_checkpoint():
             return False
         
-        target_hash = self.config.get('target', {}).get('hash_to_find', '')
+        if not self.load_potfile():
+            return False
+        
+        try:
+            rules = RuleEngine.from_config(self.config)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Invalid rules: {e}")
+            return False
+        
+        if rules is not None:
+            self.logger.info(f"Loaded {len(rules)} mutation rules")
         
-        if not target_hash:
+        if not self.targets:
             self.logger.warning("No target hash specified - will process but not find matches")
             return True
         
-        algorithm = self.config['hash']['algorithm']
+        self.logger.info("Validation passed")
+        return True
+    
+    def load_targets(self) -> bool:
+        """
+        Load target hashes from configuration into the target set.
+        
+        Returns:
+            True if all configured targets are usable, False otherwise
+        """
+        target_config = self.config.get('target', {})
+        algorithms = self.config['hash'].get('algorithms') or [self.config['hash']['algorithm']]
+        
+        target_hash = target_config.get('hash_to_find', '')
+        salt_length = self.config['hash'].get('pbkdf2_salt_length', 32)
+        if target_hash and not TargetSet(algorithms, salt_length).add(target_hash):
+            self.logger.error(f"Invalid target hash for algorithms {', '.join(algorithms)}")
+            return False
         
-        if not Validator.is_valid_hash(target_hash, algorithm):
-            self.logger.error(f"Invalid target hash for algorithm {algorithm}")
+        hash_file = target_config.get('hash_file', '')
+        if hash_file and not os.path.isfile(hash_file):
+            self.logger.error(f"Target hash file not found: {hash_file}")
             return False
         
-        self.logger.info("Validation passed")
+        try:
+            self.targets = TargetSet.from_config(self.config)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error(f"Error loading target hashes: {e}")
+            return False
+        
+        if hash_file:
+            self.logger.info(f"Loaded {len(self.targets)} unique target hashes")
+        
+        active = self.targets.active_algorithms()
+        if len(active) > 1:
+            breakdown = ', '.join(
+                f"{algorithm}: {len(self.targets.by_algorithm[algorithm])}" for algorithm in active
+            )
+            self.logger.info(f"Targets span {len(active)} algorithms ({breakdown})")
+        
+        if self.targets.salts:
+            self.logger.info(f"PBKDF2 targets use {len(self.targets.salts)} unique salts")
+        
+        if self.targets.invalid_count > 0:
+            self.logger.warning(f"Skipped {self.targets.invalid_count} invalid target hashes")
+        
         return True
     
-    def create_workers(self, target_hash: str) -> None:
+    def load_checkpoint(self) -> bool:
+        """
+        Set up the checkpoint of this run, loading it when resuming.
+        
+        Returns:
+            True if checkpointing is usable or disabled, False otherwise
         """
-        Create worker processes.
+        path = self.config['output'].get('checkpoint_path', '')
+        
+        if not path:
+            if self.resume:
+                self.logger.error("Resuming requires output.checkpoint_path in the configuration")
+                return False
+            return True
+        
+        interval = self.config['general'].get('checkpoint_interval', 30)
+        fingerprint = Checkpoint.fingerprint_of(self.config, self.targets)
+        
+        if self.resume:
+            try:
+                self.checkpoint = Checkpoint.load(path, fingerprint, interval)
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.error(f"Cannot resume from checkpoint {path}: {e}")
+                return False
+            
+            if self.checkpoint is None:
+                self.logger.warning(f"No checkpoint at {path} - starting from the beginning")
+            else:
+                self.logger.info(
+                    f"Resuming: {self.checkpoint.units_done()} input units finished, "
+                    f"{len(self.checkpoint.cracked)} targets cracked"
+                )
+                
+                # Frozen copy for queueing; the live checkpoint grows as tasks finish
+                self.finished = copy.deepcopy(self.checkpoint)
+        
+        if self.checkpoint is None:
+            self.checkpoint = Checkpoint(path, fingerprint, interval)
+        
+        return True
+    
+    def load_potfile(self) -> bool:
+        """
+        Load the potfile named by `output.potfile_path`, unless one was given.
+        
+        Returns:
+            True if the potfile is usable or disabled, False otherwise
+        """
+        path = self.config['output'].get('potfile_path', '')
+        
+        if self.potfile is not None or not path:
+            return True
+        
+        try:
+            self.potfile = Potfile.load(path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error(f"Cannot read potfile {path}: {e}")
+            return False
+        
+        self.logger.info(f"Loaded {len(self.potfile)} cracked hashes from potfile {path}")
+        return True
+    
+    def apply_potfile(self, targets: TargetSet) -> TargetSet:
+        """
+        Take targets cracked by earlier runs from the potfile.
         
         Args:
-            target_hash: Hash to search for
+            targets: Targets of the run
+        
+        Returns:
+            Targets that were never cracked
         """
-        self.logger.info(f"Creating {self.worker_count} worker processes...")
+        if self.potfile is None or not targets:
+            return targets
+        
+        self.pot_cracked = self.potfile.cracked(targets, self.config)
         
-        for i in range(self.worker_count):
-            worker = Worker(
-                worker_id=i,
-                task_queue=self.task_queue,
-                results_dict=self.results_dict,
-                target_hash=target_hash,
-                config=self.config
+        if self.pot_cracked:
+            self.logger.info(f"Potfile: {len(self.pot_cracked)} of {len(targets)} targets cracked before")
+        
+        return targets.without(record['hash'] for record in self.pot_cracked)
+    
+    def apply_cache(self, targets: TargetSet) -> TargetSet:
+        """
+        Answer targets from the result cache.
+        
+        Cached matches become results of this run, and targets a complete
+        earlier run over the same in-memory candidates did not find are
+        not searched again.
+        
+        Args:
+            targets: Targets not answered yet
+        
+        Returns:
+            Targets that still have to be searched
+        """
+        if self.cache is None or not targets:
+            return targets
+        
+        if self.source is None:
+            try:
+                self.fingerprint = ResultCache.fingerprint_of(self.config, self.candidates)
+            except (OSError, UnicodeEncodeError) as e:
+                self.logger.warning(f"Cannot fingerprint candidates for the result cache: {e}")
+        
+        self.cached, self.cached_absent = self.cache.lookup(self.config, targets, self.fingerprint)
+        
+        if self.cached or self.cached_absent:
+            self.logger.info(
+                f"Result cache: {len(self.cached)} targets cracked before, "
+                f"{len(self.cached_absent)} known to be absent from this input"
             )
-            self.workers.append(worker)
         
-        self.logger.info(f"Created {len(self.workers)} workers")
+        return targets.without([record['hash'] for record in self.cached] + self.cached_absent)
+    
+    def store_in_cache(self, searched: TargetSet, results: List[Dict[str, Any]]) -> None:
+        """
+        Cache the matches of this run and the searched targets it did not find.
+        
+        Args:
+            searched: Targets the job searched for
+            results: Matches found by the job
+        """
+        if self.cache is None:
+            return
+        
+        found = {record['hash'] for record in results}
+        absent = [
+            (algorithm, digest.hex())
+            for algorithm, digests in searched.by_algorithm.items()
+            for digest in digests if digest.hex() not in found
+        ]
+        
+        self.cache.store(self.config, results, absent, self.fingerprint)
+        
+        try:
+            self.cache.save()
+        except OSError as e:
+            self.logger.warning(f"Could not write result cache {self.cache.path}: {e}")
+    
+    def store_in_potfile(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Append the matches of this run to the potfile.
+        
+        Args:
+            results: Matches found by the job
+        """
+        if self.potfile is None:
+            return
+        
+        try:
+            added = self.potfile.add(results)
+        except OSError as e:
+            self.logger.warning(f"Could not append to potfile {self.potfile.path}: {e}")
+            return
+        
+        if added:
+            self.logger.info(f"Added {added} cracked hashes to potfile {self.potfile.path}")
     
-    def start_workers(self) -> None:
-        """Start all worker processes."""
-        self.logger.info("Starting worker processes...")
+    def create_workers(self, targets: TargetSet) -> None:
+        """
+        Register the job of this run and start a private pool if needed.
+        
+        A private pool is started after the job is registered, so its
+        workers inherit the job at fork instead of receiving it by message.
+        
+        Args:
+            targets: Target hashes to search for
+        """
+        if self.owns_pool:
+            self.logger.info(f"Creating {self.worker_count} worker processes...")
+            self.pool = WorkerPool(self.config, self.worker_count)
         
-        for worker in self.workers:
-            worker.start()
+        self.job = self.pool.create_job(self.config, targets, self.source)
         
-        self.logger.info(f"Started {len(self.workers)} workers")
+        if self.config['general'].get('adaptive_chunk_ms'):
+            if isinstance(self.source, FileRangeSource):
+                unit_size = self.source.shard_bytes
+            else:
+                unit_size = self.config['general']['chunk_size']
+            
+            self.sizer = ChunkSizer.from_config(self.config, unit_size)
+            self.job.sizer = self.sizer
+        
+        if self.checkpoint is not None:
+            self.job.checkpoint = self.checkpoint
+            
+            # Targets cracked before the interruption count as found
+            for i, record in enumerate(list(self.checkpoint.cracked.values()), 1):
+                if bytes.fromhex(record['hash']) not in targets:
+                    continue  # answered by the potfile or result cache
+                
+                if self.job.record_match(f"match_checkpoint_{i}", record):
+                    self.job.stopped = True
+        
+        if self.owns_pool:
+            self.pool.start()
+        else:
+            self.logger.info(f"Submitted job {self.job.job_id} to shared worker pool")
     
     def load_data_to_queue(self) -> int:
         """
-        Load CSV data into task queue.
+        Stream CSV data into task queue.
+        
+        The queue is bounded, so reading stays at most `queue_size` chunks
+        ahead of the workers. With a range source only (start, end)
+        tuples are queued and workers read the candidates themselves.
+        Loading stops as soon as every target of the job is cracked;
+        workers then skip whatever is still queued. Input finished in a
+        checkpointed earlier run is not queued again. In adaptive mode
+        every chunk gets the size the ChunkSizer currently suggests.
         
         Returns:
             Number of chunks loaded
@@ -120,21 +409,57 @@ class HashCrackingPipeline:
         self.logger.info("Loading data into task queue...")
         
         chunk_count = 0
+        chunk_size = self.sizer.size if self.sizer is not None else None
+        
+        if self.source is not None:
+            tasks = ((task, None) for task in self._range_tasks(chunk_size))
+        else:
+            done = self.finished.is_done if self.finished is not None else None
+            tasks = ((chunk, span) for span, chunk in self.receiver.read_spans(chunk_size, done))
         
-        for chunk in self.receiver.read_chunks():
-            self.task_queue.put(chunk)
+        for task, span in tasks:
+            if self.job.stopped:
+                self.logger.info("All targets cracked - stopping early")
+                break
+            
+            self.pool.put_task(self.job, task, span)
             chunk_count += 1
         
+        self.pool.finish(self.job)
+        
         self.logger.info(f"Loaded {chunk_count} chunks into queue")
         
         return chunk_count
     
+    def _range_tasks(self, chunk_size: Optional[Callable[[], int]]) -> Iterator[tuple]:
+        """
+        Split the unfinished parts of the range source into tasks.
+        
+        Args:
+            chunk_size: Callable returning the next size, or None for the
+                source's static size
+        
+        Yields:
+            (start, end) range tasks
+        """
+        bounds = self.source.bounds()
+        
+        if self.finished is not None:
+            spans = list(self.finished.remaining(*bounds))
+        else:
+            spans = [bounds]
+        
+        for span in spans:
+            yield from self.source.ranges(chunk_size, span)
+    
     def wait_for_workers(self) -> None:
-        """Wait for all workers to complete."""
+        """Wait for the job to complete and shut down a private pool."""
         self.logger.info("Waiting for workers to complete...")
         
-        for worker in self.workers:
-            worker.join()
+        self.job.wait()
+        
+        if self.owns_pool:
+            self.pool.shutdown(self.config['general'].get('worker_timeout', 5))
         
         self.logger.info("All workers completed")
     
@@ -156,35 +481,81 @@ class HashCrackingPipeline:
             
             self.total_timer.start()
             
-            target_hash = self.config.get('target', {}).get('hash_to_find', '')
+            searched = self.apply_cache(self.apply_potfile(self.targets))
             
-            self.create_workers(target_hash)
+            known = {f"match_potfile_{i}": record for i, record in enumerate(self.pot_cracked, 1)}
+            known.update((f"match_cache_{i}", record) for i, record in enumerate(self.cached, 1))
             
-            self.start_workers()
+            if self.targets and not searched:
+                self.logger.info("Every target was answered before - skipping the run")
+                
+                if self.checkpoint is not None:
+                    self.checkpoint.remove()
+                
+                self.collector = Collector(known, self.config, self.targets)
+                self.collector.run()
+                
+                self.results = Collector.collect_results(known)
+                self.total_time = self.total_timer.stop()
+                Collector.print_results(self.results, self.logger, self.targets)
+                return True
             
-            chunks_loaded = self.load_data_to_queue()
+            self.create_workers(searched)
             
-            self.task_queue.send_poison_pills(self.worker_count)
+            chunks_loaded = self.load_data_to_queue()
             
             self.wait_for_workers()
             
-            self.collector = Collector(self.results_dict, self.config)
-            self.collector.start()
-            self.collector.join()
+            # A completed run has nothing left to resume
+            if self.checkpoint is not None:
+                self.checkpoint.remove()
+            
+            found = Collector.collect_results(self.job.results)
+            self.store_in_cache(searched, found)
+            self.store_in_potfile(found)
+            
+            results_dict = {**self.job.results, **known} if known else self.job.results
+            
+            # Results are saved in-process on a shared pool to avoid a spawn per job
+            self.collector = Collector(results_dict, self.config, self.targets)
+            if self.owns_pool:
+                self.collector.start()
+                self.collector.join()
+            else:
+                self.collector.run()
             
             total_time = self.total_timer.stop()
             
-            results = Collector.collect_results(self.results_dict)
+            results = Collector.collect_results(results_dict)
+            self.results = results
+            self.total_time = total_time
             
-            Collector.print_results(results, self.logger)
+            Collector.print_results(results, self.logger, self.targets)
             
-            stats = self.receiver.get_statistics()
+            worker_stats = Collector.collect_worker_stats(results_dict)
+            items_processed = sum(stats['items_processed'] for stats in worker_stats)
             self.logger.log_pipeline_stats(
                 total_time,
-                stats['valid_lines'],
+                items_processed,
                 len(results)
             )
             
+            if self.sizer is not None:
+                sizing = self.sizer.get_statistics()
+                self.logger.info(
+                    f"Adaptive chunk size: final {sizing['final_size']} "
+                    f"(range {sizing['smallest_size']}-{sizing['largest_size']}, "
+                    f"{sizing['adjustments']} adjustments, target {sizing['target_ms']:.0f} ms)"
+                )
+            
+            # Cumulative over every run on a shared pool
+            queue_stats = self.pool.task_queue.get_statistics()
+            self.logger.info(
+                f"Task queue: peak depth {queue_stats['peak_size']}/{queue_stats['maxsize'] or 'unbounded'}, "
+                f"producer stalled {queue_stats['producer_stalls']} times "
+                f"({queue_stats['producer_stall_seconds']:.2f}s)"
+            )
+            
             self.logger.info("="*60)
             self.logger.info("Pipeline completed successfully")
             self.logger.info("="*60)
@@ -201,36 +572,160 @@ class HashCrackingPipeline:
             self._cleanup()
             return False
     
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics of the last run.
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'records': self.receiver.valid_lines,
+            'items_processed': self.job.items_processed if self.job is not None else 0,
+            'matches_found': len(self.results),
+            'potfile_matches': len(self.pot_cracked),
+            'cached_matches': len(self.cached),
+            'cached_absent': len(self.cached_absent),
+            'total_time': self.total_time
+        }
+    
+    def build_index(self, index_path: str) -> bool:
+        """
+        Hash the configured input once into a lookup index.
+        
+        Args:
+            index_path: Output index path
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        self.logger.info(f"Building hash index {index_path}...")
+        
+        if self.source is not None:
+            if not self.source.validate():
+                return False
+        elif not self.receiver.validate_file():
+            return False
+        
+        timer = Timer()
+        timer.start()
+        
+        try:
+            entries = HashIndex.build(self.config, index_path)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error building index: {e}")
+            return False
+        
+        total_time = timer.stop()
+        self.logger.info(f"Indexed {entries} candidates in {Timer.format_time(total_time)}")
+        
+        return True
+    
+    def lookup_index(self, index_path: str) -> bool:
+        """
+        Resolve the target hashes through a prebuilt index.
+        
+        No workers are started; results are saved and printed as for a
+        normal run.
+        
+        Args:
+            index_path: Index built with build_index()
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.load_targets():
+            return False
+        
+        if not self.targets:
+            self.logger.error("No target hashes to look up")
+            return False
+        
+        timer = Timer()
+        timer.start()
+        
+        try:
+            with HashIndex(index_path, self.config) as index:
+                results = index.lookup_targets(self.targets)
+                collisions = index.collisions
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error reading index: {e}")
+            return False
+        
+        total_time = timer.stop()
+        
+        results_dict = {f"match_index_{i}": result for i, result in enumerate(results, 1)}
+        
+        self.collector = Collector(results_dict, self.config, self.targets)
+        self.collector.run()
+        
+        Collector.print_results(Collector.collect_results(results_dict), self.logger, self.targets)
+        self.logger.info(
+            f"Looked up {len(self.targets)} targets in {Timer.format_time(total_time)} "
+            f"({collisions} prefix collisions)"
+        )
+        
+        return True
+    
     def _cleanup(self) -> None:
         """Cleanup resources and terminate workers."""
         self.logger.info("Cleaning up...")
         
-        terminated_count = 0
-        for worker in self.workers:
-            if worker.is_alive():
-                worker.terminate()
-                worker.join(timeout=5)
-                terminated_count += 1
+        # A shared pool outlives this run; only this run's job is cancelled
+        if not self.owns_pool and self.job is not None:
+            self.pool.cancel(self.job)
+            
+            # This run is the job's producer, so it has to finish the job
+            if self.job.tasks_total is None:
+                self.pool.finish(self.job)
         
-        if terminated_count > 0:
-            self.logger.info(f"Terminated {terminated_count} worker(s)")
+        if self.owns_pool and self.pool is not None:
+            terminated_count = self.pool.terminate()
+            
+            if terminated_count > 0:
+                self.logger.info(f"Terminated {terminated_count} worker(s)")
         
-        if self.collector and self.collector.is_alive():
+        if self.collector and self.collector.pid is not None and self.collector.is_alive():
             self.collector.terminate()
             self.collector.join(timeout=5)
             self.logger.info("Terminated collector process")
+        
+        # Matches of an interrupted run are kept as well
+        if self.job is not None:
+            self.store_in_potfile(Collector.collect_results(self.job.results))
+        
+        if self.job is not None and self.checkpoint is not None and not self.job.done.is_set():
+            try:
+                self.job.save_checkpoint()
+                self.logger.info(f"Progress saved to {self.checkpoint.path} - rerun with --resume")
+            except OSError as e:
+                self.logger.error(f"Could not save checkpoint: {e}")
 
 
 def main():
     """Main entry point."""
-    config_path = "config.json"
+    parser = argparse.ArgumentParser(description="Parallel Hash Cracking Engine")
+    parser.add_argument('config', nargs='?', default='config.json',
+                        help="Path to configuration file")
+    
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--build-index', metavar='INDEX',
+                      help="Hash the configured input into a lookup index and exit")
+    mode.add_argument('--lookup', metavar='INDEX',
+                      help="Resolve target hashes through an index instead of cracking")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip input finished by an interrupted run (needs output.checkpoint_path)")
     
-    if len(sys.argv) > 1:
-        config_path = sys.argv[1]
+    args = parser.parse_args()
     
-    pipeline = HashCrackingPipeline(config_path)
+    pipeline = HashCrackingPipeline(args.config, resume=args.resume)
     
-    success = pipeline.run()
+    if args.build_index:
+        success = pipeline.build_index(args.build_index)
+    elif args.lookup:
+        success = pipeline.lookup_index(args.lookup)
+    else:
+        success = pipeline.run()
     
     sys.exit(0 if success else 1)
 
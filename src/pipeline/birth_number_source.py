@@ -0,0 +1,186 @@
+"""
+Parallel Hash Cracking Engine - Birth Number Source Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Keyspace generator for Czech birth numbers (rodné číslo)
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Any, Iterator, List, Tuple
+from src.pipeline.logger import Logger
+from src.pipeline.source import CandidateSource
+
+
+class BirthNumberSource(CandidateSource):
+    """
+    Enumerates valid birth numbers for a date range without any file I/O.
+    
+    The keyspace is addressed by index:
+        index = (day * 2 + sex) * 1000 + serial
+    
+    where day counts from `birth_date_from`, sex 1 adds the +50 female
+    month offset and serial is the 3-digit suffix. Dates before 1954 give
+    9-digit numbers; later dates get a check digit so the 10-digit number
+    is divisible by 11 (serials where no digit works are skipped, as
+    Validator.is_valid_birth_number rejects them).
+    """
+    
+    binary = True
+    
+    SERIALS = 1000
+    FIRST_CHECKED_YEAR = 1954
+    MIN_DATE = date(1900, 1, 1)
+    MAX_DATE = date(2053, 12, 31)
+    
+    _SERIAL_BYTES: List[bytes] = [f"{i:03d}".encode('ascii') for i in range(1000)]
+    _DIGIT_BYTES: List[bytes] = [str(i).encode('ascii') for i in range(10)]
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        
+        self.date_from = config['input'].get('birth_date_from', '1954-01-01')
+        self.date_to = config['input'].get('birth_date_to', '2004-12-31')
+        self.separator = config['input'].get('birth_number_separator', '')
+        self._separator_bytes = self.separator.encode('ascii')
+    
+    def validate(self) -> bool:
+        """
+        Check that the configured date range is usable.
+        
+        Returns:
+            True if valid, False otherwise
+        """
+        logger = Logger.get_instance()
+        
+        try:
+            start, end = self._dates()
+        except ValueError as e:
+            logger.error(f"Invalid birth number date range: {e}")
+            return False
+        
+        if start > end:
+            logger.error("birth_date_from must not be after birth_date_to")
+            return False
+        
+        if start < self.MIN_DATE or end > self.MAX_DATE:
+            logger.error(f"Birth number dates must be between {self.MIN_DATE} and {self.MAX_DATE}")
+            return False
+        
+        if not self.separator.isascii():
+            logger.error("birth_number_separator must be ASCII")
+            return False
+        
+        return True
+    
+    def _dates(self) -> tuple:
+        """Parse configured date range."""
+        return date.fromisoformat(self.date_from), date.fromisoformat(self.date_to)
+    
+    def days(self) -> int:
+        """
+        Get number of days in the date range.
+        
+        Returns:
+            Day count (inclusive)
+        """
+        start, end = self._dates()
+        return (end - start).days + 1
+    
+    def total(self) -> int:
+        """Get keyspace size (days x sexes x serials)."""
+        return self.days() * 2 * self.SERIALS
+    
+    def _prefix(self, block: int) -> tuple:
+        """
+        Build the date part of a block.
+        
+        Args:
+            block: day * 2 + sex
+        
+        Returns:
+            Tuple of (prefix bytes, prefix value, has check digit)
+        """
+        day, sex = divmod(block, 2)
+        birth_date = self._dates()[0] + timedelta(days=day)
+        month = birth_date.month + (50 if sex else 0)
+        
+        digits = f"{birth_date.year % 100:02d}{month:02d}{birth_date.day:02d}"
+        checked = birth_date.year >= self.FIRST_CHECKED_YEAR
+        
+        return digits.encode('ascii') + self._separator_bytes, int(digits), checked
+    
+    def candidates(self, start: int, end: int) -> Iterator[bytes]:
+        """
+        Generate birth numbers of an index range.
+        
+        Args:
+            start: Start index (inclusive)
+            end: End index (exclusive)
+        
+        Yields:
+            Birth numbers as ASCII bytes
+        """
+        serial_bytes = self._SERIAL_BYTES
+        digit_bytes = self._DIGIT_BYTES
+        
+        block, serial = divmod(start, self.SERIALS)
+        index = start
+        
+        while index < end:
+            prefix, value, checked = self._prefix(block)
+            stop = min(self.SERIALS, serial + end - index)
+            
+            if checked:
+                base = (value % 11) * self.SERIALS
+                for s in range(serial, stop):
+                    check = (base + s) % 11
+                    if check != 10:
+                        yield prefix + serial_bytes[s] + digit_bytes[check]
+            else:
+                for s in range(serial, stop):
+                    yield prefix + serial_bytes[s]
+            
+            index += stop - serial
+            block += 1
+            serial = 0
+    
+    def indexed(self, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+        """
+        Generate birth numbers of an index range with their index.
+        
+        Serials without a valid check digit are skipped, so indexes are
+        not contiguous; candidates(index, index + 1) reproduces any
+        yielded number.
+        
+        Args:
+            start: Start index (inclusive)
+            end: End index (exclusive)
+        
+        Yields:
+            Tuples of (index, birth number bytes)
+        """
+        serial_bytes = self._SERIAL_BYTES
+        digit_bytes = self._DIGIT_BYTES
+        
+        block, serial = divmod(start, self.SERIALS)
+        index = start
+        
+        while index < end:
+            prefix, value, checked = self._prefix(block)
+            stop = min(self.SERIALS, serial + end - index)
+            base_index = block * self.SERIALS
+            
+            if checked:
+                base = (value % 11) * self.SERIALS
+                for s in range(serial, stop):
+                    check = (base + s) % 11
+                    if check != 10:
+                        yield base_index + s, prefix + serial_bytes[s] + digit_bytes[check]
+            else:
+                for s in range(serial, stop):
+                    yield base_index + s, prefix + serial_bytes[s]
+            
+            index += stop - serial
+            block += 1
+            serial = 0
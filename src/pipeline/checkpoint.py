@@ -0,0 +1,238 @@
+"""
+Parallel Hash Cracking Engine - Checkpoint Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Periodic progress checkpoint used to resume interrupted runs
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from src.pipeline.logger import Logger
+from src.pipeline.target_set import TargetSet
+
+
+class Checkpoint:
+    """
+    Compact record of the progress of one run.
+    
+    Finished work is kept as merged [start, end) intervals in input
+    units: record positions for CSV input, byte offsets for sharded and
+    wordlist input, indexes for generated keyspaces. Chunks finish roughly
+    in order, so millions of them collapse into a handful of intervals,
+    and the intervals do not depend on how the input was chunked.
+    Together with the cracked target records and a fingerprint of the
+    input, hash settings and targets, this is enough to skip finished
+    work on resume.
+    
+    The file is rewritten atomically (temporary file + rename) at most
+    once per `interval` seconds from the result drain thread, so workers
+    never wait on checkpoint I/O.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, path: str, fingerprint: str, interval: float = 30.0):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.interval = interval
+        
+        self.completed: List[List[int]] = []
+        self.cracked: Dict[str, Dict[str, Any]] = {}
+        self.saves = 0
+        self._last_save = time.monotonic()
+    
+    @staticmethod
+    def fingerprint_of(config: Dict[str, Any], targets: TargetSet) -> str:
+        """
+        Fingerprint the settings that define the input units and targets.
+        
+        Args:
+            config: Configuration dictionary
+            targets: Target hashes of the run
+        
+        Returns:
+            Hex SHA256 fingerprint
+        """
+        csv_path = config['input'].get('csv_path', '')
+        
+        spec = {
+            'input': config['input'],
+            'hash': config['hash'],
+            'input_size': os.path.getsize(csv_path) if os.path.isfile(csv_path) else None,
+            'targets': targets.to_hex()
+        }
+        
+        data = json.dumps(spec, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(data).hexdigest()
+    
+    @classmethod
+    def load(cls, path: str, fingerprint: str, interval: float = 30.0) -> Optional['Checkpoint']:
+        """
+        Load a checkpoint written for the same run.
+        
+        Args:
+            path: Checkpoint path
+            fingerprint: Fingerprint of the current run
+            interval: Minimum seconds between two saves
+        
+        Returns:
+            Loaded checkpoint, or None if missing
+        
+        Raises:
+            ValueError: If the checkpoint belongs to a different run
+        """
+        if not os.path.isfile(path):
+            return None
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if data.get('version') != cls.VERSION or data.get('fingerprint') != fingerprint:
+            raise ValueError("Checkpoint was written for a different input, algorithm or target set")
+        
+        checkpoint = cls(path, fingerprint, interval)
+        checkpoint.completed = [list(span) for span in data['completed']]
+        checkpoint.cracked = {record['hash']: record for record in data['cracked']}
+        
+        return checkpoint
+    
+    def mark_done(self, start: int, end: int) -> None:
+        """
+        Record a finished span, merging it into the interval list.
+        
+        Args:
+            start: First unit of the span (inclusive)
+            end: End of the span (exclusive)
+        """
+        completed = self.completed
+        i = bisect.bisect_right(completed, [start, float('inf')])
+        
+        # Merge with the interval starting at or before the span if they touch
+        if i > 0 and completed[i - 1][1] >= start:
+            i -= 1
+        
+        j = i
+        while j < len(completed) and completed[j][0] <= end:
+            j += 1
+        
+        if j > i:
+            start = min(start, completed[i][0])
+            end = max(end, completed[j - 1][1])
+        
+        completed[i:j] = [[start, end]]
+    
+    def is_done(self, position: int) -> bool:
+        """
+        Check whether a unit was finished in an earlier run.
+        
+        Args:
+            position: Record position, byte offset or keyspace index
+        
+        Returns:
+            True if the unit can be skipped
+        """
+        i = bisect.bisect_right(self.completed, [position, float('inf')])
+        return i > 0 and self.completed[i - 1][1] > position
+    
+    def remaining(self, start: int, end: int) -> Iterator[Tuple[int, int]]:
+        """
+        Get the parts of a span that are not finished yet.
+        
+        Args:
+            start: Span start (inclusive)
+            end: Span end (exclusive)
+        
+        Yields:
+            Unfinished (start, end) sub-spans in order
+        """
+        i = max(bisect.bisect_right(self.completed, [start, float('inf')]) - 1, 0)
+        position = start
+        
+        for done_start, done_end in self.completed[i:]:
+            if done_start >= end:
+                break
+            
+            if done_end <= position:
+                continue
+            
+            if done_start > position:
+                yield (position, done_start)
+            
+            position = done_end
+        
+        if position < end:
+            yield (position, end)
+    
+    def units_done(self) -> int:
+        """Get the number of finished units."""
+        return sum(end - start for start, end in self.completed)
+    
+    def add_match(self, record: Dict[str, Any]) -> None:
+        """
+        Record a cracked target.
+        
+        Args:
+            record: Match record as produced by a worker
+        """
+        self.cracked[record['hash']] = {
+            'original': record['original'],
+            'hash': record['hash'],
+            'algorithm': record['algorithm']
+        }
+    
+    def maybe_save(self) -> bool:
+        """
+        Save if at least `interval` seconds passed since the last save.
+        
+        A failed write is logged and retried at the next interval; it
+        must not break result handling of the running job.
+        
+        Returns:
+            True if the checkpoint was written
+        """
+        if time.monotonic() - self._last_save < self.interval:
+            return False
+        
+        try:
+            self.save()
+        except OSError as e:
+            Logger.get_instance().warning(f"Could not write checkpoint {self.path}: {e}")
+            self._last_save = time.monotonic()
+            return False
+        
+        return True
+    
+    def save(self) -> None:
+        """Write the checkpoint atomically."""
+        data = {
+            'version': self.VERSION,
+            'fingerprint': self.fingerprint,
+            'completed': self.completed,
+            'cracked': list(self.cracked.values())
+        }
+        
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        
+        self.saves += 1
+        self._last_save = time.monotonic()
+    
+    def remove(self) -> None:
+        """Delete the checkpoint file after a completed run."""
+        if os.path.isfile(self.path):
+            os.remove(self.path)
@@ -0,0 +1,203 @@
+"""
+Parallel Hash Cracking Engine - Chunk Arena Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Shared-memory transport of candidate chunks with recycled blocks
+"""
+
+from array import array
+from itertools import accumulate
+from typing import Dict, Any, Iterator, List
+from src.pipeline.logger import Logger
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    resource_tracker = shared_memory = None
+
+
+class SharedChunk:
+    """Queued reference to a chunk packed into a shared memory block."""
+    
+    __slots__ = ('name', 'count')
+    
+    def __init__(self, name: str, count: int):
+        self.name = name
+        self.count = count
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class ChunkArena:
+    """
+    Candidate chunks packed into recycled shared memory blocks.
+    
+    The parent encodes a chunk once into a block laid out as
+        
+        [count + 1 uint32 offsets][UTF-8 bytes of all items]
+    
+    and queues only a SharedChunk (block name, item count). A worker
+    attaches the block by name once and takes the items as bytes slices
+    of the data area, so no list of strings is pickled in the parent or
+    rebuilt in the child, and the hasher skips str encoding. The data
+    area is copied out in one memcpy: slicing that copy is cheaper than
+    creating a memoryview object per item, and the items never pin the
+    shared block.
+    
+    Blocks are returned to a free list when the task is acknowledged
+    and reused for later chunks of any job. A chunk that fits no free
+    block gets a new block of at least `block_bytes`, so the number of
+    blocks settles at the number of chunks in flight, which the bounded
+    task queue already limits.
+    
+    `AVAILABLE` is False on Pythons without multiprocessing.shared_memory;
+    the pool then sends chunks pickled as before.
+    """
+    
+    AVAILABLE = shared_memory is not None
+    
+    def __init__(self, block_bytes: int = 262144):
+        self.block_bytes = block_bytes
+        
+        # Workers forked afterwards register attached blocks with the
+        # parent's tracker instead of starting their own, which would
+        # report the blocks as leaked when a worker exits
+        resource_tracker.ensure_running()
+        
+        # Parent side: every block created, and those not leased
+        self.blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self.free: List[shared_memory.SharedMemory] = []
+        self.chunks_packed = 0
+        self.blocks_reused = 0
+        self.items_skipped = 0
+        
+        # Worker side: blocks attached by name
+        self._attached: Dict[str, shared_memory.SharedMemory] = {}
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers attach blocks by name; parent handles are not sent
+        return {'block_bytes': self.block_bytes}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['block_bytes'])
+    
+    def pack(self, items: List[str]) -> SharedChunk:
+        """
+        Encode a chunk into a free block (parent side).
+        
+        An item that cannot be encoded as UTF-8 (a lone surrogate from a
+        JSON submission) is logged and left out, as a worker skips an
+        item it cannot hash.
+        
+        Args:
+            items: Candidate strings
+        
+        Returns:
+            SharedChunk to queue instead of the list
+        """
+        encoded = []
+        
+        for item in items:
+            try:
+                encoded.append(item.encode('utf-8'))
+            except UnicodeEncodeError as e:
+                self.items_skipped += 1
+                Logger.get_instance().error(f"Skipping candidate {item!r}: {e}")
+        
+        offsets = array('I', [0])
+        offsets.extend(accumulate(map(len, encoded)))
+        
+        header = offsets.itemsize * len(offsets)
+        size = header + offsets[-1]
+        block = self._lease(size)
+        
+        block.buf[:header] = offsets.tobytes()
+        block.buf[header:size] = b''.join(encoded)
+        self.chunks_packed += 1
+        
+        return SharedChunk(block.name, len(encoded))
+    
+    def _lease(self, size: int) -> 'shared_memory.SharedMemory':
+        """Take the smallest free block that fits, or create one."""
+        fitting = [block for block in self.free if block.size >= size]
+        
+        if fitting:
+            block = min(fitting, key=lambda b: b.size)
+            self.free.remove(block)
+            self.blocks_reused += 1
+            return block
+        
+        block = shared_memory.SharedMemory(create=True, size=max(size, self.block_bytes))
+        self.blocks[block.name] = block
+        return block
+    
+    def release(self, name: str) -> None:
+        """
+        Return the block of an acknowledged chunk to the free list (parent side).
+        
+        Args:
+            name: Block name of the SharedChunk
+        """
+        block = self.blocks.get(name)
+        if block is not None:
+            self.free.append(block)
+    
+    def items(self, chunk: SharedChunk) -> Iterator[bytes]:
+        """
+        Iterate the items of a packed chunk as bytes (worker side).
+        
+        Args:
+            chunk: Queued chunk reference
+        
+        Yields:
+            One bytes item per candidate
+        """
+        block = self._attached.get(chunk.name)
+        if block is None:
+            block = shared_memory.SharedMemory(name=chunk.name)
+            self._attached[chunk.name] = block
+        
+        header = 4 * (chunk.count + 1)
+        
+        with block.buf[:header] as raw, raw.cast('I') as view:
+            offsets = view.tolist()
+        
+        with block.buf[header:header + offsets[-1]] as view:
+            data = bytes(view)
+        
+        for start, end in zip(offsets, offsets[1:]):
+            yield data[start:end]
+    
+    def detach(self) -> None:
+        """Close the blocks a worker attached; the parent owns them."""
+        for block in self._attached.values():
+            block.close()
+        
+        self._attached.clear()
+    
+    def close(self) -> None:
+        """Remove every block (parent side, after the workers exited)."""
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        
+        self.blocks.clear()
+        self.free.clear()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get arena statistics (parent side).
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'blocks': len(self.blocks),
+            'bytes': sum(block.size for block in self.blocks.values()),
+            'free_blocks': len(self.free),
+            'chunks_packed': self.chunks_packed,
+            'blocks_reused': self.blocks_reused,
+            'items_skipped': self.items_skipped
+        }
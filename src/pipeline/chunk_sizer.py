@@ -0,0 +1,123 @@
+"""
+Parallel Hash Cracking Engine - Chunk Sizer Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Adaptive chunk size tuned from measured per-chunk worker time
+"""
+
+import threading
+from typing import Dict, Any
+
+
+class ChunkSizer:
+    """
+    Picks chunk sizes that take about `target_seconds` to process.
+    
+    Workers report the wall time of every task; the sizer keeps a moving
+    average of the time per range unit (record, byte or keyspace index)
+    and sizes the next chunk as target / time per unit. A fixed size is
+    either far too large for slow algorithms (PBKDF2 chunks of minutes
+    leave stragglers at the end of a run) or too small for fast ones
+    (IPC dominates SHA256 on short words).
+    
+    Sizing starts at `min_size` so the first measurements arrive quickly,
+    grows at most `max_growth` times per measurement and shrinks at once.
+    """
+    
+    def __init__(self, target_seconds: float = 0.2, min_size: int = 1,
+                 max_size: int = 1000000, max_growth: float = 4.0, smoothing: float = 0.3):
+        if min_size < 1 or max_size < min_size:
+            raise ValueError("Chunk size bounds must satisfy 1 <= min_size <= max_size")
+        
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_growth = max_growth
+        self.smoothing = smoothing
+        
+        self.current = min_size
+        self.smallest = min_size
+        self.largest = min_size
+        self.adjustments = 0
+        self.measurements = 0
+        self._seconds_per_unit = 0.0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], unit_size: int) -> 'ChunkSizer':
+        """
+        Create a sizer from the `general` config section.
+        
+        Args:
+            config: Configuration dictionary
+            unit_size: Static chunk size of the input, the default upper
+                bound is 100 times this
+        
+        Returns:
+            ChunkSizer instance
+        """
+        general = config['general']
+        
+        return cls(
+            target_seconds=general['adaptive_chunk_ms'] / 1000,
+            min_size=general.get('min_chunk_size', 1),
+            max_size=general.get('max_chunk_size', unit_size * 100)
+        )
+    
+    def size(self) -> int:
+        """
+        Get the size of the next chunk.
+        
+        Returns:
+            Chunk size in range units
+        """
+        return self.current
+    
+    def observe(self, units: int, seconds: float) -> None:
+        """
+        Account for a processed chunk and retune the size.
+        
+        Args:
+            units: Range units the chunk covered
+            seconds: Worker wall time spent on the chunk
+        """
+        if units <= 0 or seconds <= 0:
+            return
+        
+        with self._lock:
+            rate = seconds / units
+            
+            if self.measurements == 0:
+                self._seconds_per_unit = rate
+            else:
+                self._seconds_per_unit += self.smoothing * (rate - self._seconds_per_unit)
+            
+            self.measurements += 1
+            
+            wanted = int(self.target_seconds / self._seconds_per_unit)
+            wanted = min(wanted, int(self.current * self.max_growth))
+            wanted = max(self.min_size, min(wanted, self.max_size))
+            
+            if wanted != self.current:
+                self.current = wanted
+                self.adjustments += 1
+                self.smallest = min(self.smallest, wanted)
+                self.largest = max(self.largest, wanted)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get sizing statistics.
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'target_ms': self.target_seconds * 1000,
+            'final_size': self.current,
+            'smallest_size': self.smallest,
+            'largest_size': self.largest,
+            'adjustments': self.adjustments,
+            'measurements': self.measurements,
+            'ms_per_unit': self._seconds_per_unit * 1000
+        }
@@ -6,22 +6,25 @@ Date: November 2025
 Description: Collector process for gathering and saving results
 """
 
-from multiprocessing import Process, Manager
-from typing import Dict, Any, List
+from multiprocessing import Process
+from typing import Dict, Any, List, Optional
 import json
 import os
 from src.pipeline.logger import Logger
+from src.pipeline.target_set import TargetSet
 from src.utils.timer import Timer
 
 
 class Collector(Process):
     """Collector process for gathering and saving results."""
     
-    def __init__(self, results_dict: dict, config: Dict[str, Any]):
+    def __init__(self, results_dict: dict, config: Dict[str, Any],
+                 targets: Optional[TargetSet] = None):
         super().__init__()
         
         self.results_dict = results_dict
         self.config = config
+        self.targets = targets
         self.results_path = config['output']['results_path']
         self.check_interval = config['general'].get('collector_check_interval', 2)
     
@@ -42,26 +45,39 @@ class Collector(Process):
         """
         Save results to JSON file.
         
+        The file is written under a temporary name and renamed over the
+        old one, so a reader never sees it half written. An empty
+        results_path saves nothing.
+        
         Args:
             logger: Logger instance
         """
+        if not self.results_path:
+            return
+        
         try:
-            os.makedirs(os.path.dirname(self.results_path), exist_ok=True)
-            
-            results_list = []
+            os.makedirs(os.path.dirname(self.results_path) or '.', exist_ok=True)
             
-            for key, value in self.results_dict.items():
-                if isinstance(value, dict):
-                    results_list.append(value)
+            results_list = Collector.collect_results(self.results_dict)
             
             output_data = {
                 'total_matches': len(results_list),
                 'matches': results_list
             }
             
-            with open(self.results_path, 'w', encoding='utf-8') as f:
+            if self.targets:
+                uncracked = Collector.uncracked_targets(results_list, self.targets)
+                output_data['total_targets'] = len(self.targets)
+                output_data['cracked_targets'] = len(self.targets) - len(uncracked)
+                output_data['uncracked'] = uncracked
+            
+            temp_path = f"{self.results_path}.{os.getpid()}.tmp"
+            
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(output_data, f, indent=2, ensure_ascii=False)
             
+            os.replace(temp_path, self.results_path)
+            
             logger.info(f"Saved {len(results_list)} results to {self.results_path}")
         
         except Exception as e:
@@ -73,7 +89,7 @@ class Collector(Process):
         Collect all results from shared dictionary.
         
         Args:
-            results_dict: Shared results dictionary
+            results_dict: Results aggregated from the result channel
         
         Returns:
             List of result dictionaries sorted by worker_id
@@ -90,14 +106,59 @@ class Collector(Process):
         return results
     
     @staticmethod
-    def print_results(results: List[Dict[str, Any]], logger: Logger) -> None:
+    def collect_worker_stats(results_dict: dict) -> List[Dict[str, Any]]:
+        """
+        Collect statistics reported by workers on completion.
+        
+        Args:
+            results_dict: Results aggregated from the result channel
+        
+        Returns:
+            List of worker statistics sorted by worker_id
+        """
+        stats = [
+            value for key, value in results_dict.items()
+            if isinstance(value, dict) and 'items_processed' in value
+        ]
+        
+        stats.sort(key=lambda x: x.get('worker_id', 0))
+        
+        return stats
+    
+    @staticmethod
+    def uncracked_targets(results: List[Dict[str, Any]], targets: TargetSet) -> List[str]:
+        """
+        Get target hashes that no result matched.
+        
+        Args:
+            results: List of result dictionaries
+            targets: Target set that was searched for
+        
+        Returns:
+            Sorted list of uncracked hex hashes
+        """
+        return targets.remaining(result.get('hash', '') for result in results)
+    
+    @staticmethod
+    def print_results(results: List[Dict[str, Any]], logger: Logger,
+                      targets: Optional[TargetSet] = None) -> None:
         """
         Print results to console.
         
         Args:
             results: List of result dictionaries
             logger: Logger instance
+            targets: Optional target set for cracked/uncracked summary
         """
+        if targets:
+            uncracked = Collector.uncracked_targets(results, targets)
+            logger.info(f"Cracked {len(targets) - len(uncracked)}/{len(targets)} targets")
+            
+            if uncracked:
+                logger.info(f"Uncracked targets: {len(uncracked)}")
+                for hash_value in uncracked:
+                    logger.debug(f"  Not found: {hash_value}")
+        
         if not results:
             logger.info("No matches found")
             return
@@ -0,0 +1,172 @@
+"""
+Parallel Hash Cracking Engine - File Range Source Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Byte-range sharded CSV input read directly by workers
+"""
+
+import csv
+import io
+import os
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
+from src.pipeline.source import CandidateSource
+from src.utils.chunker import Chunker
+
+
+class FileRangeSource(CandidateSource):
+    """
+    CSV file split into newline-aligned byte ranges.
+    
+    The parent only computes shard boundaries; each worker seeks to its
+    own range and parses the records there, so only (start, end) offsets
+    cross the TaskQueue. A worker opens the file once, on first use, and
+    keeps it open for every claim and split of the job.
+    """
+    
+    # Range units are bytes
+    units_per_item = 16
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        
+        self.csv_path = config['input']['csv_path']
+        self.encoding = config['input'].get('csv_encoding', 'utf-8')
+        self.delimiter = config['input'].get('csv_delimiter', ',')
+        self.shard_bytes = config['input'].get('shard_bytes', 1024 * 1024)
+        
+        self._handle = None  # per-process, see _reader()
+        self._size = 0
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_handle'] = None
+        return state
+    
+    def close(self) -> None:
+        """Close the file handle of this process."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+    
+    def _reader(self):
+        """Get this process's binary handle on the file, opened on first use."""
+        if self._handle is None:
+            self._handle = open(self.csv_path, 'rb')
+            self._size = os.fstat(self._handle.fileno()).st_size
+        
+        return self._handle
+    
+    def validate(self) -> bool:
+        """Check that the input file exists and is readable."""
+        from src.pipeline.receiver import Receiver
+        return Receiver(self.config).validate_file()
+    
+    def total(self) -> int:
+        """Get file size in bytes."""
+        return os.path.getsize(self.csv_path)
+    
+    def bounds(self) -> Tuple[int, int]:
+        """Get the byte range of the whole file."""
+        return 0, self.total()
+    
+    def ranges(self, chunk_size: Union[int, Callable[[], int], None] = None,
+               span: Optional[Tuple[int, int]] = None) -> Iterator[tuple]:
+        """
+        Split file into byte ranges that start and end on line boundaries.
+        
+        Nominal boundaries come from Chunker.chunk_range and are moved
+        forward to the next newline, so no line is split between shards.
+        A span must itself start and end on line boundaries.
+        
+        Args:
+            chunk_size: Range size in bytes, or a callable returning the
+                size of the next range; defaults to `input.shard_bytes`
+            span: (start, end) byte offsets to split; defaults to the whole file
+        
+        Yields:
+            Tuples of (start, end) byte offsets
+        """
+        size = self.total()
+        start, span_end = span or (0, size)
+        
+        with open(self.csv_path, 'rb') as f:
+            for _, nominal_end in Chunker.chunk_range(start, span_end, chunk_size or self.shard_bytes):
+                if nominal_end <= start:
+                    continue
+                
+                end = min(self._align(f, nominal_end, size), span_end)
+                
+                if end > start:
+                    yield (start, end)
+                    start = end
+    
+    def align(self, offset: int) -> int:
+        """Move a split point forward to the start of the next line."""
+        f = self._reader()
+        return self._align(f, offset, self._size)
+    
+    @staticmethod
+    def _align(f, offset: int, size: int) -> int:
+        """
+        Move offset forward to the first byte after a newline.
+        
+        Args:
+            f: Binary file handle
+            offset: Nominal boundary
+            size: File size
+        
+        Returns:
+            Aligned offset
+        """
+        if offset >= size:
+            return size
+        
+        f.seek(offset - 1)
+        if f.read(1) == b'\n':
+            return offset
+        
+        f.readline()
+        return f.tell()
+    
+    def read_range(self, start: int, end: int) -> bytes:
+        """
+        Read raw bytes of a range.
+        
+        Args:
+            start: Start offset (inclusive)
+            end: End offset (exclusive)
+        
+        Returns:
+            Range contents
+        """
+        f = self._reader()
+        f.seek(start)
+        return f.read(end - start)
+    
+    def candidates(self, start: int, end: int) -> List[str]:
+        """
+        Parse the records of a byte range.
+        
+        Uses the same rules as Receiver: first column, stripped,
+        empty records skipped.
+        
+        Args:
+            start: Start offset (inclusive)
+            end: End offset (exclusive)
+        
+        Returns:
+            List of record strings
+        """
+        text = self.read_range(start, end).decode(self.encoding)
+        
+        records = []
+        for row in csv.reader(io.StringIO(text, newline=''), delimiter=self.delimiter):
+            if not row:
+                continue
+            
+            record = row[0].strip()
+            if record:
+                records.append(record)
+        
+        return records
@@ -0,0 +1,410 @@
+"""
+Parallel Hash Cracking Engine - Hash Index Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Precomputed on-disk lookup table of digest prefixes for unsalted hashes
+"""
+
+import heapq
+import json
+import mmap
+import os
+import tempfile
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from src.pipeline.file_source import FileRangeSource
+from src.pipeline.hasher import Hasher
+from src.pipeline.logger import Logger
+from src.pipeline.receiver import Receiver
+from src.pipeline.source import CandidateSource
+from src.pipeline.target_set import TargetSet
+from src.pipeline.wordlist_source import WordlistSource
+
+
+class HashIndex:
+    """
+    Sorted fixed-width table of (digest prefix -> candidate offset).
+    
+    Building hashes a candidate source once and stores, for every
+    candidate, the first `prefix_bytes` of its digest followed by an
+    8-byte big-endian offset: the byte offset of the line for file inputs
+    (read through Receiver, or verbatim for wordlists, as workers hash
+    them) or the keyspace index for generated sources.
+    Sorted runs of at most `run_entries` entries are spilled to temporary
+    files and merged, so the index can be larger than RAM.
+    
+    Lookups mmap the table and binary-search the prefix; every hit is
+    confirmed by re-reading the candidate at its offset and hashing it,
+    so prefix collisions never produce false matches.
+    
+    File layout:
+        MAGIC | u32 metadata length | JSON metadata | entries
+    """
+    
+    MAGIC = b'HCINDEX1'
+    OFFSET_BYTES = 8
+    SUPPORTED_ALGORITHMS = ['SHA256', 'SHA384', 'SHA512']
+    
+    def __init__(self, path: str, config: Dict[str, Any]):
+        self.path = path
+        self.config = config
+        self.logger = Logger.get_instance()
+        
+        self.meta: Dict[str, Any] = {}
+        self.prefix_bytes = 0
+        self.entry_size = 0
+        self.data_start = 0
+        self.entries = 0
+        
+        self.hasher: Optional[Hasher] = None
+        self.receiver: Optional[Receiver] = None
+        self.source: Optional[CandidateSource] = None
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        
+        self.lookups = 0
+        self.collisions = 0
+    
+    @classmethod
+    def build(cls, config: Dict[str, Any], path: str) -> int:
+        """
+        Hash every candidate of the configured input and write the index.
+        
+        Settings come from the optional `index` config section:
+        `prefix_bytes` (default 8) and `run_entries` (default 4,000,000).
+        The index is written to a temporary file and renamed into place.
+        
+        Args:
+            config: Configuration dictionary
+            path: Output index path
+        
+        Returns:
+            Number of entries written
+        
+        Raises:
+            ValueError: If the algorithm is salted, rules are configured or
+                the settings are invalid
+        """
+        algorithm = config['hash']['algorithm']
+        if algorithm not in cls.SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Index requires an unsalted algorithm, not {algorithm}")
+        
+        cls._check_no_rules(config)
+        
+        index_config = config.get('index', {})
+        prefix_bytes = index_config.get('prefix_bytes', 8)
+        run_entries = index_config.get('run_entries', 4000000)
+        
+        digest_size = Hasher.CONSTRUCTORS[algorithm]().digest_size
+        if not 1 <= prefix_bytes <= digest_size:
+            raise ValueError(f"prefix_bytes must be between 1 and {digest_size}")
+        
+        entry_size = prefix_bytes + cls.OFFSET_BYTES
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        hasher = Hasher(algorithm)
+        runs: List[str] = []
+        buffer: List[bytes] = []
+        
+        try:
+            candidates = cls._candidates(config)
+            
+            while True:
+                batch = list(islice(candidates, 65536))
+                if not batch:
+                    break
+                
+                offsets = [offset for offset, _ in batch]
+                digests = hasher.hash_many(item for _, item in batch)
+                
+                buffer.extend(
+                    digest[:prefix_bytes] + offset.to_bytes(cls.OFFSET_BYTES, 'big')
+                    for digest, offset in zip(digests, offsets)
+                )
+                
+                if len(buffer) >= run_entries:
+                    runs.append(cls._write_run(buffer, directory))
+                    buffer = []
+            
+            buffer.sort()
+            
+            meta = {
+                'algorithm': algorithm,
+                'prefix_bytes': prefix_bytes,
+                'input': config['input'],
+                'input_size': cls._input_size(config)
+            }
+            header = json.dumps(meta).encode('utf-8')
+            
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            count = 0
+            
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(cls.MAGIC)
+                    f.write(len(header).to_bytes(4, 'big'))
+                    f.write(header)
+                    
+                    merged = heapq.merge(*(cls._read_run(run, entry_size) for run in runs), buffer)
+                    while True:
+                        block = list(islice(merged, 65536))
+                        if not block:
+                            break
+                        
+                        f.write(b''.join(block))
+                        count += len(block)
+                
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        
+        finally:
+            for run in runs:
+                os.remove(run)
+        
+        return count
+    
+    @staticmethod
+    def _check_no_rules(config: Dict[str, Any]) -> None:
+        """
+        Reject rules, which an index cannot apply.
+        
+        Raises:
+            ValueError: If `input.rules` or `input.rules_file` is set
+        """
+        if config['input'].get('rules') or config['input'].get('rules_file'):
+            raise ValueError("Index does not support input.rules or input.rules_file")
+    
+    @staticmethod
+    def _candidates(config: Dict[str, Any]) -> Iterator[Tuple[int, bytes]]:
+        """
+        Enumerate (offset, candidate bytes) of the configured input.
+        
+        CSV inputs are read through Receiver with line offsets, wordlist
+        lines are taken verbatim with their offsets and generated
+        keyspaces are enumerated with their index.
+        """
+        source = CandidateSource.create(config)
+        
+        if isinstance(source, WordlistSource):
+            source.open()
+            try:
+                for offset, line in source.indexed(*source.bounds()):
+                    with line:
+                        yield offset, bytes(line)
+            finally:
+                source.close()
+            return
+        
+        if source is None or isinstance(source, FileRangeSource):
+            for offset, record in Receiver(config).iter_offsets():
+                yield offset, record.encode('utf-8')
+            return
+        
+        for start, end in source.ranges():
+            yield from source.indexed(start, end)
+    
+    @staticmethod
+    def _input_size(config: Dict[str, Any]) -> int:
+        """Get the size of the input (file bytes or keyspace size)."""
+        source = CandidateSource.create(config)
+        
+        if source is None:
+            return os.path.getsize(config['input']['csv_path'])
+        
+        return source.total()
+    
+    @staticmethod
+    def _write_run(buffer: List[bytes], directory: str) -> str:
+        """
+        Sort entries and spill them to a temporary run file.
+        
+        Returns:
+            Path of the run file
+        """
+        buffer.sort()
+        
+        fd, run_path = tempfile.mkstemp(dir=directory, suffix='.run')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b''.join(buffer))
+        
+        return run_path
+    
+    @staticmethod
+    def _read_run(run_path: str, entry_size: int) -> Iterator[bytes]:
+        """Stream the entries of a run file in blocks."""
+        block_size = entry_size * 65536
+        
+        with open(run_path, 'rb') as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+                
+                for i in range(0, len(block), entry_size):
+                    yield block[i:i + entry_size]
+    
+    def open(self) -> None:
+        """
+        Map the index file and prepare candidate resolution.
+        
+        Raises:
+            ValueError: If the file is not an index, was built for another
+                algorithm or rules are configured
+        """
+        self._check_no_rules(self.config)
+        self._file = open(self.path, 'rb')
+        
+        magic = self._file.read(len(self.MAGIC))
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"Not a hash index: {self.path}")
+        
+        header_length = int.from_bytes(self._file.read(4), 'big')
+        self.meta = json.loads(self._file.read(header_length).decode('utf-8'))
+        
+        algorithm = self.config['hash']['algorithm']
+        if self.meta['algorithm'] != algorithm:
+            self.close()
+            raise ValueError(f"Index was built for {self.meta['algorithm']}, not {algorithm}")
+        
+        self.prefix_bytes = self.meta['prefix_bytes']
+        self.entry_size = self.prefix_bytes + self.OFFSET_BYTES
+        self.data_start = len(self.MAGIC) + 4 + header_length
+        
+        size = os.fstat(self._file.fileno()).st_size
+        self.entries = (size - self.data_start) // self.entry_size
+        
+        if size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # Candidates are resolved from the input the index was built from
+        input_config = dict(self.config, input=self.meta['input'])
+        self.source = CandidateSource.create(input_config)
+        if isinstance(self.source, WordlistSource):
+            self.source.open()
+        elif self.source is None or isinstance(self.source, FileRangeSource):
+            self.source = None
+            self.receiver = Receiver(input_config)
+        
+        if self._input_size(input_config) != self.meta['input_size']:
+            self.logger.warning("Index input has changed since the index was built")
+        
+        self.hasher = Hasher(algorithm)
+    
+    def close(self) -> None:
+        """Release the mapping, the file and the candidate source."""
+        if self.source is not None:
+            self.source.close()
+        
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+    
+    def _prefix_at(self, i: int) -> bytes:
+        """Get the digest prefix of entry i."""
+        pos = self.data_start + i * self.entry_size
+        return self._map[pos:pos + self.prefix_bytes]
+    
+    def _offset_at(self, i: int) -> int:
+        """Get the candidate offset of entry i."""
+        pos = self.data_start + i * self.entry_size + self.prefix_bytes
+        return int.from_bytes(self._map[pos:pos + self.OFFSET_BYTES], 'big')
+    
+    def _lower_bound(self, prefix: bytes) -> int:
+        """Binary search for the first entry whose prefix is >= prefix."""
+        lo, hi = 0, self.entries
+        
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._prefix_at(mid) < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        return lo
+    
+    def _resolve(self, offset: int) -> Tuple[Optional[bytes], str]:
+        """
+        Re-read the candidate stored at an offset.
+        
+        Returns:
+            Tuple of (candidate bytes or None, printable candidate)
+        """
+        if self.receiver is not None:
+            record = self.receiver.record_at(offset)
+            return (record.encode('utf-8') if record else None), record
+        
+        if isinstance(self.source, WordlistSource):
+            candidate = self.source.line_at(offset)
+        else:
+            candidate = next(iter(self.source.candidates(offset, offset + 1)), None)
+        if candidate is None:
+            return None, ''
+        
+        encoding = self.config['input'].get('csv_encoding', 'utf-8')
+        return bytes(candidate), bytes(candidate).decode(encoding, errors='replace')
+    
+    def lookup(self, digest: bytes) -> Optional[str]:
+        """
+        Find the candidate whose hash is the given digest.
+        
+        Args:
+            digest: Raw target digest
+        
+        Returns:
+            Original candidate, or None if it is not in the index
+        """
+        self.lookups += 1
+        prefix = digest[:self.prefix_bytes]
+        i = self._lower_bound(prefix)
+        
+        while i < self.entries and self._prefix_at(i) == prefix:
+            candidate, original = self._resolve(self._offset_at(i))
+            
+            if candidate is not None and self.hasher.digest_bytes(candidate) == digest:
+                return original
+            
+            self.collisions += 1
+            i += 1
+        
+        return None
+    
+    def lookup_targets(self, targets: TargetSet) -> List[Dict[str, Any]]:
+        """
+        Resolve every target hash through the index.
+        
+        Args:
+            targets: Target hashes
+        
+        Returns:
+            Match records in the same shape workers produce
+        """
+        results = []
+        
+        for digest in targets:
+            original = self.lookup(digest)
+            
+            if original is not None:
+                results.append({
+                    'original': original,
+                    'hash': digest.hex(),
+                    'algorithm': self.meta['algorithm']
+                })
+        
+        return results
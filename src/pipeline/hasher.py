@@ -8,7 +8,9 @@ Description: Hash computation engine supporting multiple cryptographic algorithm
 
 import hashlib
 import os
-from typing import Optional
+from typing import Any, Container, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
 
 
 class Hasher:
@@ -16,6 +18,12 @@ class Hasher:
     
     SUPPORTED_ALGORITHMS = ['SHA256', 'SHA384', 'SHA512', 'PBKDF2']
     
+    CONSTRUCTORS = {
+        'SHA256': hashlib.sha256,
+        'SHA384': hashlib.sha384,
+        'SHA512': hashlib.sha512
+    }
+    
     def __init__(self, algorithm: str = 'SHA256', iterations: int = 100000, salt_length: int = 32):
         if algorithm not in self.SUPPORTED_ALGORITHMS:
             raise ValueError(f"Unsupported algorithm: {algorithm}. Must be one of {self.SUPPORTED_ALGORITHMS}")
@@ -23,6 +31,11 @@ class Hasher:
         self.algorithm = algorithm
         self.iterations = iterations
         self.salt_length = salt_length
+        
+        # Resolved once so per-item hashing skips the algorithm dispatch
+        self._new = self.CONSTRUCTORS.get(algorithm)
+        
+        self.items_hashed = 0
     
     def hash(self, data: str, salt: Optional[bytes] = None) -> str:
         """
@@ -41,58 +54,208 @@ class Hasher:
         if not isinstance(data, str):
             raise TypeError(f"Data must be a string, got {type(data).__name__}")
         
+        return self.hash_bytes(data.encode('utf-8'), salt)
+    
+    def hash_bytes(self, data: BytesLike, salt: Optional[bytes] = None) -> str:
+        """
+        Compute cryptographic hash of raw bytes.
+        
+        Accepts any bytes-like object (including memoryview slices of an
+        mmap), so callers that already hold bytes skip the str round-trip.
+        
+        Args:
+            data: Bytes to hash
+            salt: Optional salt for PBKDF2 (if None, random salt is generated)
+        
+        Returns:
+            Hexadecimal hash string
+        """
+        return self.digest_bytes(data, salt).hex()
+    
+    def digest(self, data: str, salt: Optional[bytes] = None) -> bytes:
+        """
+        Compute raw digest of given data.
+        
+        Same as hash() but returns the digest bytes, so comparing against
+        targets needs no hex encoding per candidate.
+        
+        Args:
+            data: String to hash
+            salt: Optional salt for PBKDF2 (if None, random salt is generated)
+        
+        Returns:
+            Raw digest bytes (salt + key for PBKDF2)
+        
+        Raises:
+            TypeError: If data is not a string
+        """
+        if not isinstance(data, str):
+            raise TypeError(f"Data must be a string, got {type(data).__name__}")
+        
+        return self.digest_bytes(data.encode('utf-8'), salt)
+    
+    def digest_bytes(self, data: BytesLike, salt: Optional[bytes] = None) -> bytes:
+        """
+        Compute raw digest of bytes-like data.
+        
+        Args:
+            data: Bytes to hash
+            salt: Optional salt for PBKDF2 (if None, random salt is generated)
+        
+        Returns:
+            Raw digest bytes (salt + key for PBKDF2)
+        """
         if self.algorithm == 'PBKDF2':
-            return self._pbkdf2_hash(data, salt)
+            return self._pbkdf2_digest(data, salt)
         else:
-            return self._simple_hash(data)
+            return self._simple_digest(data)
     
-    def _simple_hash(self, data: str) -> str:
+    def hash_many(self, items: Iterable[BytesLike]) -> Iterator[bytes]:
+        """
+        Compute raw digests for many bytes-like items.
+        
+        The hashlib constructor is resolved once for the whole batch.
+        
+        Args:
+            items: Bytes-like items to hash
+        
+        Yields:
+            Raw digest bytes in input order
+        """
+        if self._new is None:
+            for item in items:
+                yield self._pbkdf2_digest(item)
+            return
+        
+        new = self._new
+        for item in items:
+            yield new(item).digest()
+    
+    def match_many(self, items: Iterable[Any], targets: Container[bytes],
+                   binary: bool = False) -> Iterator[Tuple[Any, bytes]]:
+        """
+        Hash many items and yield only those whose digest is a target.
+        
+        Items are str (encoded as UTF-8) unless binary is set, in which
+        case they are hashed as given. The number of items hashed is added
+        to `items_hashed` once the batch is consumed.
+        
+        For PBKDF2 the targets are salt + key digests: every candidate is
+        derived once per unique target salt and the raw key is compared,
+        so no random salt is ever used.
+        
+        Args:
+            items: Candidates to hash
+            targets: Container of raw target digests
+            binary: True if items are already bytes-like
+        
+        Yields:
+            Tuples of (item, digest) for every match
+        """
+        count = 0
+        
+        try:
+            if self._new is None:
+                salts = self.group_by_salt(targets)
+                for count, item in enumerate(items, 1):
+                    data = item if binary else item.encode('utf-8')
+                    for salt, keys in salts.items():
+                        key = self.derive_key(data, salt)
+                        if key in keys:
+                            yield item, salt + key
+            elif binary:
+                new = self._new
+                for count, item in enumerate(items, 1):
+                    digest = new(item).digest()
+                    if digest in targets:
+                        yield item, digest
+            else:
+                new = self._new
+                for count, item in enumerate(items, 1):
+                    digest = new(item.encode('utf-8')).digest()
+                    if digest in targets:
+                        yield item, digest
+        finally:
+            self.items_hashed += count
+    
+    def derive_key(self, data: BytesLike, salt: bytes) -> bytes:
+        """
+        Derive a PBKDF2-HMAC-SHA256 key with a given salt.
+        
+        Args:
+            data: Bytes-like candidate
+            salt: Salt taken from a target hash
+        
+        Returns:
+            Raw derived key (without the salt)
+        """
+        return hashlib.pbkdf2_hmac('sha256', data, salt, self.iterations)
+    
+    def group_by_salt(self, targets: Iterable[bytes]) -> Dict[bytes, Set[bytes]]:
+        """
+        Split salt + key target digests into keys grouped by salt.
+        
+        A TargetSet is already grouped when loaded; any other container
+        is split here using `salt_length`.
+        
+        Args:
+            targets: Raw PBKDF2 target digests
+        
+        Returns:
+            Mapping of salt to the set of keys derived with it
+        """
+        salts = getattr(targets, 'salts', None)
+        if salts is not None:
+            return salts
+        
+        salts = {}
+        for digest in targets:
+            salts.setdefault(digest[:self.salt_length], set()).add(digest[self.salt_length:])
+        
+        return salts
+    
+    def _simple_digest(self, data_bytes: BytesLike) -> bytes:
+        """Compute simple digest (SHA256/384/512)."""
+        return self._new(data_bytes).digest()
+    
+    def _simple_hash(self, data_bytes: BytesLike) -> str:
         """Compute simple hash (SHA256/384/512)."""
-        data_bytes = data.encode('utf-8')
-        
-        if self.algorithm == 'SHA256':
-            return hashlib.sha256(data_bytes).hexdigest()
-        elif self.algorithm == 'SHA384':
-            return hashlib.sha384(data_bytes).hexdigest()
-        elif self.algorithm == 'SHA512':
-            return hashlib.sha512(data_bytes).hexdigest()
-        else:
-            raise ValueError(f"Unknown algorithm: {self.algorithm}")
+        return self._simple_digest(data_bytes).hex()
     
-    def _pbkdf2_hash(self, data: str, salt: Optional[bytes] = None) -> str:
-        """Compute PBKDF2-HMAC-SHA256 hash."""
+    def _pbkdf2_digest(self, data_bytes: BytesLike, salt: Optional[bytes] = None) -> bytes:
+        """Compute PBKDF2-HMAC-SHA256 digest prefixed with its salt."""
         if salt is None:
             salt = os.urandom(self.salt_length)
         
-        data_bytes = data.encode('utf-8')
         key = hashlib.pbkdf2_hmac('sha256', data_bytes, salt, self.iterations)
         
-        return salt.hex() + key.hex()
+        return salt + key
     
-    def verify(self, data: str, hash_value: str) -> bool:
+    def verify(self, data: Union[str, BytesLike], hash_value: str) -> bool:
         """
         Verify if data matches given hash.
         
         Args:
-            data: Original data to verify
+            data: Original data to verify, as text or raw bytes
             hash_value: Hash to compare against
         
         Returns:
             True if hash matches, False otherwise
         """
+        data_bytes = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+        
         if self.algorithm == 'PBKDF2':
-            return self._verify_pbkdf2(data, hash_value)
+            return self._verify_pbkdf2(data_bytes, hash_value)
         else:
-            computed_hash = self._simple_hash(data)
+            computed_hash = self._simple_hash(data_bytes)
             return computed_hash == hash_value.lower()
     
-    def _verify_pbkdf2(self, data: str, hash_value: str) -> bool:
+    def _verify_pbkdf2(self, data_bytes: bytes, hash_value: str) -> bool:
         """Verify PBKDF2 hash."""
         try:
             salt_hex = hash_value[:self.salt_length * 2]
             salt = bytes.fromhex(salt_hex)
             
-            data_bytes = data.encode('utf-8')
             key = hashlib.pbkdf2_hmac('sha256', data_bytes, salt, self.iterations)
             
             expected_hash = salt.hex() + key.hex()
@@ -0,0 +1,216 @@
+"""
+Parallel Hash Cracking Engine - Job Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Unit of work submitted to the worker pool and its progress tracking
+"""
+
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+from src.pipeline.checkpoint import Checkpoint
+from src.pipeline.chunk_sizer import ChunkSizer
+from src.pipeline.source import CandidateSource
+from src.pipeline.target_set import TargetSet
+from src.utils.timer import Timer
+
+
+class Job:
+    """
+    One cracking run executed by the worker pool.
+    
+    The job spec (config, targets, source) is sent to every worker once;
+    afterwards only (job_id, seq, payload) tasks travel over the queue.
+    Progress fields are kept in the parent only and are never pickled.
+    """
+    
+    # Attributes that exist only in the parent process
+    PARENT_ONLY = (
+        'results', 'cracked', 'tasks_submitted', 'tasks_total', 'tasks_done', 'items_processed',
+        'timer', 'done', 'stopped', 'spans', 'pending', 'checkpoint', 'sizer', '_lock'
+    )
+    
+    def __init__(self, job_id: int, config: Dict[str, Any], targets: TargetSet,
+                 source: Optional[CandidateSource] = None):
+        self.job_id = job_id
+        self.config = config
+        self.targets = targets
+        self.source = source
+        self.slot = 0
+        self.rules = None  # compiled inside each worker
+        
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.cracked: Set[str] = set()
+        self.tasks_submitted = 0
+        self.tasks_total: Optional[int] = None
+        self.tasks_done = 0
+        self.items_processed = 0
+        self.timer = Timer()
+        self.done = threading.Event()
+        self.stopped = False
+        self.spans: Dict[int, Tuple[int, int]] = {}  # input span of each queued task
+        self.pending: Dict[int, int] = {}  # units not yet acknowledged of split tasks
+        self.checkpoint: Optional[Checkpoint] = None
+        self.sizer: Optional[ChunkSizer] = None
+        self._lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self.PARENT_ONLY:
+            state.pop(name, None)
+        return state
+    
+    def record_match(self, key: str, record: Dict[str, Any]) -> bool:
+        """
+        Store a match reported by a worker.
+        
+        Args:
+            key: Result key
+            record: Match record
+        
+        Returns:
+            True if every target of the job is now cracked
+        """
+        with self._lock:
+            self.results[key] = record
+            self.cracked.add(record['hash'])
+            
+            if self.checkpoint is not None:
+                self.checkpoint.add_match(record)
+            
+            return len(self.targets) > 0 and len(self.cracked) >= len(self.targets)
+    
+    def record_task_done(self, worker_id: int, items: int, matches: int,
+                         seq: Optional[int] = None, seconds: float = 0.0,
+                         span: Optional[Tuple[int, int]] = None,
+                         owned: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Account for a finished task.
+        
+        Per-worker totals are kept under `worker_<id>` keys in the results,
+        in the shape Collector.collect_worker_stats expects. The input span
+        of the task feeds the checkpoint and the chunk sizer. Tasks finished
+        after the job was stopped may have been skipped or cut short, so
+        they feed neither.
+        
+        A task whose range was split by work stealing is acknowledged once
+        per piece, in any order. Each acknowledgement reports the part of
+        the range its piece owned; the task is done once the owned parts
+        add up to the queued span.
+        
+        Args:
+            worker_id: Worker that processed the task
+            items: Candidates hashed
+            matches: Matches found
+            seq: Task sequence number
+            seconds: Worker wall time spent on the task
+            span: Input span actually processed (defaults to the queued span)
+            owned: Part of the queued span this piece owned, for split ranges
+        
+        Returns:
+            True if this was the last outstanding task of the job
+        """
+        with self._lock:
+            self.items_processed += items
+            
+            stats = self.results.setdefault(f"worker_{worker_id}", {
+                'worker_id': worker_id,
+                'items_processed': 0,
+                'matches_found': 0
+            })
+            stats['items_processed'] += items
+            stats['matches_found'] += matches
+            
+            queued = self.spans.get(seq)
+            left = 0
+            
+            if owned is not None and queued is not None:
+                left = self.pending.pop(seq, queued[1] - queued[0]) - (owned[1] - owned[0])
+            
+            if left > 0:
+                self.pending[seq] = left
+            else:
+                self.spans.pop(seq, None)
+                self.tasks_done += 1
+            
+            span = tuple(span) if span is not None else queued
+            
+            if span is not None and not self.stopped:
+                if self.checkpoint is not None:
+                    self.checkpoint.mark_done(*span)
+                    self.checkpoint.maybe_save()
+                
+                if self.sizer is not None:
+                    self.sizer.observe(span[1] - span[0], seconds)
+            
+            return self.tasks_total is not None and self.tasks_done >= self.tasks_total
+    
+    def record_progress(self, span: Tuple[int, int]) -> None:
+        """
+        Checkpoint the finished part of a range that is still being walked.
+        
+        Args:
+            span: Input span whose candidates were all hashed
+        """
+        with self._lock:
+            if self.checkpoint is not None and not self.stopped:
+                self.checkpoint.mark_done(*span)
+                self.checkpoint.maybe_save()
+    
+    def finish_submitting(self, tasks_total: int) -> bool:
+        """
+        Mark that no more tasks will be submitted.
+        
+        Args:
+            tasks_total: Number of tasks submitted
+        
+        Returns:
+            True if every task has already been processed
+        """
+        with self._lock:
+            self.tasks_total = tasks_total
+            return self.tasks_done >= tasks_total
+    
+    def save_checkpoint(self) -> None:
+        """Write the checkpoint now, consistent with the recorded progress."""
+        with self._lock:
+            if self.checkpoint is not None:
+                self.checkpoint.save()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the job to complete.
+        
+        Args:
+            timeout: Optional timeout in seconds
+        
+        Returns:
+            True if the job completed
+        """
+        return self.done.wait(timeout)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get job progress statistics.
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'job_id': self.job_id,
+            'tasks_submitted': self.tasks_submitted,
+            'tasks_total': self.tasks_total,
+            'tasks_done': self.tasks_done,
+            'items_processed': self.items_processed,
+            'matches_found': len(self.cracked),
+            'elapsed': self.timer.elapsed(),
+            'done': self.done.is_set(),
+            'stopped': self.stopped
+        }
+    
+    def worker_stats(self) -> List[Dict[str, Any]]:
+        """Get per-worker totals sorted by worker_id."""
+        return sorted(
+            (value for key, value in self.results.items() if key.startswith('worker_')),
+            key=lambda x: x['worker_id']
+        )
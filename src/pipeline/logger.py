@@ -6,10 +6,13 @@ Date: November 2025
 Description: Thread-safe logger implementation using multiprocessing.Lock
 """
 
+import io
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from multiprocessing import Lock
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime
 
 
@@ -111,6 +114,31 @@ class Logger:
         if total_time > 0:
             self.info(f"Processing rate: {total_items / total_time:.2f} items/sec")
     
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        """
+        Capture the INFO and higher messages logged by the calling thread.
+        
+        Used to hand the log of one run back to its caller without reading
+        the shared log file, which also holds the lines of concurrent runs.
+        
+        Yields:
+            StringIO buffer that receives the console-formatted lines
+        """
+        buffer = io.StringIO()
+        thread_id = threading.get_ident()
+        
+        handler = logging.StreamHandler(buffer)
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+        handler.addFilter(lambda record: record.thread == thread_id)
+        
+        self.logger.addHandler(handler)
+        try:
+            yield buffer
+        finally:
+            self.logger.removeHandler(handler)
+    
     @classmethod
     def get_instance(cls, log_path: str = "logs/hasher.log", verbose: bool = True) -> 'Logger':
         """Get logger singleton instance."""
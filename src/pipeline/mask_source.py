@@ -0,0 +1,189 @@
+"""
+Parallel Hash Cracking Engine - Mask Source Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Brute-force mask keyspace with index-addressable candidates
+"""
+
+import string
+from typing import Dict, Any, Iterator, List
+from src.pipeline.logger import Logger
+from src.pipeline.source import CandidateSource
+
+
+class MaskSource(CandidateSource):
+    """
+    Brute-force keyspace described by a hashcat-style mask.
+    
+    Every position of the mask has a charset; candidate number `index`
+    is the mixed-radix representation of the index over those charsets
+    (last position varies fastest). Any candidate can therefore be
+    computed directly from its index and work units are plain
+    (start, end) index ranges.
+    
+    Placeholders:
+        ?l  lowercase    ?u  uppercase    ?d  digits
+        ?s  specials     ?a  ?l?u?d?s     ?h  0-9a-f
+        ?H  0-9A-F       ??  literal '?'  ?1-?4 custom charsets
+    """
+    
+    binary = True
+    
+    CHARSETS = {
+        'l': string.ascii_lowercase,
+        'u': string.ascii_uppercase,
+        'd': string.digits,
+        's': ' ' + string.punctuation,
+        'a': string.ascii_lowercase + string.ascii_uppercase + string.digits + ' ' + string.punctuation,
+        'h': string.digits + 'abcdef',
+        'H': string.digits + 'ABCDEF',
+        '?': '?'
+    }
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        
+        self.mask = config['input'].get('mask', '')
+        self.custom_charsets = config['input'].get('custom_charsets', {})
+        self.positions: List[List[bytes]] = []
+    
+    def validate(self) -> bool:
+        """
+        Check that the mask can be parsed.
+        
+        Returns:
+            True if valid, False otherwise
+        """
+        logger = Logger.get_instance()
+        
+        if not self.mask:
+            logger.error("No mask specified for mask input mode")
+            return False
+        
+        try:
+            self.parse()
+        except ValueError as e:
+            logger.error(f"Invalid mask: {e}")
+            return False
+        
+        return True
+    
+    def parse(self) -> List[List[bytes]]:
+        """
+        Parse the mask into per-position charsets.
+        
+        Returns:
+            List of charsets, each a list of encoded characters
+        
+        Raises:
+            ValueError: If the mask references an unknown charset
+        """
+        positions = []
+        i = 0
+        
+        while i < len(self.mask):
+            char = self.mask[i]
+            
+            if char != '?':
+                charset = char
+                i += 1
+            else:
+                if i + 1 >= len(self.mask):
+                    raise ValueError(f"Mask '{self.mask}' ends with a bare '?'")
+                
+                key = self.mask[i + 1]
+                if key in self.CHARSETS:
+                    charset = self.CHARSETS[key]
+                elif key in self.custom_charsets:
+                    charset = self.custom_charsets[key]
+                else:
+                    raise ValueError(f"Unknown charset '?{key}' in mask '{self.mask}'")
+                
+                if not charset:
+                    raise ValueError(f"Charset '?{key}' is empty")
+                
+                i += 2
+            
+            positions.append([c.encode('utf-8') for c in dict.fromkeys(charset)])
+        
+        self.positions = positions
+        return positions
+    
+    def _charsets(self) -> List[List[bytes]]:
+        """Get parsed charsets, parsing on first use."""
+        if not self.positions:
+            self.parse()
+        return self.positions
+    
+    def total(self) -> int:
+        """Get keyspace size (product of charset lengths)."""
+        total = 1
+        for charset in self._charsets():
+            total *= len(charset)
+        return total
+    
+    def candidate(self, index: int) -> bytes:
+        """
+        Compute a single candidate from its index.
+        
+        Args:
+            index: Keyspace index
+        
+        Returns:
+            Candidate bytes
+        """
+        return b''.join(charset[d] for charset, d in zip(self._charsets(), self._digits(index)))
+    
+    def _digits(self, index: int) -> List[int]:
+        """Decompose index into per-position charset offsets."""
+        charsets = self._charsets()
+        digits = [0] * len(charsets)
+        
+        for pos in range(len(charsets) - 1, -1, -1):
+            index, digits[pos] = divmod(index, len(charsets[pos]))
+        
+        return digits
+    
+    def candidates(self, start: int, end: int) -> Iterator[bytes]:
+        """
+        Generate candidates of an index range.
+        
+        The index is decomposed once at the start of the range; after that
+        the prefix is only rebuilt when the last position wraps around.
+        
+        Args:
+            start: Start index (inclusive)
+            end: End index (exclusive)
+        
+        Yields:
+            Candidates as bytes
+        """
+        charsets = self._charsets()
+        if not charsets or start >= end:
+            return
+        
+        last = charsets[-1]
+        radix = len(last)
+        digits = self._digits(start)
+        index = start
+        
+        while index < end:
+            prefix = b''.join(charset[d] for charset, d in zip(charsets, digits[:-1]))
+            first = digits[-1]
+            stop = min(radix, first + end - index)
+            
+            for char in last[first:stop]:
+                yield prefix + char
+            
+            index += stop - first
+            
+            # Carry into the prefix positions
+            digits[-1] = 0
+            pos = len(charsets) - 2
+            while pos >= 0:
+                digits[pos] += 1
+                if digits[pos] < len(charsets[pos]):
+                    break
+                digits[pos] = 0
+                pos -= 1
@@ -0,0 +1,75 @@
+"""
+Parallel Hash Cracking Engine - Multi Hasher Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Single-pass hashing of every candidate with several algorithms
+"""
+
+from typing import Any, Iterable, Iterator, List, Tuple
+from src.pipeline.hasher import Hasher
+from src.pipeline.target_set import TargetSet
+
+
+class MultiHasher:
+    """
+    Hashes each candidate with several algorithms in one pass.
+    
+    Used when a target set mixes algorithms. Each candidate is encoded
+    once and that same buffer is fed to every algorithm that still has
+    targets, so a mixed dump costs one read of the input instead of one
+    full pipeline run per algorithm. Offers the match_many() interface
+    of Hasher, so the worker treats both the same way.
+    """
+    
+    def __init__(self, algorithms: List[str], iterations: int = 100000, salt_length: int = 32):
+        self.algorithms = list(algorithms)
+        self.hashers = {
+            algorithm: Hasher(algorithm, iterations, salt_length)
+            for algorithm in self.algorithms
+        }
+        
+        self.items_hashed = 0
+    
+    def match_many(self, items: Iterable[Any], targets: TargetSet,
+                   binary: bool = False) -> Iterator[Tuple[Any, bytes]]:
+        """
+        Hash many items with every algorithm and yield target matches.
+        
+        Only algorithms with targets in this set are computed. PBKDF2 is
+        derived once per unique target salt, as in Hasher.match_many.
+        
+        Args:
+            items: Candidates to hash
+            targets: Target set holding digests per algorithm
+            binary: True if items are already bytes-like
+        
+        Yields:
+            Tuples of (item, digest) for every match
+        """
+        simple = [
+            (Hasher.CONSTRUCTORS[algorithm], targets.by_algorithm[algorithm])
+            for algorithm in self.algorithms
+            if algorithm in Hasher.CONSTRUCTORS and targets.by_algorithm.get(algorithm)
+        ]
+        
+        pbkdf2 = self.hashers.get('PBKDF2')
+        salts = list(targets.salts.items()) if pbkdf2 is not None else []
+        
+        count = 0
+        
+        try:
+            for count, item in enumerate(items, 1):
+                data = item if binary else item.encode('utf-8')
+                
+                for new, digests in simple:
+                    digest = new(data).digest()
+                    if digest in digests:
+                        yield item, digest
+                
+                for salt, keys in salts:
+                    key = pbkdf2.derive_key(data, salt)
+                    if key in keys:
+                        yield item, salt + key
+        finally:
+            self.items_hashed += count
@@ -0,0 +1,239 @@
+"""
+Parallel Hash Cracking Engine - Potfile Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Append-only record of every target cracked by any run
+"""
+
+import os
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+from src.pipeline.hasher import Hasher
+from src.pipeline.logger import Logger
+from src.pipeline.target_set import TargetSet
+
+
+class Potfile:
+    """
+    Cracked targets of every run, one `ALGORITHM:hash:plaintext` line each.
+    
+    The file is only ever appended to, so unlike the results file it
+    remembers every run. It is read once into a dict keyed by (algorithm,
+    hash), which answers a target in O(1) before any worker is started.
+    A plaintext is everything after the second colon; one that contains
+    a line break or starts with `$HEX[` is written as `$HEX[<hex>]` of
+    its UTF-8 bytes. A wordlist match whose bytes are not that text
+    (record field `original_hex`) is written as `$HEX[<hex>]` of the raw
+    bytes and kept as bytes, so the exact plaintext survives.
+    
+    PBKDF2 keys do not record the iteration count, so a PBKDF2 entry is
+    accepted only after deriving it once with the current settings.
+    """
+    
+    HEX_PREFIX = '$HEX['
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[Tuple[str, str], Union[str, bytes]] = {}
+        self.invalid_lines = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, path: str) -> 'Potfile':
+        """
+        Read a potfile; a missing file is an empty potfile.
+        
+        Args:
+            path: Potfile path
+        
+        Returns:
+            Potfile instance
+        """
+        potfile = cls(path)
+        
+        if not os.path.isfile(path):
+            return potfile
+        
+        with open(path, 'r', encoding='utf-8', newline='\n') as f:
+            for line in f:
+                entry = cls._parse_line(line.rstrip('\r\n'))
+                
+                if entry is None:
+                    potfile.invalid_lines += 1
+                    continue
+                
+                algorithm, hash_value, plaintext = entry
+                potfile.entries[(algorithm, hash_value)] = plaintext
+        
+        if potfile.invalid_lines > 0:
+            Logger.get_instance().warning(
+                f"Skipped {potfile.invalid_lines} malformed lines in potfile {path}"
+            )
+        
+        return potfile
+    
+    @classmethod
+    def _parse_line(cls, line: str) -> Optional[Tuple[str, str, Union[str, bytes]]]:
+        """Split a potfile line into (algorithm, hash, plaintext)."""
+        parts = line.split(':', 2)
+        
+        if len(parts) != 3 or parts[0] not in Hasher.SUPPORTED_ALGORITHMS:
+            return None
+        
+        algorithm, hash_value, plaintext = parts
+        
+        if plaintext.startswith(cls.HEX_PREFIX) and plaintext.endswith(']'):
+            try:
+                plaintext = bytes.fromhex(plaintext[len(cls.HEX_PREFIX):-1])
+            except ValueError:
+                return None
+            
+            # Raw wordlist bytes stay bytes
+            try:
+                plaintext = plaintext.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+        
+        return algorithm, hash_value.lower(), plaintext
+    
+    @staticmethod
+    def plaintext_of(record: Dict[str, Any]) -> Union[str, bytes]:
+        """
+        Get the exact plaintext of a match record.
+        
+        Args:
+            record: Match record as produced by a worker
+        
+        Returns:
+            Raw bytes for records with `original_hex`, the text otherwise
+        """
+        if 'original_hex' in record:
+            return bytes.fromhex(record['original_hex'])
+        
+        return record['original']
+    
+    @classmethod
+    def format_line(cls, algorithm: str, hash_value: str, plaintext: Union[str, bytes]) -> str:
+        """
+        Format one potfile line.
+        
+        Args:
+            algorithm: Algorithm of the target
+            hash_value: Hex hash of the target
+            plaintext: Cracked plaintext, or its raw bytes
+        
+        Returns:
+            Line including the trailing newline
+        """
+        if isinstance(plaintext, bytes):
+            plaintext = f"{cls.HEX_PREFIX}{plaintext.hex()}]"
+        elif '\n' in plaintext or '\r' in plaintext or plaintext.startswith(cls.HEX_PREFIX):
+            plaintext = f"{cls.HEX_PREFIX}{plaintext.encode('utf-8', 'surrogatepass').hex()}]"
+        
+        return f"{algorithm}:{hash_value.lower()}:{plaintext}\n"
+    
+    def lookup(self, algorithm: str, hash_value: str) -> Optional[Union[str, bytes]]:
+        """
+        Get the plaintext of a cracked target.
+        
+        Args:
+            algorithm: Algorithm of the target
+            hash_value: Hex hash of the target
+        
+        Returns:
+            Plaintext (bytes if it is not UTF-8 text), or None if the
+            target was never cracked
+        """
+        return self.entries.get((algorithm, hash_value.lower()))
+    
+    def cracked(self, targets: TargetSet, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get match records of the targets cracked by earlier runs.
+        
+        Args:
+            targets: Targets of the run
+            config: Configuration dictionary (PBKDF2 settings)
+        
+        Returns:
+            Match records in the shape workers report them
+        """
+        records = []
+        verifier = None
+        
+        for algorithm in targets.active_algorithms():
+            for digest in targets.by_algorithm[algorithm]:
+                hash_value = digest.hex()
+                plaintext = self.lookup(algorithm, hash_value)
+                
+                if plaintext is None:
+                    continue
+                
+                if algorithm == 'PBKDF2':
+                    if verifier is None:
+                        verifier = Hasher(
+                            'PBKDF2',
+                            config['hash'].get('pbkdf2_iterations', 100000),
+                            config['hash'].get('pbkdf2_salt_length', 32)
+                        )
+                    
+                    if not verifier.verify(plaintext, hash_value):
+                        continue
+                
+                record = {
+                    'original': plaintext,
+                    'hash': hash_value,
+                    'algorithm': algorithm,
+                    'potfile': True
+                }
+                
+                if isinstance(plaintext, bytes):
+                    record['original'] = plaintext.decode('utf-8', errors='replace')
+                    record['original_hex'] = plaintext.hex()
+                
+                records.append(record)
+        
+        return records
+    
+    def add(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append the match records that are not in the potfile yet.
+        
+        The entries are updated only once the lines are on disk, so a
+        failed append is retried by the next call.
+        
+        Args:
+            records: Match records with original, hash and algorithm
+        
+        Returns:
+            Number of lines appended
+        
+        Raises:
+            OSError: If the potfile cannot be written
+        """
+        with self._lock:
+            added = {}
+            lines = []
+            
+            for record in records:
+                key = (record['algorithm'], record['hash'].lower())
+                plaintext = self.plaintext_of(record)
+                
+                if added.get(key, self.entries.get(key)) == plaintext:
+                    continue
+                
+                added[key] = plaintext
+                lines.append(self.format_line(record['algorithm'], record['hash'], plaintext))
+            
+            if lines:
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+                
+                with open(self.path, 'a', encoding='utf-8', newline='\n') as f:
+                    f.write(''.join(lines))
+            
+            self.entries.update(added)
+            return len(lines)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,180 @@
+"""
+Parallel Hash Cracking Engine - Range Board Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Shared table of in-flight ranges that idle workers steal from
+"""
+
+from multiprocessing import Lock
+from multiprocessing.sharedctypes import RawArray
+from typing import Callable, Optional, Tuple
+
+
+class RangeBoard:
+    """
+    Cross-process table of the range each worker is processing.
+    
+    Every worker owns one row (job_id, seq, position, end). A
+    worker walks its range by claiming small pieces from `position`; an
+    idle worker picks the row with the most unclaimed work and takes the
+    upper half of [position, end) by lowering that row's `end`. Split
+    points are aligned outside the lock, since aligning may read the
+    input file, and a claim or steal is committed under the lock only if
+    the row still allows it. So a unit is processed exactly once and the
+    stolen half can itself be split again by the next idle worker.
+    
+    When a worker retires its row, [start, end) is the part of the task
+    it owned after all splits; the owned parts of all pieces add up to
+    the queued range, which is how the pool tells the task is complete.
+    The array and lock are created before the workers fork and are
+    inherited, like StopSignal.
+    """
+    
+    FIELDS = 4
+    JOB, SEQ, POSITION, END = range(FIELDS)
+    IDLE = 0  # job ids start at 1
+    
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.rows = RawArray('q', workers * self.FIELDS)
+        self.lock = Lock()
+    
+    def _row(self, worker_id: int) -> int:
+        return worker_id * self.FIELDS
+    
+    def begin(self, worker_id: int, job_id: int, seq: int, start: int, end: int) -> None:
+        """
+        Publish the range a worker starts processing.
+        
+        Args:
+            worker_id: Owning worker
+            job_id: Job of the range
+            seq: Task sequence number
+            start: Range start (inclusive)
+            end: Range end (exclusive)
+        """
+        row = self._row(worker_id)
+        
+        with self.lock:
+            self.rows[row + self.JOB] = job_id
+            self.rows[row + self.SEQ] = seq
+            self.rows[row + self.POSITION] = start
+            self.rows[row + self.END] = end
+    
+    def claim(self, worker_id: int, units: int,
+              align: Callable[[int], int]) -> Optional[Tuple[int, int]]:
+        """
+        Claim the next piece of a worker's own range.
+        
+        Args:
+            worker_id: Owning worker
+            units: Nominal size of the piece
+            align: Moves a boundary to the next valid split point
+        
+        Returns:
+            (start, end) of the piece, or None once the range is exhausted
+        """
+        row = self._row(worker_id)
+        
+        with self.lock:
+            position = self.rows[row + self.POSITION]
+            end = self.rows[row + self.END]
+        
+        if position >= end:
+            return None
+        
+        # Only the owner moves `position`; a thief can only lower `end`
+        piece_end = align(position + units)
+        
+        with self.lock:
+            piece_end = min(piece_end, self.rows[row + self.END])
+            self.rows[row + self.POSITION] = piece_end
+        
+        return position, piece_end
+    
+    def finish(self, worker_id: int) -> Tuple[int, int]:
+        """
+        Retire a worker's row.
+        
+        Args:
+            worker_id: Owning worker
+        
+        Returns:
+            Tuple of (end of the processed part, end of the owned part)
+        """
+        row = self._row(worker_id)
+        
+        with self.lock:
+            self.rows[row + self.JOB] = self.IDLE
+            return self.rows[row + self.POSITION], self.rows[row + self.END]
+    
+    def steal(self, thief_id: int,
+              policy: Callable[[int], Optional[Tuple[Callable[[int], int], int]]]
+              ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Take the upper half of the largest unclaimed remainder.
+        
+        The stolen piece is published as the thief's row before the lock
+        is released, so it can be split again right away.
+        
+        Args:
+            thief_id: Idle worker
+            policy: Maps a job id to (align, claim units) or None if the
+                thief cannot work on that job
+        
+        Returns:
+            Tuple of (job_id, seq, start, end), or None if nothing is
+            worth stealing
+        """
+        with self.lock:
+            victim = None
+            largest = 0
+            
+            for worker_id in range(self.workers):
+                row = self._row(worker_id)
+                
+                if worker_id == thief_id or self.rows[row + self.JOB] == self.IDLE:
+                    continue
+                
+                remaining = self.rows[row + self.END] - self.rows[row + self.POSITION]
+                if remaining > largest:
+                    victim, largest = row, remaining
+            
+            if victim is None:
+                return None
+            
+            job_id = self.rows[victim + self.JOB]
+            seq = self.rows[victim + self.SEQ]
+            position = self.rows[victim + self.POSITION]
+            end = self.rows[victim + self.END]
+        
+        rule = policy(job_id)
+        if rule is None:
+            return None
+        
+        align, units = rule
+        if largest < 2 * units:
+            return None
+        
+        middle = align(position + largest // 2)
+        
+        with self.lock:
+            # The victim may have claimed past the middle, moved on or been split meanwhile
+            if (self.rows[victim + self.JOB] != job_id or self.rows[victim + self.SEQ] != seq
+                    or self.rows[victim + self.END] != end
+                    or not self.rows[victim + self.POSITION] < middle < end):
+                return None
+            
+            self.rows[victim + self.END] = middle
+            
+            row = self._row(thief_id)
+            self.rows[row + self.JOB] = job_id
+            self.rows[row + self.SEQ] = seq
+            self.rows[row + self.POSITION] = middle
+            self.rows[row + self.END] = end
+        
+        return job_id, seq, middle, end
+    
+    def __len__(self) -> int:
+        return self.workers
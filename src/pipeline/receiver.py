@@ -7,18 +7,29 @@ Description: CSV data receiver and chunking engine
 """
 
 import csv
+import io
 import os
-from typing import List, Dict, Any, Iterator
-from src.utils.chunker import Chunker
+from typing import List, Dict, Any, Callable, IO, Iterable, Iterator, Optional, Tuple, Union
 from src.utils.validator import Validator
 from src.pipeline.logger import Logger
 
 
 class Receiver:
-    """CSV data receiver and chunking engine."""
+    """
+    CSV data receiver and chunking engine.
     
-    def __init__(self, config: Dict[str, Any]):
-        self.csv_path = config['input']['csv_path']
+    Reads `input.csv_path`, or `data` instead: CSV text (str or bytes in
+    `csv_encoding`) or a readable text or binary stream, parsed like the
+    file, or an iterable of ready candidate strings used as they are. A
+    stream is read as records are consumed, so chunks are queued while it
+    is still arriving; streams and iterables allow only one pass.
+    """
+    
+    def __init__(self, config: Dict[str, Any],
+                 data: Union[str, bytes, IO, Iterable[str], None] = None):
+        self.csv_path = config['input'].get('csv_path', '')
+        self.data = data
+        self.name = self.csv_path if data is None else '<memory>'
         self.encoding = config['input'].get('csv_encoding', 'utf-8')
         self.delimiter = config['input'].get('csv_delimiter', ',')
         self.chunk_size = config['general']['chunk_size']
@@ -35,6 +46,9 @@ class Receiver:
         Returns:
             True if valid, False otherwise
         """
+        if self.data is not None:
+            return True
+        
         if not os.path.exists(self.csv_path):
             self.logger.error(f"CSV file not found: {self.csv_path}")
             return False
@@ -57,80 +71,264 @@ class Receiver:
             Number of lines
         """
         try:
-            with open(self.csv_path, 'r', encoding=self.encoding) as f:
+            if self._is_records():
+                return sum(1 for _ in self.data)
+            
+            with self._open() as f:
                 return sum(1 for _ in f)
         except Exception as e:
             self.logger.error(f"Error counting lines: {e}")
             return 0
     
-    def read_all(self) -> List[str]:
+    def _reset_statistics(self) -> None:
+        """Reset line counters before a new pass over the file."""
+        self.total_lines = 0
+        self.valid_lines = 0
+        self.invalid_lines = 0
+    
+    def _is_records(self) -> bool:
+        """Check whether `data` is an iterable of ready records."""
+        return (self.data is not None and not isinstance(self.data, (str, bytes))
+                and not hasattr(self.data, 'read'))
+    
+    def _open(self) -> IO[str]:
+        """Open the CSV text: the file, the stream or the in-memory data."""
+        if self.data is None:
+            return open(self.csv_path, 'r', encoding=self.encoding, newline='')
+        
+        if isinstance(self.data, io.TextIOBase):
+            return self.data
+        
+        if hasattr(self.data, 'read'):
+            return io.TextIOWrapper(self.data, encoding=self.encoding, newline='')
+        
+        text = self.data.decode(self.encoding) if isinstance(self.data, bytes) else self.data
+        return io.StringIO(text, newline='')
+    
+    def _rows(self) -> Iterator[List[str]]:
+        """Iterate the rows of the input; candidate iterables are one-column rows."""
+        if self._is_records():
+            for record in self.data:
+                yield [record]
+            return
+        
+        with self._open() as f:
+            yield from csv.reader(f, delimiter=self.delimiter)
+    
+    def iter_records(self) -> Iterator[str]:
         """
-        Read all valid records from CSV.
+        Stream valid records from CSV one at a time.
         
-        Returns:
-            List of record strings
+        Statistics counters are updated as records are read, so they are
+        complete once the iterator is exhausted.
+        
+        Yields:
+            Record strings
+        
+        Raises:
+            Exception: The input cannot be read to its end; the error is
+                logged first and the records yielded so far are partial
         """
-        records = []
+        self._reset_statistics()
+        
+        try:
+            for line_num, row in enumerate(self._rows(), 1):
+                self.total_lines += 1
+                
+                # Skip empty rows
+                if not row or len(row) == 0:
+                    self.invalid_lines += 1
+                    self.logger.debug(f"Empty row at line {line_num}")
+                    continue
+                
+                # Get first column and strip whitespace
+                record = row[0].strip()
+                
+                # Skip empty or whitespace-only records
+                if not record:
+                    self.invalid_lines += 1
+                    self.logger.debug(f"Empty record at line {line_num}")
+                    continue
+                
+                self.valid_lines += 1
+                yield record
+            
+            self.logger.info(f"Loaded {self.valid_lines} valid records from {self.name}")
+            
+            if self.invalid_lines > 0:
+                self.logger.warning(f"Skipped {self.invalid_lines} invalid lines")
+        
+        except FileNotFoundError:
+            self.logger.error(f"File not found: {self.csv_path}")
+            raise
+        except PermissionError:
+            self.logger.error(f"Permission denied: {self.csv_path}")
+            raise
+        except UnicodeDecodeError as e:
+            self.logger.error(f"Encoding error reading CSV: {e}. Try different encoding.")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error reading CSV: {e}")
+            raise
+    
+    def iter_offsets(self) -> Iterator[Tuple[int, str]]:
+        """
+        Stream valid records together with their byte offset in the file.
+        
+        Records are parsed line by line with the same rules as
+        iter_records(), so quoted fields spanning several lines are not
+        supported. Any offset yielded here can be read back with
+        record_at().
+        
+        Yields:
+            Tuples of (byte offset, record)
+        
+        Raises:
+            Exception: The file cannot be read to its end (logged first)
+        """
+        self._reset_statistics()
         
         try:
-            with open(self.csv_path, 'r', encoding=self.encoding) as f:
-                reader = csv.reader(f, delimiter=self.delimiter)
+            with open(self.csv_path, 'rb') as f:
+                offset = 0
                 
-                for line_num, row in enumerate(reader, 1):
+                for line_num, line in enumerate(f, 1):
+                    line_offset = offset
+                    offset += len(line)
                     self.total_lines += 1
                     
-                    # Skip empty rows
-                    if not row or len(row) == 0:
-                        self.invalid_lines += 1
-                        self.logger.debug(f"Empty row at line {line_num}")
-                        continue
-                    
-                    # Get first column and strip whitespace
-                    record = row[0].strip()
+                    record = self._parse_line(line)
                     
-                    # Skip empty or whitespace-only records
                     if not record:
                         self.invalid_lines += 1
                         self.logger.debug(f"Empty record at line {line_num}")
                         continue
                     
-                    records.append(record)
                     self.valid_lines += 1
+                    yield line_offset, record
             
             self.logger.info(f"Loaded {self.valid_lines} valid records from {self.csv_path}")
             
             if self.invalid_lines > 0:
                 self.logger.warning(f"Skipped {self.invalid_lines} invalid lines")
-            
-            return records
         
         except FileNotFoundError:
             self.logger.error(f"File not found: {self.csv_path}")
-            return []
+            raise
         except PermissionError:
             self.logger.error(f"Permission denied: {self.csv_path}")
-            return []
+            raise
         except UnicodeDecodeError as e:
             self.logger.error(f"Encoding error reading CSV: {e}. Try different encoding.")
-            return []
+            raise
         except Exception as e:
             self.logger.error(f"Error reading CSV: {e}")
-            return []
+            raise
+    
+    def record_at(self, offset: int) -> str:
+        """
+        Read the record of the line starting at a byte offset.
+        
+        Args:
+            offset: Byte offset from iter_offsets()
+        
+        Returns:
+            Record string (empty if the line holds no record)
+        """
+        with open(self.csv_path, 'rb') as f:
+            f.seek(offset)
+            return self._parse_line(f.readline())
+    
+    def _parse_line(self, line: bytes) -> str:
+        """
+        Extract the stripped first column of one raw CSV line.
+        
+        Args:
+            line: Raw line including its line terminator
+        
+        Returns:
+            Record string (empty for blank rows)
+        """
+        text = line.decode(self.encoding).rstrip('\r\n')
+        row = next(csv.reader([text], delimiter=self.delimiter), [])
+        
+        return row[0].strip() if row else ''
+    
+    def read_all(self) -> List[str]:
+        """
+        Read all valid records from CSV.
+        
+        Read errors are logged and end the list early instead of raising.
+        
+        Returns:
+            List of record strings
+        """
+        records = []
+        
+        try:
+            for record in self.iter_records():
+                records.append(record)
+        except Exception:
+            pass  # already logged by iter_records()
+        
+        return records
     
     def read_chunks(self) -> Iterator[List[str]]:
         """
-        Read CSV in chunks for memory efficiency.
+        Stream CSV in chunks without loading the whole file.
+        
+        Only one chunk is held in memory at a time; when the consumer
+        blocks (e.g. on a full TaskQueue) reading pauses as well.
         
         Yields:
             Chunks of records
         """
-        records = self.read_all()
+        for _, chunk in self.read_spans():
+            yield chunk
+    
+    def read_spans(self, chunk_size: Union[int, Callable[[], int], None] = None,
+                   done: Optional[Callable[[int], bool]] = None
+                   ) -> Iterator[Tuple[Tuple[int, int], List[str]]]:
+        """
+        Stream CSV in chunks together with the record positions they cover.
         
-        if not records:
-            return
+        A chunk always covers consecutive records: records for which
+        `done(position)` is true are skipped and end the current chunk.
         
-        for chunk in Chunker.chunk_list(records, self.chunk_size):
-            yield chunk
+        Args:
+            chunk_size: Records per chunk, or a callable returning the size
+                of the next chunk; defaults to `general.chunk_size`
+            done: Optional predicate for records that need no processing
+        
+        Yields:
+            Tuples of ((first position, end position), chunk)
+        """
+        chunk_size = chunk_size or self.chunk_size
+        next_size = chunk_size if callable(chunk_size) else lambda: chunk_size
+        
+        chunk: List[str] = []
+        start = 0
+        size = next_size()
+        
+        for position, record in enumerate(self.iter_records()):
+            if done is not None and done(position):
+                if chunk:
+                    yield (start, position), chunk
+                    chunk = []
+                continue
+            
+            if not chunk:
+                start = position
+            
+            chunk.append(record)
+            
+            if len(chunk) >= size:
+                yield (start, position + 1), chunk
+                chunk = []
+                size = next_size()
+        
+        if chunk:
+            yield (start, start + len(chunk)), chunk
     
     def get_statistics(self) -> Dict[str, int]:
         """
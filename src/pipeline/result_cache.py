@@ -0,0 +1,241 @@
+"""
+Parallel Hash Cracking Engine - Result Cache Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Persistent LRU cache of cracked and known-absent targets
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from src.pipeline.logger import Logger
+from src.pipeline.rules import RuleEngine
+from src.pipeline.target_set import TargetSet
+
+
+class ResultCache:
+    """
+    Results of earlier lookups, shared by every run of a process.
+    
+    A cracked target is cached under (algorithm, hash parameters, target
+    digest) and answers any later run without hashing. A target that a
+    complete run did not find is cached as absent under the same key plus
+    a fingerprint of the candidate content and the input settings, so
+    resubmitting the same wordlist for it skips the work as well.
+    
+    Entries are kept in least recently used order and the oldest are
+    evicted beyond `max_entries`. The cache is written atomically after
+    every stored run; a lost or unreadable file only costs a rerun.
+    """
+    
+    VERSION = 1
+    FOUND, ABSENT = 'found', 'absent'
+    
+    def __init__(self, path: str = '', max_entries: int = 100000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        
+        self.hits = 0
+        self.absent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, path: str, max_entries: int = 100000) -> 'ResultCache':
+        """
+        Load a cache file, starting empty if it is missing or unreadable.
+        
+        Args:
+            path: Cache file path
+            max_entries: Maximum number of entries kept
+        
+        Returns:
+            ResultCache instance
+        """
+        cache = cls(path, max_entries)
+        
+        if not os.path.isfile(path):
+            return cache
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('version') == cls.VERSION:
+                for key, value in data['entries'][-max_entries:]:
+                    cache.entries[key] = value
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            Logger.get_instance().warning(f"Ignoring unreadable result cache {path}: {e}")
+            cache.entries.clear()
+        
+        return cache
+    
+    @staticmethod
+    def fingerprint_of(config: Dict[str, Any], data: Any) -> Optional[str]:
+        """
+        Fingerprint in-memory candidates and the settings that parse them.
+        
+        Args:
+            config: Configuration dictionary
+            data: Candidate CSV as str or bytes
+        
+        Returns:
+            Hex SHA256 fingerprint, or None for candidates that cannot be
+            fingerprinted before they are read (files, streams, iterables)
+        """
+        if not isinstance(data, (str, bytes)):
+            return None
+        
+        input_config = config['input']
+        encoding = input_config.get('csv_encoding', 'utf-8')
+        rules = list(input_config.get('rules', []))
+        
+        if input_config.get('rules_file'):
+            rules.extend(RuleEngine.load_file(input_config['rules_file']))
+        
+        spec = {
+            'encoding': encoding,
+            'delimiter': input_config.get('csv_delimiter', ','),
+            'rules': rules
+        }
+        
+        digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8'))
+        digest.update(data if isinstance(data, bytes) else data.encode(encoding, 'surrogatepass'))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _key(config: Dict[str, Any], algorithm: str, hash_value: str) -> str:
+        """Build the key of a target: algorithm, hash parameters and digest."""
+        params = ''
+        
+        if algorithm == 'PBKDF2':
+            hash_config = config['hash']
+            params = (f"{hash_config.get('pbkdf2_iterations', 100000)}"
+                      f"/{hash_config.get('pbkdf2_salt_length', 32)}")
+        
+        return f"{algorithm}:{params}:{hash_value}"
+    
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+    
+    def _put(self, key: str, value: Dict[str, Any]) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def lookup(self, config: Dict[str, Any], targets: TargetSet,
+               fingerprint: Optional[str] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Answer targets from the cache.
+        
+        Args:
+            config: Configuration dictionary
+            targets: Targets of the run
+            fingerprint: Fingerprint of the candidates, if known
+        
+        Returns:
+            Tuple of (match records of cached targets, hex hashes known
+            to be absent from these candidates)
+        """
+        found = []
+        absent = []
+        
+        with self._lock:
+            for algorithm in targets.active_algorithms():
+                for digest in targets.by_algorithm[algorithm]:
+                    key = self._key(config, algorithm, digest.hex())
+                    value = self._get(key)
+                    
+                    if value is not None:
+                        self.hits += 1
+                        found.append({
+                            'original': value['original'],
+                            'hash': digest.hex(),
+                            'algorithm': algorithm,
+                            'cached': True
+                        })
+                    elif fingerprint is not None and self._get(f"{key}@{fingerprint}") is not None:
+                        self.absent_hits += 1
+                        absent.append(digest.hex())
+                    else:
+                        self.misses += 1
+        
+        return found, absent
+    
+    def store(self, config: Dict[str, Any], matches: Iterable[Dict[str, Any]],
+              absent: Iterable[Tuple[str, str]] = (), fingerprint: Optional[str] = None) -> None:
+        """
+        Cache the outcome of a run.
+        
+        Args:
+            config: Configuration dictionary
+            matches: Match records found by the run
+            absent: (algorithm, hex hash) of targets the complete run did
+                not find
+            fingerprint: Fingerprint of the candidates; absent targets
+                are only cached with one
+        """
+        with self._lock:
+            for record in matches:
+                key = self._key(config, record['algorithm'], record['hash'])
+                self._put(key, {'type': self.FOUND, 'original': record['original']})
+            
+            if fingerprint is not None:
+                for algorithm, hash_value in absent:
+                    key = self._key(config, algorithm, hash_value)
+                    self._put(f"{key}@{fingerprint}", {'type': self.ABSENT})
+    
+    def save(self) -> None:
+        """Write the cache atomically, if it has a path."""
+        if not self.path:
+            return
+        
+        with self._lock:
+            data = {'version': self.VERSION, 'entries': list(self.entries.items())}
+        
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'absent_hits': self.absent_hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+    
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,81 @@
+"""
+Parallel Hash Cracking Engine - Result Channel Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Worker-to-parent result transport over a multiprocessing queue
+"""
+
+import threading
+from multiprocessing import Queue as MPQueue
+from typing import Dict, Any, Callable, Optional
+from src.pipeline.logger import Logger
+
+
+class ResultChannel:
+    """
+    One-way message pipe from workers to the parent process.
+    
+    Workers put messages on an unbounded multiprocessing.Queue, which only
+    appends to a local buffer flushed by a feeder thread, so a burst of
+    matches never blocks hashing. A drain thread in the parent hands each
+    message to the handler, which routes it to the job it belongs to.
+    No Manager server process is involved.
+    
+    Messages are (kind, job_id, payload) tuples:
+        match   payload is {'key': ..., 'record': {...}}
+        task    payload describes one finished task
+        worker  payload holds lifetime statistics of an exiting worker
+    """
+    
+    SENTINEL = None
+    
+    def __init__(self, handler: Callable[[str, Optional[int], Dict[str, Any]], None]):
+        self.queue = MPQueue()
+        self.handler = handler
+        self._thread: Optional[threading.Thread] = None
+    
+    def put(self, kind: str, job_id: Optional[int], payload: Dict[str, Any]) -> None:
+        """
+        Send a message to the parent (called from workers).
+        
+        Args:
+            kind: Message kind ('match', 'task', 'progress' or 'worker')
+            job_id: Job the message belongs to (None for worker messages)
+            payload: Message data
+        """
+        self.queue.put((kind, job_id, payload))
+    
+    def start(self) -> None:
+        """Start draining messages in the parent."""
+        self._thread = threading.Thread(target=self._drain, name='ResultChannel', daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop draining once every message sent so far has been received.
+        
+        Must be called after all workers have exited.
+        
+        Args:
+            timeout: Optional join timeout in seconds
+        """
+        if self._thread is None:
+            return
+        
+        self.queue.put(self.SENTINEL)
+        self._thread.join(timeout)
+        self._thread = None
+    
+    def _drain(self) -> None:
+        """Dispatch incoming messages until the sentinel arrives."""
+        while True:
+            message = self.queue.get()
+            
+            if message is self.SENTINEL:
+                break
+            
+            try:
+                self.handler(*message)
+            except Exception as e:
+                Logger.get_instance().error(f"Error handling {message[0]} message: {e}")
@@ -0,0 +1,285 @@
+"""
+Parallel Hash Cracking Engine - Rule Engine Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Hashcat-style candidate mutation rules compiled once per worker
+"""
+
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
+
+
+class RuleEngine:
+    """
+    Expands base words through hashcat-style rules.
+    
+    Each rule is a sequence of operations, e.g. `c $1 $9` or `sa@ se3`.
+    Rules are parsed and compiled into plain closures once, so applying
+    them to a candidate costs only the string operations themselves.
+    
+    Supported operations (N is a position 0-9 or A-Z):
+        :       no-op                   l  lowercase
+        u       uppercase               c  capitalize
+        C       invert capitalize       t  toggle case
+        TN      toggle case at N        r  reverse
+        d       duplicate               f  reflect (word + reversed)
+        {       rotate left             }  rotate right
+        [       delete first char       ]  delete last char
+        DN      delete char at N        'N truncate to N chars
+        $X      append X                ^X prepend X
+        iNX     insert X at N           oNX overwrite char at N with X
+        sXY     replace all X with Y    @X purge all X
+    """
+    
+    # Number of argument characters each operation takes
+    ARITY = {
+        ':': 0, 'l': 0, 'u': 0, 'c': 0, 'C': 0, 't': 0, 'r': 0, 'd': 0,
+        'f': 0, '{': 0, '}': 0, '[': 0, ']': 0,
+        'T': 1, 'D': 1, "'": 1, '$': 1, '^': 1, '@': 1,
+        'i': 2, 'o': 2, 's': 2
+    }
+    
+    POSITIONAL = {'T', 'D', "'", 'i', 'o'}
+    
+    def __init__(self, rules: List[str], binary: bool = False):
+        self.rules = rules
+        self.binary = binary
+        self.compiled: List[Callable] = [self.compile(rule, binary) for rule in rules]
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], binary: bool = False) -> Optional['RuleEngine']:
+        """
+        Build rule engine from `input.rules` and `input.rules_file`.
+        
+        Args:
+            config: Configuration dictionary
+            binary: True if candidates are bytes
+        
+        Returns:
+            RuleEngine, or None if no rules are configured
+        
+        Raises:
+            ValueError: If a rule cannot be parsed
+        """
+        rules = list(config['input'].get('rules', []))
+        
+        rules_file = config['input'].get('rules_file', '')
+        if rules_file:
+            rules.extend(cls.load_file(rules_file))
+        
+        if not rules:
+            return None
+        
+        return cls(rules, binary)
+    
+    @staticmethod
+    def load_file(path: str) -> List[str]:
+        """
+        Load rules from a file with one rule per line.
+        
+        Blank lines and lines starting with '#' are ignored.
+        
+        Args:
+            path: Path to rule file
+        
+        Returns:
+            List of rule strings
+        """
+        rules = []
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\r\n')
+                
+                if not line.strip() or line.startswith('#'):
+                    continue
+                
+                rules.append(line)
+        
+        return rules
+    
+    @classmethod
+    def parse(cls, rule: str) -> List[tuple]:
+        """
+        Parse a rule into (operation, arguments) pairs.
+        
+        Args:
+            rule: Rule string
+        
+        Returns:
+            List of (op, args) tuples
+        
+        Raises:
+            ValueError: If the rule is malformed
+        """
+        ops = []
+        i = 0
+        
+        while i < len(rule):
+            op = rule[i]
+            i += 1
+            
+            if op in ' \t':
+                continue
+            
+            if op not in cls.ARITY:
+                raise ValueError(f"Unknown rule operation '{op}' in rule '{rule}'")
+            
+            arity = cls.ARITY[op]
+            args = rule[i:i + arity]
+            
+            if len(args) < arity:
+                raise ValueError(f"Missing argument for '{op}' in rule '{rule}'")
+            
+            if op in cls.POSITIONAL:
+                args = (cls._position(args[0], rule),) + tuple(args[1:])
+            else:
+                args = tuple(args)
+            
+            ops.append((op, args))
+            i += arity
+        
+        return ops
+    
+    @staticmethod
+    def _position(char: str, rule: str) -> int:
+        """Decode position character (0-9, A-Z)."""
+        if char.isdigit():
+            return int(char)
+        
+        if 'A' <= char <= 'Z':
+            return ord(char) - ord('A') + 10
+        
+        raise ValueError(f"Invalid position '{char}' in rule '{rule}'")
+    
+    @classmethod
+    def compile(cls, rule: str, binary: bool = False) -> Callable:
+        """
+        Compile a rule into a single callable.
+        
+        Args:
+            rule: Rule string
+            binary: True to compile for bytes candidates
+        
+        Returns:
+            Function mapping a candidate to its mutated form
+        """
+        funcs = [cls._compile_op(op, args, binary) for op, args in cls.parse(rule)]
+        funcs = [func for func in funcs if func is not None]
+        
+        if not funcs:
+            return lambda word: word
+        
+        if len(funcs) == 1:
+            return funcs[0]
+        
+        def apply(word):
+            for func in funcs:
+                word = func(word)
+            return word
+        
+        return apply
+    
+    @staticmethod
+    def _compile_op(op: str, args: tuple, binary: bool) -> Optional[Callable]:
+        """Build the closure for one operation."""
+        def arg(value: str):
+            return value.encode('utf-8') if binary else value
+        
+        if op == ':':
+            return None
+        if op == 'l':
+            return lambda w: w.lower()
+        if op == 'u':
+            return lambda w: w.upper()
+        if op == 'c':
+            return lambda w: w.capitalize()
+        if op == 'C':
+            return lambda w: w[:1].lower() + w[1:].upper()
+        if op == 't':
+            return lambda w: w.swapcase()
+        if op == 'r':
+            return lambda w: w[::-1]
+        if op == 'd':
+            return lambda w: w + w
+        if op == 'f':
+            return lambda w: w + w[::-1]
+        if op == '{':
+            return lambda w: w[1:] + w[:1]
+        if op == '}':
+            return lambda w: w[-1:] + w[:-1]
+        if op == '[':
+            return lambda w: w[1:]
+        if op == ']':
+            return lambda w: w[:-1]
+        
+        if op == 'T':
+            n = args[0]
+            return lambda w: w[:n] + w[n:n + 1].swapcase() + w[n + 1:]
+        if op == 'D':
+            n = args[0]
+            return lambda w: w[:n] + w[n + 1:]
+        if op == "'":
+            n = args[0]
+            return lambda w: w[:n]
+        if op == 'i':
+            n, x = args[0], arg(args[1])
+            return lambda w: w[:n] + x + w[n:] if n <= len(w) else w
+        if op == 'o':
+            n, x = args[0], arg(args[1])
+            return lambda w: w[:n] + x + w[n + 1:] if n < len(w) else w
+        
+        if op == '$':
+            x = arg(args[0])
+            return lambda w: w + x
+        if op == '^':
+            x = arg(args[0])
+            return lambda w: x + w
+        if op == 's':
+            x, y = arg(args[0]), arg(args[1])
+            return lambda w: w.replace(x, y)
+        if op == '@':
+            x, empty = arg(args[0]), arg('')
+            return lambda w: w.replace(x, empty)
+        
+        raise ValueError(f"Unknown rule operation '{op}'")
+    
+    def apply(self, word) -> List:
+        """
+        Apply every rule to one word.
+        
+        Args:
+            word: Base word
+        
+        Returns:
+            List of mutated candidates (one per rule)
+        """
+        return [rule(word) for rule in self.compiled]
+    
+    def expand(self, words: Iterable) -> Iterator:
+        """
+        Expand base words through all rules.
+        
+        Bytes-like items (e.g. memoryview slices) are converted to bytes
+        once per base word when compiled for binary candidates.
+        
+        Args:
+            words: Base words
+        
+        Yields:
+            Mutated candidates, rules applied in order for each word
+        """
+        compiled = self.compiled
+        
+        if self.binary:
+            for word in words:
+                word = bytes(word)
+                for rule in compiled:
+                    yield rule(word)
+        else:
+            for word in words:
+                for rule in compiled:
+                    yield rule(word)
+    
+    def __len__(self) -> int:
+        return len(self.compiled)
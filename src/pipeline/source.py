@@ -0,0 +1,163 @@
+"""
+Parallel Hash Cracking Engine - Candidate Source Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Base class for candidate inputs that workers read by range
+"""
+
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+from src.utils.chunker import Chunker
+
+
+class CandidateSource:
+    """
+    Candidate input addressed by (start, end) ranges.
+    
+    Instead of pickling candidate lists through the TaskQueue, the pipeline
+    queues only range tuples and every Worker produces the candidates of
+    its range itself.
+    """
+    
+    # True when candidates are produced as bytes instead of str
+    binary = False
+    
+    # Approximate range units per candidate, used to size work claims
+    units_per_item = 1
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.chunk_size = config['general']['chunk_size']
+    
+    def validate(self) -> bool:
+        """
+        Check that the source can be read.
+        
+        Returns:
+            True if valid, False otherwise
+        """
+        return True
+    
+    def open(self) -> None:
+        """Acquire per-process resources (called inside the worker)."""
+    
+    def close(self) -> None:
+        """Release per-process resources."""
+    
+    def total(self) -> int:
+        """
+        Get size of the source in range units.
+        
+        Returns:
+            Upper bound (exclusive) of the addressable range
+        """
+        raise NotImplementedError
+    
+    def bounds(self) -> Tuple[int, int]:
+        """
+        Get the slice of the source this run covers.
+        
+        `input.keyspace_start` / `input.keyspace_end` restrict the run to
+        a slice of the keyspace, so any range can be resumed or re-split
+        exactly.
+        
+        Returns:
+            Tuple of (start, end)
+        """
+        total = self.total()
+        start = self.config['input'].get('keyspace_start', 0)
+        end = min(self.config['input'].get('keyspace_end') or total, total)
+        
+        return start, end
+    
+    def ranges(self, chunk_size: Union[int, Callable[[], int], None] = None,
+               span: Optional[Tuple[int, int]] = None) -> Iterator[tuple]:
+        """
+        Split the source, or one span of it, into work ranges.
+        
+        Args:
+            chunk_size: Range size, or a callable returning the size of the
+                next range; defaults to `general.chunk_size`
+            span: (start, end) to split; defaults to bounds()
+        
+        Yields:
+            Tuples of (start, end)
+        """
+        start, end = span or self.bounds()
+        
+        return Chunker.chunk_range(start, end, chunk_size or self.chunk_size)
+    
+    def align(self, offset: int) -> int:
+        """
+        Move a split point forward to the next valid range boundary.
+        
+        Every index of a keyspace is a boundary; file sources move the
+        point to the start of the next line.
+        
+        Args:
+            offset: Nominal split point
+        
+        Returns:
+            Aligned split point
+        """
+        return offset
+    
+    def indexed(self, start: int, end: int) -> Iterator[Tuple[int, Any]]:
+        """
+        Produce candidates of a range together with their index.
+        
+        The default assumes every index in the range yields exactly one
+        candidate; sources that skip indexes override it.
+        
+        Args:
+            start: Range start (inclusive)
+            end: Range end (exclusive)
+        
+        Returns:
+            Iterator of (index, candidate) tuples
+        """
+        return enumerate(self.candidates(start, end), start)
+    
+    def candidates(self, start: int, end: int) -> Iterable:
+        """
+        Produce candidates of a range.
+        
+        Args:
+            start: Range start (inclusive)
+            end: Range end (exclusive)
+        
+        Returns:
+            Iterable of candidates
+        """
+        raise NotImplementedError
+    
+    @staticmethod
+    def create(config: Dict[str, Any]) -> Optional['CandidateSource']:
+        """
+        Create source for the configured input mode.
+        
+        Args:
+            config: Configuration dictionary
+        
+        Returns:
+            CandidateSource, or None for the default CSV mode
+        """
+        mode = config['input'].get('mode', 'csv')
+        
+        if mode == 'sharded':
+            from src.pipeline.file_source import FileRangeSource
+            return FileRangeSource(config)
+        
+        if mode == 'wordlist':
+            from src.pipeline.wordlist_source import WordlistSource
+            return WordlistSource(config)
+        
+        if mode == 'birth_numbers':
+            from src.pipeline.birth_number_source import BirthNumberSource
+            return BirthNumberSource(config)
+        
+        if mode == 'mask':
+            from src.pipeline.mask_source import MaskSource
+            return MaskSource(config)
+        
+        return None
@@ -0,0 +1,40 @@
+"""
+Parallel Hash Cracking Engine - Stop Signal Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Shared per-job early-termination flags raised once all targets are cracked
+"""
+
+from multiprocessing.sharedctypes import RawArray
+
+
+class StopSignal:
+    """
+    Cross-process stop flags for early termination.
+    
+    One byte per job slot of the worker pool. The array is allocated
+    before the workers fork, so they inherit it and polling a flag is a
+    plain memory read without locks or pipe round trips. The parent
+    raises a job's flag as soon as every target of that job is cracked;
+    workers check it between batches and the producer stops queueing
+    new work.
+    """
+    
+    def __init__(self, slots: int = 1):
+        self.flags = RawArray('b', slots)
+    
+    def is_set(self, slot: int = 0) -> bool:
+        """Check whether work on a job slot should stop."""
+        return self.flags[slot] != 0
+    
+    def set(self, slot: int = 0) -> None:
+        """Raise the signal for a job slot."""
+        self.flags[slot] = 1
+    
+    def clear(self, slot: int = 0) -> None:
+        """Reset the signal before a slot is reused."""
+        self.flags[slot] = 0
+    
+    def __len__(self) -> int:
+        return len(self.flags)
@@ -0,0 +1,246 @@
+"""
+Parallel Hash Cracking Engine - Target Set Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Compact in-memory set of target digests for O(1) lookup
+"""
+
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Union
+from src.utils.validator import Validator
+
+
+class TargetSet:
+    """
+    Set of target hashes stored as raw digest bytes.
+    
+    Targets are decoded from hex once when loaded, so workers can test
+    every computed digest with a single set lookup regardless of how
+    many targets are being searched for.
+    
+    PBKDF2 targets (salt + key) are additionally split once into
+    `salts`, mapping each unique salt to the keys derived with it, so a
+    candidate is derived once per salt instead of once per target.
+    
+    One set may mix algorithms. A target is either tagged as
+    `ALGORITHM:hex` or its algorithm is inferred from its length: the
+    first of the configured algorithms it is valid for wins. Tagged
+    targets may add algorithms that were not configured.
+    """
+    
+    def __init__(self, algorithm: Union[str, List[str]], salt_length: int = 32):
+        self.algorithms: List[str] = [algorithm] if isinstance(algorithm, str) else list(algorithm)
+        self.algorithm = self.algorithms[0]
+        self.salt_length = salt_length
+        self.digests: Set[bytes] = set()
+        self.by_algorithm: Dict[str, Set[bytes]] = {}
+        self.salts: Dict[bytes, Set[bytes]] = {}
+        self.invalid_count = 0
+    
+    def add(self, hash_value: str, algorithm: Optional[str] = None) -> bool:
+        """
+        Add a hex encoded target hash.
+        
+        Args:
+            hash_value: Hex hash string, optionally tagged as `ALGORITHM:hex`
+            algorithm: Explicit algorithm (overrides tag and inference)
+        
+        Returns:
+            True if added, False if the hash is invalid for its algorithm
+        """
+        hash_value = hash_value.strip()
+        
+        if ':' in hash_value:
+            tag, hash_value = hash_value.split(':', 1)
+            algorithm = algorithm or tag.strip().upper()
+        
+        hash_value = hash_value.strip().lower()
+        
+        if algorithm is None:
+            algorithm = self.infer_algorithm(hash_value)
+        
+        if algorithm is None or not Validator.is_valid_hash(hash_value, algorithm):
+            self.invalid_count += 1
+            return False
+        
+        try:
+            digest = bytes.fromhex(hash_value)
+        except ValueError:
+            self.invalid_count += 1
+            return False
+        
+        if algorithm == 'PBKDF2':
+            if len(digest) <= self.salt_length:
+                self.invalid_count += 1
+                return False
+            
+            salt = digest[:self.salt_length]
+            self.salts.setdefault(salt, set()).add(digest[self.salt_length:])
+        
+        if algorithm not in self.algorithms:
+            self.algorithms.append(algorithm)
+        
+        self.by_algorithm.setdefault(algorithm, set()).add(digest)
+        self.digests.add(digest)
+        return True
+    
+    def infer_algorithm(self, hash_value: str) -> Optional[str]:
+        """
+        Infer the algorithm of an untagged hash from its length.
+        
+        Args:
+            hash_value: Hex hash string
+        
+        Returns:
+            First configured algorithm the hash is valid for, or None
+        """
+        for algorithm in self.algorithms:
+            if Validator.is_valid_hash(hash_value, algorithm):
+                return algorithm
+        
+        return None
+    
+    def algorithm_of(self, digest: bytes) -> Optional[str]:
+        """
+        Get the algorithm a target digest belongs to.
+        
+        Args:
+            digest: Raw target digest
+        
+        Returns:
+            Algorithm name, or None if the digest is not a target
+        """
+        for algorithm, digests in self.by_algorithm.items():
+            if digest in digests:
+                return algorithm
+        
+        return None
+    
+    def active_algorithms(self) -> List[str]:
+        """
+        Get the algorithms that have at least one target.
+        
+        Returns:
+            Algorithm names in configured order
+        """
+        return [algorithm for algorithm in self.algorithms if self.by_algorithm.get(algorithm)]
+    
+    def load_file(self, path: str, encoding: str = 'utf-8') -> int:
+        """
+        Load target hashes from a file with one hex hash per line.
+        
+        Blank lines and lines starting with '#' are ignored.
+        
+        Args:
+            path: Path to target file
+            encoding: File encoding
+        
+        Returns:
+            Number of hashes added
+        """
+        added = 0
+        
+        with open(path, 'r', encoding=encoding) as f:
+            for line in f:
+                line = line.strip()
+                
+                if not line or line.startswith('#'):
+                    continue
+                
+                if self.add(line):
+                    added += 1
+        
+        return added
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'TargetSet':
+        """
+        Build target set from configuration.
+        
+        Combines `target.hash_to_find` and the contents of `target.hash_file`.
+        Untagged hashes are matched against `hash.algorithms` if set,
+        otherwise against `hash.algorithm`.
+        
+        Args:
+            config: Configuration dictionary
+        
+        Returns:
+            Loaded TargetSet
+        """
+        target_config = config.get('target', {})
+        targets = cls(
+            config['hash'].get('algorithms') or config['hash']['algorithm'],
+            config['hash'].get('pbkdf2_salt_length', 32)
+        )
+        
+        hash_to_find = target_config.get('hash_to_find', '')
+        if hash_to_find:
+            targets.add(hash_to_find)
+        
+        hash_file = target_config.get('hash_file', '')
+        if hash_file:
+            targets.load_file(hash_file, target_config.get('hash_file_encoding', 'utf-8'))
+        
+        return targets
+    
+    def to_hex(self) -> List[str]:
+        """
+        Get all targets as sorted hex strings.
+        
+        Returns:
+            List of hex hashes
+        """
+        return sorted(digest.hex() for digest in self.digests)
+    
+    def remaining(self, cracked_hashes: Iterable[str]) -> List[str]:
+        """
+        Get targets that are not in the given cracked hashes.
+        
+        Args:
+            cracked_hashes: Hex hashes that were found
+        
+        Returns:
+            Sorted list of uncracked hex hashes
+        """
+        cracked = set()
+        for hash_value in cracked_hashes:
+            try:
+                cracked.add(bytes.fromhex(hash_value))
+            except ValueError:
+                continue
+        
+        return sorted(digest.hex() for digest in self.digests - cracked)
+    
+    def without(self, hash_values: Iterable[str]) -> 'TargetSet':
+        """
+        Get a copy of the set without the given targets.
+        
+        Args:
+            hash_values: Hex hashes to leave out
+        
+        Returns:
+            New TargetSet with the same algorithms and salt length
+        """
+        excluded = set()
+        for hash_value in hash_values:
+            try:
+                excluded.add(bytes.fromhex(hash_value))
+            except ValueError:
+                continue
+        
+        targets = TargetSet(self.algorithms, self.salt_length)
+        
+        for algorithm, digests in self.by_algorithm.items():
+            for digest in digests - excluded:
+                targets.add(digest.hex(), algorithm)
+        
+        return targets
+    
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self.digests
+    
+    def __len__(self) -> int:
+        return len(self.digests)
+    
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.digests)
@@ -6,33 +6,108 @@ Date: November 2025
 Description: Thread-safe task queue implementation using multiprocessing.Queue
 """
 
-from multiprocessing import Queue as MPQueue
+import time
+from collections import deque
+from multiprocessing import Lock, Queue as MPQueue
+from multiprocessing.sharedctypes import RawArray
+from queue import Empty, Full
 from typing import Any, Optional
 from src.pipeline.logger import Logger
 
 
+class _Batch(list):
+    """Several tasks sent as one queue message."""
+
+
 class TaskQueue:
-    """Thread-safe task queue using multiprocessing.Queue."""
+    """
+    Thread-safe task queue using multiprocessing.Queue.
+    
+    A bounded queue blocks the producer while `maxsize` tasks wait, so
+    the input is never read far ahead of the workers. put_many() sends
+    tasks in batches of `batch_size` per message, which pickles and
+    pipes many small chunks at once; a consumer keeps the rest of a
+    batch in a local buffer and hands the tasks out one by one.
+    
+    Counters live in shared memory created before the workers fork, so
+    get_statistics() in the parent sees tasks taken by any worker.
+    """
     
     POISON_PILL = None
+    EMPTY = object()  # returned by poll() on timeout, never queued
     
-    def __init__(self):
-        self.queue = MPQueue()
+    # Slots of the shared counter array
+    ADDED, COMPLETED, PEAK_DEPTH, STALLS, STALL_SECONDS = range(5)
+    
+    def __init__(self, maxsize: int = 0, batch_size: int = 1):
+        self.maxsize = maxsize
+        self.batch_size = max(1, batch_size)
+        
+        # The pipe holds messages; keep the bound in tasks
+        messages = -(-maxsize // self.batch_size) if maxsize > 0 else 0
+        self.capacity = messages * self.batch_size
+        self.queue = MPQueue(messages)
         self.logger = Logger.get_instance()
-        self.tasks_added = 0
-        self.tasks_completed = 0
+        self.counters = RawArray('d', 5)
+        self.counters_lock = Lock()
+        self._buffer: deque = deque()  # rest of a received batch, per process
+    
+    @property
+    def tasks_added(self) -> int:
+        """Tasks queued by any producer."""
+        return int(self.counters[self.ADDED])
+    
+    @property
+    def tasks_completed(self) -> int:
+        """Tasks taken from the queue by any consumer."""
+        return int(self.counters[self.COMPLETED])
+    
+    def _send(self, message: Any, tasks: int) -> None:
+        """Put one message, timing how long a full queue blocks it."""
+        try:
+            self.queue.put(message, block=False)
+        except Full:
+            started = time.monotonic()
+            self.queue.put(message)
+            stalled = time.monotonic() - started
+            
+            with self.counters_lock:
+                self.counters[self.STALLS] += 1
+                self.counters[self.STALL_SECONDS] += stalled
+        
+        with self.counters_lock:
+            self.counters[self.ADDED] += tasks
+            depth = self.counters[self.ADDED] - self.counters[self.COMPLETED]
+            
+            # A consumer frees its slot just before counting the task
+            if self.capacity:
+                depth = min(depth, self.capacity)
+            self.counters[self.PEAK_DEPTH] = max(self.counters[self.PEAK_DEPTH], depth)
+    
+    def _received(self, message: Any) -> Any:
+        """Unpack a received message and count the task handed out."""
+        if isinstance(message, _Batch):
+            self._buffer.extend(message[1:])
+            message = message[0]
+        
+        if message is not self.POISON_PILL:
+            with self.counters_lock:
+                self.counters[self.COMPLETED] += 1
+        
+        return message
     
     def put(self, task: Any) -> None:
         """
         Add task to queue for worker processing.
         
         This method is thread-safe and can be called from multiple processes.
+        Blocks while a bounded queue is full, which throttles the producer
+        to the rate at which workers drain tasks.
         
         Args:
             task: Task data to add (typically a chunk of data)
         """
-        self.queue.put(task)
-        self.tasks_added += 1
+        self._send(task, 1)
     
     def get(self, timeout: Optional[float] = None) -> Any:
         """
@@ -47,24 +122,54 @@ class TaskQueue:
         Returns:
             Task data or POISON_PILL if queue is terminating
         """
+        if self._buffer:
+            return self._received(self._buffer.popleft())
+        
         try:
-            task = self.queue.get(timeout=timeout)
-            if task is not self.POISON_PILL:
-                self.tasks_completed += 1
-            return task
+            return self._received(self.queue.get(timeout=timeout))
         except Exception as e:
             self.logger.error(f"Error getting task from queue: {e}")
             return self.POISON_PILL
     
+    def poll(self, timeout: float) -> Any:
+        """
+        Retrieve a task, giving up quietly after a timeout.
+        
+        Unlike get(), an empty queue is an expected outcome here and is
+        neither logged nor turned into a poison pill.
+        
+        Args:
+            timeout: Maximum wait in seconds
+        
+        Returns:
+            Task data, POISON_PILL, or EMPTY if no task arrived in time
+        """
+        if self._buffer:
+            return self._received(self._buffer.popleft())
+        
+        try:
+            message = self.queue.get(timeout=timeout)
+        except Empty:
+            return self.EMPTY
+        
+        return self._received(message)
+    
     def put_many(self, tasks: list) -> None:
         """
-        Add multiple tasks to queue.
+        Add multiple tasks to queue, `batch_size` tasks per message.
+        
+        Blocks while a bounded queue is full, like put().
         
         Args:
             tasks: List of tasks to add
         """
-        for task in tasks:
-            self.put(task)
+        for i in range(0, len(tasks), self.batch_size):
+            batch = tasks[i:i + self.batch_size]
+            
+            if len(batch) == 1:
+                self._send(batch[0], 1)
+            else:
+                self._send(_Batch(batch), len(batch))
         
         self.logger.debug(f"Added {len(tasks)} tasks to queue")
     
@@ -82,12 +187,15 @@ class TaskQueue:
     
     def size(self) -> int:
         """
-        Get approximate queue size.
+        Get the number of tasks waiting, from the shared counters.
+        
+        Unlike Queue.qsize() this also works on macOS and counts the
+        tasks inside batches.
         
         Returns:
             Queue size
         """
-        return self.queue.qsize()
+        return self.tasks_added - self.tasks_completed
     
     def is_empty(self) -> bool:
         """
@@ -96,7 +204,7 @@ class TaskQueue:
         Returns:
             True if empty, False otherwise
         """
-        return self.queue.empty()
+        return self.size() <= 0
     
     def get_statistics(self) -> dict:
         """
@@ -105,8 +213,15 @@ class TaskQueue:
         Returns:
             Dictionary with statistics
         """
+        counters = self.counters
+        
         return {
             'tasks_added': self.tasks_added,
             'tasks_completed': self.tasks_completed,
-            'current_size': self.size()
+            'current_size': self.size(),
+            'peak_size': int(counters[self.PEAK_DEPTH]),
+            'maxsize': self.maxsize,
+            'batch_size': self.batch_size,
+            'producer_stalls': int(counters[self.STALLS]),
+            'producer_stall_seconds': counters[self.STALL_SECONDS]
         }
@@ -0,0 +1,148 @@
+"""
+Parallel Hash Cracking Engine - Wordlist Source Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Memory-mapped, zero-copy reader for newline-delimited wordlists
+"""
+
+import mmap
+from typing import Dict, Any, Iterator, Optional, Tuple
+from src.pipeline.file_source import FileRangeSource
+
+
+class WordlistSource(FileRangeSource):
+    """
+    Plain wordlist read through mmap.
+    
+    Each line is yielded as a memoryview slice of the mapping, so
+    candidates go straight to hashlib without creating str objects or
+    copying bytes. Lines are taken verbatim apart from the line ending;
+    empty lines are skipped.
+    """
+    
+    binary = True
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+    
+    def open(self) -> None:
+        """Map the wordlist into memory."""
+        self._file = open(self.csv_path, 'rb')
+        
+        if self.total() > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+    
+    def close(self) -> None:
+        """Unmap the wordlist."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        
+        super().close()
+    
+    def align(self, offset: int) -> int:
+        """Move a split point to the next line start using the mapping."""
+        if self._mmap is None:
+            return super().align(offset)
+        
+        size = len(self._mmap)
+        if offset >= size:
+            return size
+        
+        newline = self._mmap.find(b'\n', offset - 1)
+        return size if newline == -1 else newline + 1
+    
+    def candidates(self, start: int, end: int) -> Iterator[memoryview]:
+        """
+        Iterate the lines of a byte range as memoryview slices.
+        
+        Args:
+            start: Start offset (inclusive)
+            end: End offset (exclusive)
+        
+        Yields:
+            Line contents without the line ending
+        """
+        if self._mmap is None:
+            return
+        
+        mm = self._mmap
+        view = self._view
+        pos = start
+        
+        while pos < end:
+            newline = mm.find(b'\n', pos, end)
+            line_end = end if newline == -1 else newline
+            next_pos = line_end + 1
+            
+            if line_end > pos and mm[line_end - 1] == 0x0D:
+                line_end -= 1
+            
+            if line_end > pos:
+                yield view[pos:line_end]
+            
+            pos = next_pos
+    
+    def indexed(self, start: int, end: int) -> Iterator[Tuple[int, memoryview]]:
+        """
+        Iterate the lines of a byte range together with their offset.
+        
+        Lines are the same as candidates() yields, so an offset can be
+        read back with line_at().
+        
+        Args:
+            start: Start offset (inclusive)
+            end: End offset (exclusive)
+        
+        Yields:
+            Tuples of (line offset, line contents without the line ending)
+        """
+        if self._mmap is None:
+            return
+        
+        mm = self._mmap
+        view = self._view
+        pos = start
+        
+        while pos < end:
+            newline = mm.find(b'\n', pos, end)
+            line_end = end if newline == -1 else newline
+            next_pos = line_end + 1
+            
+            if line_end > pos and mm[line_end - 1] == 0x0D:
+                line_end -= 1
+            
+            if line_end > pos:
+                yield pos, view[pos:line_end]
+            
+            pos = next_pos
+    
+    def line_at(self, offset: int) -> Optional[bytes]:
+        """
+        Read the line starting at a byte offset, as candidates() yields it.
+        
+        Args:
+            offset: Line offset from indexed()
+        
+        Returns:
+            Line bytes, or None if the line is empty
+        """
+        for line in self.candidates(offset, self.align(offset + 1)):
+            with line:
+                return bytes(line)
+        
+        return None
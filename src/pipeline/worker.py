@@ -6,33 +6,88 @@ Date: November 2025
 Description: Worker process for parallel hash computation and comparison
 """
 
-from multiprocessing import Process
-from typing import Dict, Any, List
+from itertools import islice
+import time
+from multiprocessing import Process, Queue as MPQueue
+from queue import Empty
+from typing import Dict, Any, Iterable, List, Optional, Union
+from src.pipeline.chunk_arena import ChunkArena, SharedChunk
 from src.pipeline.hasher import Hasher
+from src.pipeline.job import Job
+from src.pipeline.multi_hasher import MultiHasher
+from src.pipeline.range_board import RangeBoard
+from src.pipeline.result_channel import ResultChannel
+from src.pipeline.rules import RuleEngine
+from src.pipeline.source import CandidateSource
+from src.pipeline.stop_signal import StopSignal
+from src.pipeline.target_set import TargetSet
 from src.pipeline.task_queue import TaskQueue
 from src.pipeline.logger import Logger
 from src.utils.timer import Timer
 
 
 class Worker(Process):
-    """Worker process for parallel hash computation and comparison."""
+    """
+    Long-lived worker process of the worker pool.
     
-    def __init__(self, worker_id: int, task_queue: TaskQueue, results_dict: dict,
-                 target_hash: str, config: Dict[str, Any]):
+    A worker is not bound to a single run: it keeps serving tasks of any
+    job registered with the pool until it receives the poison pill. Tasks
+    arrive as (job_id, seq, payload) tuples; the job spec itself (config,
+    targets, source) is received once per job over the worker's control
+    queue, or inherited at fork for jobs created before the pool started.
+    Hashers are cached per hash configuration, so a new job with the same
+    algorithm starts hashing immediately.
+    
+    With a ChunkArena, list tasks arrive as SharedChunk references and
+    their items are hashed as bytes straight from shared memory, unless
+    the job has rules: those are decoded first, so rules act on the same
+    words whether or not the arena is used.
+    
+    With a RangeBoard, range tasks are walked in small claims and a worker
+    that finds the task queue empty steals the upper half of the largest
+    unclaimed remainder of another worker's range. For a checkpointed job
+    the finished claims are reported as `progress` at most once per
+    `checkpoint_interval`, so an interrupted run keeps the work done
+    inside ranges it did not finish.
+    """
+    
+    # Seconds an idle worker waits for a task before trying to steal
+    STEAL_INTERVAL = 0.05
+    
+    def __init__(self, worker_id: int, task_queue: TaskQueue, results: ResultChannel,
+                 control_queue: MPQueue, stop_signal: StopSignal, config: Dict[str, Any],
+                 jobs: Optional[Dict[int, Job]] = None, board: Optional[RangeBoard] = None,
+                 arena: Optional[ChunkArena] = None):
         super().__init__()
         
         self.worker_id = worker_id
         self.task_queue = task_queue
-        self.results_dict = results_dict
-        self.target_hash = target_hash.lower()
+        self.results = results
+        self.control_queue = control_queue
+        self.stop_signal = stop_signal
         self.config = config
+        self.board = board
+        self.arena = arena
+        
+        # Jobs registered before the pool started (inherited at fork)
+        self.jobs: Dict[int, Job] = dict(jobs or {})
+        self.hashers: Dict[tuple, Union[Hasher, MultiHasher]] = {}
         
+        # Currently active job, set by _activate()
+        self.job: Optional[Job] = None
+        self.targets: Optional[TargetSet] = None
+        self.source: Optional[CandidateSource] = None
+        self.hasher: Optional[Union[Hasher, MultiHasher]] = None
+        self.rules: Optional[RuleEngine] = None
         self.algorithm = config['hash']['algorithm']
-        self.iterations = config['hash'].get('pbkdf2_iterations', 100000)
-        self.salt_length = config['hash'].get('pbkdf2_salt_length', 32)
+        self.binary = False
+        self.encoding = 'utf-8'
+        self.stop_check_items = 1024
         
         self.items_processed = 0
         self.matches_found = 0
+        self.tasks_processed = 0
+        self.ranges_stolen = 0
     
     def run(self) -> None:
         """Main worker process loop."""
@@ -41,87 +96,498 @@ class Worker(Process):
             self.config['output']['verbose']
         )
         
-        hasher = Hasher(
-            algorithm=self.algorithm,
-            iterations=self.iterations,
-            salt_length=self.salt_length
-        )
-        
         logger.log_worker_start(self.worker_id, "waiting for tasks")
         timer = Timer()
         timer.start()
         
-        timeout = self.config['general'].get('worker_timeout', 5)
-        
-        while True:
-            task = self.task_queue.get(timeout=timeout)
+        try:
+            for job in list(self.jobs.values()):
+                self._prepare(job)
             
-            if task is TaskQueue.POISON_PILL:
-                logger.debug(f"Worker {self.worker_id} received poison pill")
-                break
+            while True:
+                if self.board is None:
+                    task = self.task_queue.get()
+                else:
+                    task = self.task_queue.poll(self.STEAL_INTERVAL)
+                
+                if task is TaskQueue.EMPTY:
+                    self._steal(logger)
+                    continue
+                
+                if task is TaskQueue.POISON_PILL:
+                    logger.debug(f"Worker {self.worker_id} received poison pill")
+                    break
+                
+                job_id, seq, payload = task
+                self._process_task(job_id, seq, payload, logger)
+        finally:
+            for job_id in list(self.jobs):
+                self._release(job_id)
             
-            chunk_data: List[str] = task
-            self._process_chunk(chunk_data, hasher, logger)
+            if self.arena is not None:
+                self.arena.detach()
         
         duration = timer.stop()
         logger.log_worker_complete(self.worker_id, duration, self.items_processed)
+        
+        self.results.put('worker', None, self.get_statistics())
+    
+    def _process_task(self, job_id: int, seq: int, payload: Any, logger: Logger) -> None:
+        """
+        Process one task of a job and report its completion.
+        
+        Every task is acknowledged, even when skipped because its job was
+        stopped, so the pool can tell when a job is complete.
+        
+        Args:
+            job_id: Job the task belongs to
+            seq: Task sequence number within the job
+            payload: (start, end) range for range sources, SharedChunk or
+                list of items otherwise
+            logger: Logger instance
+        """
+        self._activate(job_id)
+        
+        items_before = self.items_processed
+        matches_before = self.matches_found
+        timer = Timer()
+        timer.start()
+        span = payload if isinstance(payload, tuple) else None
+        owned = None
+        
+        if isinstance(payload, tuple) and self.board is not None:
+            self.board.begin(self.worker_id, job_id, seq, *payload)
+            span, owned = self._process_range(payload[0], logger)
+        
+        # Skip remaining tasks without work once everything is cracked
+        elif not self._should_stop():
+            if isinstance(payload, tuple):
+                chunk_data = self.source.candidates(*payload)
+            elif isinstance(payload, SharedChunk):
+                chunk_data = self.arena.items(payload)
+                
+                if not self.binary:
+                    chunk_data = (item.decode('utf-8') for item in chunk_data)
+            else:
+                chunk_data = payload
+            
+            self._process_chunk(chunk_data, self.hasher, logger)
+        
+        self.tasks_processed += 1
+        self.results.put('task', job_id, {
+            'worker_id': self.worker_id,
+            'seq': seq,
+            'items': self.items_processed - items_before,
+            'matches': self.matches_found - matches_before,
+            'seconds': timer.stop(),
+            'span': span,
+            'owned': owned
+        })
+    
+    def _process_range(self, start: int, logger: Logger) -> tuple:
+        """
+        Walk the range published on the board in small claims.
+        
+        Claims of `stop_check_items` candidates keep the unclaimed rest
+        of the range available to idle workers until the very end. Claims
+        are taken in order from `start`, so the claims finished so far
+        form one span that can be checkpointed before the range is done.
+        
+        Args:
+            start: Range start, as published on the board
+            logger: Logger instance
+        
+        Returns:
+            Tuple of ((start, end) processed, (start, end) owned after splits)
+        """
+        units = self._claim_units(self.job)
+        interval = self._progress_interval(self.job)
+        reported = start
+        last_report = time.monotonic()
+        
+        while not self._should_stop():
+            claim = self.board.claim(self.worker_id, units, self.source.align)
+            if claim is None:
+                break
+            
+            self._process_chunk(self.source.candidates(*claim), self.hasher, logger)
+            
+            # A claim cut short by the stop signal is not finished
+            if interval is not None and not self._should_stop() \
+                    and time.monotonic() - last_report >= interval:
+                self.results.put('progress', self.job.job_id, {'span': (reported, claim[1])})
+                reported = claim[1]
+                last_report = time.monotonic()
+        
+        position, end = self.board.finish(self.worker_id)
+        return (start, position), (start, end)
     
-    def _process_chunk(self, chunk: List[str], hasher: Hasher, logger: Logger) -> None:
+    def _steal(self, logger: Logger) -> bool:
+        """
+        Take half of another worker's remaining range while idle.
+        
+        The stolen piece belongs to the victim's task (same seq) and is
+        acknowledged separately with the part of the range it owned.
+        
+        Args:
+            logger: Logger instance
+        
+        Returns:
+            True if a piece was stolen and processed
+        """
+        self._poll_control(block=False)
+        
+        stolen = self.board.steal(self.worker_id, self._steal_policy)
+        if stolen is None:
+            return False
+        
+        job_id, seq, start, _ = stolen
+        self._activate(job_id)
+        self.ranges_stolen += 1
+        
+        items_before = self.items_processed
+        matches_before = self.matches_found
+        timer = Timer()
+        timer.start()
+        
+        span, owned = self._process_range(start, logger)
+        
+        self.results.put('task', job_id, {
+            'worker_id': self.worker_id,
+            'seq': seq,
+            'items': self.items_processed - items_before,
+            'matches': self.matches_found - matches_before,
+            'seconds': timer.stop(),
+            'span': span,
+            'owned': owned
+        })
+        
+        return True
+    
+    def _steal_policy(self, job_id: int) -> Optional[tuple]:
+        """
+        Tell the board how a job's ranges may be split.
+        
+        Args:
+            job_id: Job of the candidate victim range
+        
+        Returns:
+            Tuple of (align, claim units), or None if the job is unknown here
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.source is None:
+            return None
+        
+        return job.source.align, self._claim_units(job)
+    
+    def _claim_units(self, job: Job) -> int:
+        """Get the range units of one claim: `stop_check_items` candidates."""
+        return self._stop_check_items(job) * job.source.units_per_item
+    
+    @staticmethod
+    def _stop_check_items(job: Job) -> int:
+        """
+        Get the number of items hashed between two checks of the stop signal.
+        
+        Args:
+            job: Job whose settings apply
+        
+        Returns:
+            Items per batch
+        """
+        algorithms = job.targets.active_algorithms() or [job.config['hash']['algorithm']]
+        default_batch = 16 if 'PBKDF2' in algorithms else 1024
+        return job.config['general'].get('stop_check_items', default_batch)
+    
+    @staticmethod
+    def _progress_interval(job: Job) -> Optional[float]:
+        """
+        Get the seconds between two progress reports inside a range.
+        
+        Args:
+            job: Job whose settings apply
+        
+        Returns:
+            Checkpoint interval, or None if the job is not checkpointed
+        """
+        if not job.config['output'].get('checkpoint_path'):
+            return None
+        
+        return job.config['general'].get('checkpoint_interval', 30)
+    
+    def _activate(self, job_id: int) -> None:
+        """
+        Make a job the active one, waiting for its spec if necessary.
+        
+        Pending control messages are applied first. A task can only reach
+        a worker after its job was announced, so if the job is still
+        unknown its spec is already on the way and the control queue is
+        read blocking until it arrives.
+        
+        Args:
+            job_id: Job to activate
+        """
+        if self.job is not None and self.job.job_id == job_id:
+            return
+        
+        self._poll_control(block=False)
+        
+        while job_id not in self.jobs:
+            self._poll_control(block=True)
+        
+        job = self.jobs[job_id]
+        hash_config = job.config['hash']
+        
+        # Only algorithms that have targets are computed
+        algorithms = job.targets.active_algorithms() or [hash_config['algorithm']]
+        
+        self.job = job
+        self.targets = job.targets
+        self.source = job.source
+        self.algorithm = algorithms[0]
+        self.binary = self._is_binary(job)
+        
+        # Arena chunks are packed as UTF-8; file sources keep the CSV encoding
+        if job.source is not None:
+            self.encoding = job.config['input'].get('csv_encoding', 'utf-8')
+        else:
+            self.encoding = 'utf-8'
+        
+        self.rules = job.rules
+        self.hasher = self._hasher(hash_config, algorithms)
+        self.stop_check_items = self._stop_check_items(job)
+    
+    def _poll_control(self, block: bool) -> None:
+        """
+        Apply control messages from the pool.
+        
+        Args:
+            block: Wait for one message; otherwise only drain pending ones
+        """
+        while True:
+            try:
+                message = self.control_queue.get(block=block)
+            except Empty:
+                return
+            
+            action, value = message
+            
+            if action == 'job':
+                self.jobs[value.job_id] = value
+                self._prepare(value)
+            elif action == 'end':
+                self._release(value)
+            
+            if block:
+                return
+    
+    def _prepare(self, job: Job) -> None:
+        """
+        Set up per-job state once: open the source and compile the rules.
+        
+        Args:
+            job: Newly registered job
+        """
+        if job.source is not None:
+            job.source.open()
+        
+        # Rules are compiled once per job and worker, never per candidate.
+        # CSV words get str rules however their chunks travel.
+        binary = job.source.binary if job.source is not None else False
+        job.rules = RuleEngine.from_config(job.config, binary)
+    
+    def _is_binary(self, job: Job) -> bool:
+        """Check whether a job's candidates are hashed as bytes-like items."""
+        if job.source is not None:
+            return job.source.binary
+        
+        # Arena items stay bytes unless rules have to see the decoded words
+        return self.arena is not None and job.rules is None
+    
+    def _release(self, job_id: int) -> None:
+        """
+        Drop a finished job and close its source.
+        
+        Args:
+            job_id: Finished job
+        """
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return
+        
+        if self.job is job:
+            self.job = None
+            self.source = None
+            self.targets = None
+        
+        if job.source is not None:
+            job.source.close()
+    
+    def _hasher(self, hash_config: Dict[str, Any],
+                algorithms: List[str]) -> Union[Hasher, MultiHasher]:
+        """
+        Get a cached hasher for a hash configuration.
+        
+        A single algorithm gets a Hasher; several algorithms share one
+        MultiHasher that hashes each candidate once per algorithm.
+        
+        Args:
+            hash_config: `hash` section of a job config
+            algorithms: Algorithms that have targets
+        
+        Returns:
+            Hasher or MultiHasher instance
+        """
+        key = (
+            tuple(algorithms),
+            hash_config.get('pbkdf2_iterations', 100000),
+            hash_config.get('pbkdf2_salt_length', 32)
+        )
+        
+        if key not in self.hashers:
+            if len(algorithms) == 1:
+                self.hashers[key] = Hasher(
+                    algorithm=algorithms[0],
+                    iterations=key[1],
+                    salt_length=key[2]
+                )
+            else:
+                self.hashers[key] = MultiHasher(algorithms, key[1], key[2])
+        
+        return self.hashers[key]
+    
+    def _process_chunk(self, chunk: Iterable, hasher: Union[Hasher, MultiHasher],
+                       logger: Logger) -> None:
         """
         Process a chunk of data by hashing and comparing.
         
-        Iterates through each item in the chunk, computes its hash,
-        and compares against the target hash.
+        The whole chunk goes through Hasher.match_many, which hashes every
+        item to a raw digest and looks it up in the target set. Binary
+        sources hand over bytes-like items that are hashed without any str
+        conversion. Hex encoding and decoding only happen for a match.
+        With rules configured, every base word is expanded on the fly, so
+        one queued chunk yields len(rules) times as many candidates.
+        The chunk is hashed in batches of `stop_check_items` and the stop
+        signal is checked between batches.
+        
+        Args:
+            chunk: Strings (or bytes-like items for binary sources) to hash
+            hasher: Hasher instance for hash computation
+            logger: Logger instance for output
+        """
+        if self.rules is not None:
+            chunk = self.rules.expand(chunk)
+        
+        items = iter(chunk)
+        
+        while not self._should_stop():
+            batch = list(islice(items, self.stop_check_items))
+            
+            if batch:
+                self._process_batch(batch, hasher, logger)
+            
+            if len(batch) < self.stop_check_items:
+                break
+    
+    def _process_batch(self, batch: List, hasher: Union[Hasher, MultiHasher],
+                       logger: Logger) -> None:
+        """
+        Hash one batch, skipping items that cannot be hashed.
+        
+        If an item fails, e.g. a str that cannot be encoded, it is logged
+        and the batch continues with the item after it. The hashers count
+        the failing item as hashed, so it is taken off items_processed.
         
         Args:
-            chunk: List of strings to hash and compare
+            batch: Items to hash
             hasher: Hasher instance for hash computation
             logger: Logger instance for output
         """
-        for item in chunk:
+        start = 0
+        
+        while start < len(batch):
+            hashed_before = hasher.items_hashed
+            
             try:
-                computed_hash = hasher.hash(item)
-                self.items_processed += 1
+                matches = hasher.match_many(islice(batch, start, None), self.targets, self.binary)
                 
-                if self._compare_hash(computed_hash):
+                for item, digest in matches:
+                    computed_hash = digest.hex()
+                    original = self._decode(item) if self.binary else item
+                    algorithm = self.targets.algorithm_of(digest) or self.algorithm
                     self.matches_found += 1
-                    self._store_result(item, computed_hash)
-                    logger.log_match_found(self.worker_id, item, computed_hash)
+                    self._store_result(original, computed_hash, algorithm,
+                                       bytes(item) if self.binary else None)
+                    logger.log_match_found(self.worker_id, original, computed_hash)
                 
+                self.items_processed += hasher.items_hashed - hashed_before
+                return
+            
             except Exception as e:
-                logger.error(f"Worker {self.worker_id} error processing '{item}': {e}")
+                hashed = hasher.items_hashed - hashed_before
+                
+                # Not caused by an item: nothing to skip
+                if hashed == 0:
+                    logger.error(f"Worker {self.worker_id} error processing chunk: {e}")
+                    return
+                
+                failed = start + hashed - 1
+                logger.error(f"Worker {self.worker_id} error processing {batch[failed]!r}: {e}")
+                
+                self.items_processed += hashed - 1
+                start = failed + 1
+    
+    def _should_stop(self) -> bool:
+        """
+        Check the stop flag of the active job.
+        
+        Returns:
+            True if all targets of the active job are cracked
+        """
+        return self.stop_signal.is_set(self.job.slot)
     
-    def _compare_hash(self, computed_hash: str) -> bool:
+    def _decode(self, item) -> str:
         """
-        Compare computed hash with target hash.
+        Decode a bytes-like candidate for reporting.
         
         Args:
-            computed_hash: Hash to compare
+            item: Bytes-like candidate
         
         Returns:
-            True if match, False otherwise
+            Decoded string
         """
-        if not self.target_hash:
-            return False
-        
-        return computed_hash.lower() == self.target_hash
+        return bytes(item).decode(self.encoding, errors='replace')
     
-    def _store_result(self, original_value: str, hash_value: str) -> None:
+    def _store_result(self, original_value: str, hash_value: str, algorithm: str,
+                      raw: Optional[bytes] = None) -> None:
         """
-        Store match result in shared dictionary.
+        Send match result to the parent over the result channel.
+        
+        A binary candidate whose decoded text does not encode back to the
+        same bytes also carries them as `original_hex`, so the potfile can
+        keep the exact plaintext.
         
         Args:
             original_value: Original input value
             hash_value: Computed hash
+            algorithm: Algorithm of the matched target
+            raw: Bytes that were hashed, for binary candidates
         """
         result_key = f"match_{self.worker_id}_{self.matches_found}"
-        
-        self.results_dict[result_key] = {
+        record = {
             'worker_id': self.worker_id,
             'original': original_value,
             'hash': hash_value,
-            'algorithm': self.algorithm
+            'algorithm': algorithm
         }
+        
+        if raw is not None and raw != original_value.encode('utf-8'):
+            record['original_hex'] = raw.hex()
+        
+        self.results.put('match', self.job.job_id, {
+            'key': result_key,
+            'record': record
+        })
     
     def get_statistics(self) -> Dict[str, int]:
         """
@@ -133,5 +599,7 @@ class Worker(Process):
         return {
             'worker_id': self.worker_id,
             'items_processed': self.items_processed,
-            'matches_found': self.matches_found
+            'matches_found': self.matches_found,
+            'tasks_processed': self.tasks_processed,
+            'ranges_stolen': self.ranges_stolen
         }
@@ -0,0 +1,383 @@
+"""
+Parallel Hash Cracking Engine - Worker Pool Module
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Long-lived pool of worker processes shared by many pipeline runs
+"""
+
+import threading
+from multiprocessing import Queue as MPQueue
+from typing import Dict, Any, List, Optional, Tuple
+from src.pipeline.chunk_arena import ChunkArena
+from src.pipeline.job import Job
+from src.pipeline.logger import Logger
+from src.pipeline.range_board import RangeBoard
+from src.pipeline.result_channel import ResultChannel
+from src.pipeline.source import CandidateSource
+from src.pipeline.stop_signal import StopSignal
+from src.pipeline.target_set import TargetSet
+from src.pipeline.task_queue import TaskQueue
+from src.pipeline.worker import Worker
+
+
+class WorkerPool:
+    """
+    Pool of warmed-up worker processes that runs many jobs.
+    
+    Workers, the task queue and the result channel are created once and
+    reused by every job, so a small job pays neither process spawn nor
+    teardown. All jobs share one task queue; tasks are multiplexed as
+    (job_id, seq, payload) and the drain thread of the result channel
+    routes matches and task acknowledgements back to their Job.
+    
+    Each running job holds one of `max_jobs` slots in the shared stop
+    signal; the slot is recycled when the job completes. With a
+    `task_batch_size` above 1, tasks of a job are collected and sent as
+    one message per batch; finish() sends the last partial batch. Unless
+    `shared_memory` is disabled, list tasks are packed into a ChunkArena
+    block that is recycled when the task is acknowledged. Unless
+    `work_stealing` is disabled, a shared RangeBoard lets idle workers
+    split in-flight ranges of busy ones.
+    """
+    
+    def __init__(self, config: Dict[str, Any], worker_count: Optional[int] = None,
+                 max_jobs: int = 64):
+        self.config = config
+        self.worker_count = worker_count or config['general']['worker_count']
+        self.max_jobs = max_jobs
+        
+        self.logger = Logger.get_instance()
+        self.task_queue = TaskQueue(
+            config['general'].get('queue_size', self.worker_count * 4),
+            config['general'].get('task_batch_size', 1)
+        )
+        self.stop_signal = StopSignal(max_jobs)
+        self.board = RangeBoard(self.worker_count) if config['general'].get('work_stealing', True) else None
+        use_arena = config['general'].get('shared_memory', True) and ChunkArena.AVAILABLE
+        self.arena = ChunkArena() if use_arena else None
+        self.result_channel = ResultChannel(self._handle_message)
+        self.control_queues: List[MPQueue] = []
+        self.workers: List[Worker] = []
+        
+        self.jobs: Dict[int, Job] = {}
+        self.worker_stats: Dict[int, Dict[str, Any]] = {}
+        self.jobs_completed = 0
+        self._free_slots = list(range(max_jobs - 1, -1, -1))
+        self._next_job_id = 1
+        self._slot_available = threading.Condition()
+        self._batches: Dict[int, List[tuple]] = {}  # tasks of each job not yet sent
+        self._leases: Dict[Tuple[int, int], str] = {}  # arena block of each queued list task
+        self._batch_lock = threading.Lock()
+        self.started = False
+    
+    def start(self) -> None:
+        """
+        Start the worker processes.
+        
+        Jobs created before start() are inherited by the workers at fork
+        and need no control message. The result channel thread is started
+        only after the fork, so no child inherits its locks mid-operation.
+        """
+        if self.started:
+            return
+        
+        self.logger.info(f"Starting worker pool with {self.worker_count} workers...")
+        
+        for i in range(self.worker_count):
+            control_queue = MPQueue()
+            worker = Worker(
+                worker_id=i,
+                task_queue=self.task_queue,
+                results=self.result_channel,
+                control_queue=control_queue,
+                stop_signal=self.stop_signal,
+                config=self.config,
+                jobs=self.jobs,
+                board=self.board,
+                arena=self.arena
+            )
+            self.control_queues.append(control_queue)
+            self.workers.append(worker)
+        
+        for worker in self.workers:
+            worker.start()
+        
+        self.result_channel.start()
+        self.started = True
+        self.logger.info(f"Started {len(self.workers)} workers")
+    
+    def create_job(self, config: Dict[str, Any], targets: TargetSet,
+                   source: Optional[CandidateSource] = None) -> Job:
+        """
+        Register a new job with the pool.
+        
+        Blocks while all job slots are in use. If the workers are already
+        running, the job spec is sent to each of them once.
+        
+        Args:
+            config: Job configuration
+            targets: Target hashes of the job
+            source: Range source, or None if tasks carry the candidates
+        
+        Returns:
+            Registered job
+        """
+        with self._slot_available:
+            while not self._free_slots:
+                self._slot_available.wait()
+            
+            job = Job(self._next_job_id, config, targets, source)
+            job.slot = self._free_slots.pop()
+            self._next_job_id += 1
+            
+            self.stop_signal.clear(job.slot)
+            self.jobs[job.job_id] = job
+        
+        job.timer.start()
+        
+        if self.started:
+            for control_queue in self.control_queues:
+                control_queue.put(('job', job))
+        
+        return job
+    
+    def put_task(self, job: Job, task: Any, span: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Queue one task of a job.
+        
+        Blocks while the shared task queue is full. With batching, the
+        task is only sent once its batch is complete or the job finishes.
+        Tasks of a stopped or already completed job are dropped, so no
+        worker waits for a job it was told to forget.
+        
+        Args:
+            job: Job the task belongs to
+            task: (start, end) range or list of candidates
+            span: Input units the task covers (defaults to a range task
+                itself); reported back to the job when the task is done
+        """
+        if job.stopped or job.job_id not in self.jobs:
+            return
+        
+        seq = job.tasks_submitted
+        
+        if span is None and isinstance(task, tuple):
+            span = task
+        if span is not None:
+            job.spans[seq] = span
+        
+        if self.arena is not None and isinstance(task, list):
+            with self._batch_lock:
+                task = self.arena.pack(task)
+                self._leases[(job.job_id, seq)] = task.name
+        
+        if self.task_queue.batch_size == 1:
+            self.task_queue.put((job.job_id, seq, task))
+            job.tasks_submitted += 1
+            return
+        
+        with self._batch_lock:
+            batch = self._batches.setdefault(job.job_id, [])
+            batch.append((job.job_id, seq, task))
+            job.tasks_submitted += 1
+            
+            if len(batch) < self.task_queue.batch_size:
+                return
+            
+            del self._batches[job.job_id]
+        
+        self.task_queue.put_many(batch)
+    
+    def finish(self, job: Job) -> None:
+        """
+        Mark that every task of a job has been queued.
+        
+        Called once by the job's producer, also after a cancel().
+        
+        Args:
+            job: Job to finish
+        """
+        with self._batch_lock:
+            batch = self._batches.pop(job.job_id, None)
+        
+        if batch:
+            self.task_queue.put_many(batch)
+        
+        if job.finish_submitting(job.tasks_submitted):
+            self._complete(job)
+    
+    def run_job(self, job: Job, tasks, timeout: Optional[float] = None) -> bool:
+        """
+        Queue all tasks of a job and wait for it to complete.
+        
+        Stops queueing as soon as every target of the job is cracked.
+        
+        Args:
+            job: Registered job
+            tasks: Iterable of tasks
+            timeout: Optional timeout in seconds
+        
+        Returns:
+            True if the job completed
+        """
+        for task in tasks:
+            if job.stopped:
+                break
+            
+            self.put_task(job, task)
+        
+        self.finish(job)
+        
+        return job.wait(timeout)
+    
+    def cancel(self, job: Job) -> None:
+        """
+        Abort a job: workers skip its queued tasks and it completes early.
+        
+        Further tasks of the job are dropped; the job completes once its
+        producer calls finish() and the queued tasks are acknowledged.
+        
+        Args:
+            job: Job to cancel
+        """
+        job.stopped = True
+        self.stop_signal.set(job.slot)
+    
+    def _handle_message(self, kind: str, job_id: Optional[int], payload: Dict[str, Any]) -> None:
+        """
+        Route a worker message to its job (runs in the drain thread).
+        
+        Args:
+            kind: Message kind
+            job_id: Job the message belongs to
+            payload: Message data
+        """
+        if kind == 'worker':
+            self.worker_stats[payload['worker_id']] = payload
+            return
+        
+        # A late acknowledgement of a finished job still frees its block
+        if kind == 'task' and self.arena is not None:
+            self._release_block(job_id, payload['seq'])
+        
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        
+        if kind == 'match':
+            if job.record_match(payload['key'], payload['record']) \
+                    and job.config['general'].get('stop_when_found', True):
+                job.stopped = True
+                self.stop_signal.set(job.slot)
+        
+        elif kind == 'task':
+            if job.record_task_done(payload['worker_id'], payload['items'], payload['matches'],
+                                    payload['seq'], payload['seconds'], payload.get('span'),
+                                    payload.get('owned')):
+                self._complete(job)
+        
+        elif kind == 'progress':
+            job.record_progress(payload['span'])
+    
+    def _release_block(self, job_id: int, seq: int) -> None:
+        """
+        Recycle the arena block of an acknowledged list task.
+        
+        Args:
+            job_id: Job of the task
+            seq: Task sequence number
+        """
+        with self._batch_lock:
+            name = self._leases.pop((job_id, seq), None)
+            if name is not None:
+                self.arena.release(name)
+    
+    def _complete(self, job: Job) -> None:
+        """
+        Release a completed job's slot and tell the workers to drop it.
+        
+        Args:
+            job: Completed job
+        """
+        with self._slot_available:
+            if self.jobs.pop(job.job_id, None) is None:
+                return
+            
+            self._free_slots.append(job.slot)
+            self.jobs_completed += 1
+            self._slot_available.notify()
+        
+        for control_queue in self.control_queues:
+            control_queue.put(('end', job.job_id))
+        
+        job.timer.stop()
+        job.done.set()
+    
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers after they finish the queued tasks.
+        
+        Args:
+            timeout: Join timeout per worker; stragglers are terminated
+        """
+        if not self.started:
+            return
+        
+        self.task_queue.send_poison_pills(len(self.workers))
+        
+        for worker in self.workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        
+        self.result_channel.stop(timeout)
+        self.started = False
+        self._close_arena()
+        
+        self.logger.info("Worker pool shut down")
+    
+    def terminate(self) -> int:
+        """
+        Kill all workers immediately.
+        
+        Returns:
+            Number of workers terminated
+        """
+        terminated_count = 0
+        
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
+                worker.join(timeout=5)
+                terminated_count += 1
+        
+        self.result_channel.stop(timeout=5)
+        self.started = False
+        self._close_arena()
+        
+        return terminated_count
+    
+    def _close_arena(self) -> None:
+        """Remove the shared memory blocks once no worker uses them."""
+        if self.arena is not None:
+            with self._batch_lock:
+                self.arena.close()
+                self._leases.clear()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+        
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'worker_count': self.worker_count,
+            'workers_alive': sum(1 for worker in self.workers if worker.is_alive()),
+            'jobs_running': len(self.jobs),
+            'jobs_completed': self.jobs_completed,
+            'queue': self.task_queue.get_statistics(),
+            'arena': self.arena.get_statistics() if self.arena is not None else None
+        }
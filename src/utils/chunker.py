@@ -6,7 +6,7 @@ Date: November 2025
 Description: Data chunking utilities for efficient parallel processing
 """
 
-from typing import List, Any, Iterator
+from typing import List, Any, Callable, Iterator, Union
 
 
 class Chunker:
@@ -31,24 +31,29 @@ class Chunker:
             yield data[i:i + chunk_size]
     
     @staticmethod
-    def chunk_range(start: int, end: int, chunk_size: int) -> Iterator[tuple]:
+    def chunk_range(start: int, end: int,
+                    chunk_size: Union[int, Callable[[], int]]) -> Iterator[tuple]:
         """
         Generate range chunks for distributed processing.
         
         Args:
             start: Start of range (inclusive)
             end: End of range (exclusive)
-            chunk_size: Size of each chunk
+            chunk_size: Size of each chunk, or a callable returning the
+                size of the next chunk (adaptive chunking)
         
         Yields:
             Tuples of (chunk_start, chunk_end)
         """
-        if chunk_size < 1:
-            raise ValueError("chunk_size must be at least 1")
+        next_size = chunk_size if callable(chunk_size) else lambda: chunk_size
         
         current = start
         while current < end:
-            chunk_end = min(current + chunk_size, end)
+            size = next_size()
+            if size < 1:
+                raise ValueError("chunk_size must be at least 1")
+            
+            chunk_end = min(current + size, end)
             yield (current, chunk_end)
             current = chunk_end
     
@@ -8,6 +8,8 @@ Description: Unit tests for hash computation engine
 
 import unittest
 from src.pipeline.hasher import Hasher
+from src.pipeline.multi_hasher import MultiHasher
+from src.pipeline.target_set import TargetSet
 
 
 class TestHasher(unittest.TestCase):
@@ -40,6 +42,105 @@ class TestHasher(unittest.TestCase):
         
         self.assertEqual(result, expected)
     
+    def test_hash_bytes(self):
+        """Test hashing bytes-like input matches str hashing."""
+        hasher = Hasher('SHA256')
+        
+        expected = hasher.hash('test')
+        
+        self.assertEqual(hasher.hash_bytes(b'test'), expected)
+        self.assertEqual(hasher.hash_bytes(memoryview(b'xtest')[1:]), expected)
+    
+    def test_digest_raw_bytes(self):
+        """Test raw digest matches hex hash."""
+        for algorithm in ('SHA256', 'SHA384', 'SHA512'):
+            hasher = Hasher(algorithm)
+            
+            digest = hasher.digest('test')
+            
+            self.assertIsInstance(digest, bytes)
+            self.assertEqual(digest.hex(), hasher.hash('test'))
+            self.assertEqual(hasher.digest_bytes(b'test'), digest)
+    
+    def test_hash_many(self):
+        """Test batched hashing matches single hashing."""
+        hasher = Hasher('SHA512')
+        
+        items = [b'test', b'hello', b'']
+        digests = list(hasher.hash_many(items))
+        
+        self.assertEqual(digests, [hasher.digest_bytes(item) for item in items])
+    
+    def test_match_many(self):
+        """Test batched matching yields only target hits and counts items."""
+        hasher = Hasher('SHA256')
+        targets = {hasher.digest('test'), hasher.digest('admin')}
+        
+        matches = list(hasher.match_many(['hello', 'test', 'world', 'admin'], targets))
+        
+        self.assertEqual([item for item, _ in matches], ['test', 'admin'])
+        self.assertEqual(matches[0][1], hasher.digest('test'))
+        self.assertEqual(hasher.items_hashed, 4)
+        
+        matches = list(hasher.match_many([b'test', memoryview(b'nope')], targets, binary=True))
+        
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(hasher.items_hashed, 6)
+    
+    def test_match_many_matches_hash_and_compare(self):
+        """Test batched matching finds the same items as hash() + compare."""
+        hasher = Hasher('SHA256')
+        items = [f"candidate{i}" for i in range(500)]
+        wanted = {'candidate7', 'candidate250', 'candidate499'}
+        targets = {hasher.digest(item) for item in wanted}
+        hex_targets = {digest.hex() for digest in targets}
+        
+        single = [item for item in items if hasher.hash(item).lower() in hex_targets]
+        batched = [item for item, _ in hasher.match_many(items, targets)]
+        
+        self.assertEqual(batched, single)
+        self.assertEqual(set(batched), wanted)
+    
+    def test_match_many_pbkdf2_uses_target_salt(self):
+        """Test PBKDF2 candidates are derived with each target's salt."""
+        hasher = Hasher('PBKDF2', iterations=1000, salt_length=16)
+        
+        targets = TargetSet('PBKDF2', salt_length=16)
+        targets.add(hasher.hash('secret'))
+        targets.add(hasher.hash('hunter2'))
+        
+        salt = bytes.fromhex(hasher.hash('x'))[:16]
+        targets.add(hasher.hash_bytes(b'admin', salt))
+        targets.add(hasher.hash_bytes(b'letmein', salt))
+        
+        self.assertEqual(len(targets.salts), 3)
+        
+        found = [item for item, _ in hasher.match_many(['admin', 'secret', 'nope', 'hunter2'], targets)]
+        
+        self.assertEqual(found, ['admin', 'secret', 'hunter2'])
+        self.assertEqual(hasher.items_hashed, 4)
+        
+        # Plain containers are grouped on the fly
+        plain = {bytes.fromhex(hasher.hash_bytes(b'admin', salt))}
+        self.assertEqual([item for item, _ in hasher.match_many([b'admin'], plain, binary=True)], [b'admin'])
+    
+    def test_multi_hasher_single_pass(self):
+        """Test multi hasher matches each algorithm and hashes items once."""
+        pbkdf2 = Hasher('PBKDF2', iterations=1000, salt_length=16)
+        
+        targets = TargetSet(['SHA256', 'SHA512', 'PBKDF2'], salt_length=16)
+        targets.add(Hasher.quick_hash('admin', 'SHA256'))
+        targets.add(Hasher.quick_hash('secret', 'SHA512'))
+        targets.add(pbkdf2.hash('hunter2'))
+        
+        hasher = MultiHasher(targets.active_algorithms(), iterations=1000, salt_length=16)
+        matches = list(hasher.match_many(['admin', 'secret', 'nope', 'hunter2'], targets))
+        
+        self.assertEqual([item for item, _ in matches], ['admin', 'secret', 'hunter2'])
+        self.assertEqual(targets.algorithm_of(matches[1][1]), 'SHA512')
+        self.assertEqual(targets.algorithm_of(matches[2][1]), 'PBKDF2')
+        self.assertEqual(hasher.items_hashed, 4)
+    
     def test_verify_sha256(self):
         """Test hash verification."""
         hasher = Hasher('SHA256')
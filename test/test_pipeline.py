@@ -7,14 +7,38 @@ Description: Integration tests for pipeline components and workflow
 """
 
 import unittest
+import io
 import os
 import json
-from multiprocessing import Manager
+import pickle
+import signal
+import threading
+import time
+from unittest import mock
+from multiprocessing import Manager, Process, Queue as MPQueue
 from src.config_loader import ConfigLoader
+from src.main import HashCrackingPipeline
 from src.pipeline.receiver import Receiver
+from src.pipeline.file_source import FileRangeSource
+from src.pipeline.wordlist_source import WordlistSource
+from src.pipeline.birth_number_source import BirthNumberSource
+from src.pipeline.mask_source import MaskSource
+from src.utils.validator import Validator
 from src.pipeline.task_queue import TaskQueue
 from src.pipeline.worker import Worker
 from src.pipeline.collector import Collector
+from src.pipeline.target_set import TargetSet
+from src.pipeline.result_channel import ResultChannel
+from src.pipeline.worker_pool import WorkerPool
+from src.pipeline.hasher import Hasher
+from src.pipeline.hash_index import HashIndex
+from src.pipeline.checkpoint import Checkpoint
+from src.pipeline.chunk_sizer import ChunkSizer
+from src.pipeline.chunk_arena import ChunkArena
+from src.pipeline.range_board import RangeBoard
+from src.pipeline.result_cache import ResultCache
+from src.pipeline.potfile import Potfile
+from src.pipeline.logger import Logger
 
 
 class TestPipeline(unittest.TestCase):
@@ -104,6 +128,406 @@ class TestPipeline(unittest.TestCase):
         self.assertGreater(len(chunks), 0)
         self.assertLessEqual(len(chunks[0]), 3)
     
+    def test_receiver_streams_chunks(self):
+        """Test receiver yields chunks before reading the whole file."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        receiver = Receiver(config)
+        chunks = receiver.read_chunks()
+        
+        first = next(chunks)
+        self.assertEqual(first, ['test1', 'test2', 'test3'])
+        self.assertEqual(receiver.get_statistics()['valid_lines'], 3)
+        
+        rest = list(chunks)
+        self.assertEqual([len(chunk) for chunk in rest], [3, 3, 1])
+        self.assertEqual(receiver.get_statistics()['valid_lines'], 10)
+        self.assertEqual(receiver.get_statistics()['total_lines'], 10)
+    
+    def test_receiver_in_memory_data(self):
+        """Test receiver parses CSV text and takes record iterables as they are."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        receiver = Receiver(config, 'test1,x\n\n  test2 \n"a,b"\n')
+        self.assertTrue(receiver.validate_file())
+        self.assertEqual(receiver.read_all(), ['test1', 'test2', 'a,b'])
+        self.assertEqual(receiver.get_statistics()['invalid_lines'], 1)
+        
+        receiver = Receiver(config, 'héllo\n'.encode('utf-8'))
+        self.assertEqual(receiver.read_all(), ['héllo'])
+        
+        receiver = Receiver(config, iter(['one', 'two,three', '']))
+        self.assertEqual(list(receiver.read_chunks()), [['one', 'two,three']])
+        
+        # Streams are read as chunks are consumed
+        stream = io.BytesIO(''.join(f"word{i}\n" for i in range(5000)).encode('utf-8'))
+        chunks = Receiver(config, stream).read_chunks()
+        self.assertEqual(next(chunks), ['word0', 'word1', 'word2'])
+        self.assertLess(stream.tell(), len(stream.getvalue()))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 4997)
+    
+    def test_pipeline_runs_from_memory(self):
+        """Test a pipeline takes a config dict and in-memory candidates on a shared pool."""
+        config = ConfigLoader(self.test_config).load()
+        config['input']['csv_path'] = 'test/missing.csv'
+        
+        pool = WorkerPool(config, worker_count=2)
+        pool.start()
+        
+        try:
+            pipeline = HashCrackingPipeline(config, pool=pool, candidates='one\ntest\ntwo\n')
+            
+            with pipeline.logger.capture() as log:
+                self.assertTrue(pipeline.run())
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertEqual([r['original'] for r in pipeline.results], ['test'])
+        self.assertEqual(pipeline.get_statistics()['records'], 3)
+        self.assertIn('Pipeline completed successfully', log.getvalue())
+        self.assertEqual(config['input']['csv_path'], 'test/missing.csv')
+    
+    def test_pipeline_fails_on_read_error(self):
+        """Test a run whose input cannot be read to its end fails and is not cached."""
+        config = ConfigLoader(self.test_config).load()
+        config['input']['csv_path'] = 'test/bad_encoding.csv'
+        config['target'] = {'hash_to_find': Hasher.quick_hash('absent')}
+        cache = ResultCache()
+        
+        with open(config['input']['csv_path'], 'wb') as f:
+            f.write(b'one\ntwo\n\xff\xfe\n')
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            pipeline = HashCrackingPipeline(config, pool=pool, cache=cache)
+            
+            with pipeline.logger.capture() as log:
+                self.assertFalse(pipeline.run())
+            
+            self.assertIn('Encoding error reading CSV', log.getvalue())
+            self.assertNotIn('Pipeline completed successfully', log.getvalue())
+            self.assertEqual(cache.get_statistics()['entries'], 0)
+            
+            # read_all() logs the error and keeps what it read
+            self.assertEqual(Receiver(config).read_all(), [])
+        finally:
+            pool.shutdown(timeout=10)
+            os.remove(config['input']['csv_path'])
+    
+    def test_result_cache_lru_and_persistence(self):
+        """Test cached results survive a reload and the oldest are evicted."""
+        config = ConfigLoader(self.test_config).load()
+        path = 'test/result_cache.json'
+        
+        targets = TargetSet('SHA256')
+        for word in ('test1', 'test2', 'test3'):
+            targets.add(Hasher.quick_hash(word))
+        
+        fingerprint = ResultCache.fingerprint_of(config, 'test1\ntest2\n')
+        self.assertIsNone(ResultCache.fingerprint_of(config, iter(['test1'])))
+        
+        try:
+            cache = ResultCache(path, max_entries=2)
+            record = {'original': 'test1', 'hash': Hasher.quick_hash('test1'), 'algorithm': 'SHA256'}
+            cache.store(config, [record], [('SHA256', Hasher.quick_hash('test3'))], fingerprint)
+            cache.save()
+            
+            cache = ResultCache.load(path, max_entries=2)
+            found, absent = cache.lookup(config, targets, fingerprint)
+            
+            self.assertEqual([r['original'] for r in found], ['test1'])
+            self.assertEqual(absent, [Hasher.quick_hash('test3')])
+            
+            # Absence only holds for the same candidates
+            self.assertEqual(cache.lookup(config, targets, 'other')[1], [])
+            
+            stats = cache.get_statistics()
+            self.assertEqual((stats['hits'], stats['absent_hits'], stats['misses']), (2, 1, 3))
+            
+            # test1 was used last, so the absent entry is evicted first
+            cache.lookup(config, targets)
+            cache.store(config, [{'original': 'test2', 'hash': Hasher.quick_hash('test2'),
+                                  'algorithm': 'SHA256'}])
+            found, absent = cache.lookup(config, targets, fingerprint)
+            
+            self.assertEqual(sorted(r['original'] for r in found), ['test1', 'test2'])
+            self.assertEqual(absent, [])
+            self.assertEqual(cache.get_statistics()['evictions'], 1)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def test_pipeline_answers_from_cache(self):
+        """Test repeated lookups are answered by the result cache without hashing."""
+        config = ConfigLoader(self.test_config).load()
+        config['target'] = {'hash_to_find': Hasher.quick_hash('test')}
+        missing = dict(config, target={'hash_to_find': Hasher.quick_hash('absent')})
+        candidates = 'one\ntest\ntwo\n'
+        cache = ResultCache()
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            for run_config in (config, config, missing, missing):
+                pipeline = HashCrackingPipeline(run_config, pool=pool, candidates=candidates, cache=cache)
+                self.assertTrue(pipeline.run())
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertIsNone(pipeline.job)
+        self.assertEqual(pipeline.get_statistics()['cached_absent'], 1)
+        self.assertEqual(pool.jobs_completed, 2)
+        
+        stats = cache.get_statistics()
+        self.assertEqual((stats['hits'], stats['absent_hits'], stats['misses']), (1, 1, 2))
+    
+    def test_potfile_round_trip(self):
+        """Test potfile lines are appended once and read back, odd plaintexts hex-encoded."""
+        path = 'test/test.pot'
+        records = [
+            {'original': 'a:b', 'hash': Hasher.quick_hash('a:b'), 'algorithm': 'SHA256'},
+            {'original': 'two\nlines', 'hash': Hasher.quick_hash('two\nlines'), 'algorithm': 'SHA256'}
+        ]
+        
+        try:
+            potfile = Potfile.load(path)
+            self.assertEqual(potfile.add(records), 2)
+            self.assertEqual(potfile.add(records[:1]), 0)
+            
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('not a potfile line\n')
+            
+            potfile = Potfile.load(path)
+            self.assertEqual(len(potfile), 2)
+            self.assertEqual(potfile.invalid_lines, 1)
+            self.assertEqual(potfile.lookup('SHA256', records[1]['hash'].upper()), 'two\nlines')
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.readline(), f"SHA256:{records[0]['hash']}:a:b\n")
+                self.assertTrue(f.readline().split(':', 2)[2].startswith('$HEX['))
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def test_potfile_keeps_raw_bytes(self):
+        """Test wordlist plaintexts that are not UTF-8 are stored as their raw bytes."""
+        path = 'test/test.pot'
+        wordlist = 'test/test_pot_wordlist.txt'
+        raw = b'\xffpass'
+        digest = Hasher().hash_bytes(raw)
+        
+        config = ConfigLoader(self.test_config).load()
+        config['input'].update({'mode': 'wordlist', 'csv_path': wordlist})
+        config['output']['potfile_path'] = path
+        config['target'] = {'hash_to_find': digest}
+        
+        with open(wordlist, 'wb') as f:
+            f.write(b'one\n' + raw + b'\ntwo\n')
+        
+        try:
+            self.assertTrue(HashCrackingPipeline(config).run())
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), f"SHA256:{digest}:$HEX[{raw.hex()}]\n")
+            
+            potfile = Potfile.load(path)
+            self.assertEqual(potfile.lookup('SHA256', digest), raw)
+            
+            targets = TargetSet('SHA256')
+            targets.add(digest)
+            record = potfile.cracked(targets, config)[0]
+            self.assertEqual(record['original_hex'], raw.hex())
+            self.assertEqual(potfile.add([record]), 0)
+            
+            # Entries follow the file: a failed append is retried
+            record = {'original': 'new', 'hash': Hasher.quick_hash('new'), 'algorithm': 'SHA256'}
+            with mock.patch('src.pipeline.potfile.open', side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    potfile.add([record])
+            
+            self.assertIsNone(potfile.lookup('SHA256', record['hash']))
+            self.assertEqual(potfile.add([record]), 1)
+        finally:
+            for name in (path, wordlist):
+                if os.path.exists(name):
+                    os.remove(name)
+    
+    def test_pipeline_skips_targets_in_potfile(self):
+        """Test targets cracked by an earlier run are not searched again."""
+        config = ConfigLoader(self.test_config).load()
+        config['output']['potfile_path'] = 'test/test.pot'
+        config['target'] = {'hash_to_find': Hasher.quick_hash('test')}
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            first = HashCrackingPipeline(config, pool=pool, candidates='one\ntest\n')
+            self.assertTrue(first.run())
+            
+            second = HashCrackingPipeline(config, pool=pool, candidates='one\ntest\n')
+            self.assertTrue(second.run())
+        finally:
+            pool.shutdown(timeout=10)
+            if os.path.exists('test/test.pot'):
+                os.remove('test/test.pot')
+        
+        self.assertIsNotNone(first.job)
+        self.assertIsNone(second.job)
+        self.assertEqual([r['original'] for r in second.results], ['test'])
+        self.assertEqual(second.get_statistics()['potfile_matches'], 1)
+        self.assertEqual(pool.jobs_completed, 1)
+    
+    def test_target_set_without(self):
+        """Test a target set copy leaves out the given targets."""
+        targets = TargetSet(['SHA256', 'SHA512'])
+        targets.add(Hasher.quick_hash('a'))
+        targets.add(Hasher.quick_hash('b', 'SHA512'))
+        
+        rest = targets.without([Hasher.quick_hash('a'), 'zz'])
+        
+        self.assertEqual(len(targets), 2)
+        self.assertEqual(rest.to_hex(), [Hasher.quick_hash('b', 'SHA512')])
+        self.assertEqual(rest.active_algorithms(), ['SHA512'])
+    
+    def test_file_range_source(self):
+        """Test byte ranges are newline aligned and cover every record."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['shard_bytes'] = 7
+        
+        source = FileRangeSource(config)
+        ranges = list(source.ranges())
+        
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.test_csv))
+        
+        for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, next_start)
+        
+        records = []
+        for start, end in ranges:
+            self.assertTrue(source.read_range(start, end).endswith(b'\n'))
+            records.extend(source.candidates(start, end))
+        
+        self.assertEqual(records, Receiver(config).read_all())
+        
+        # One handle serves every read and split, and is not pickled
+        handle = source._handle
+        self.assertEqual(source.align(1), len('test1\n'))
+        self.assertIs(source._handle, handle)
+        self.assertIsNone(pickle.loads(pickle.dumps(source))._handle)
+        
+        source.close()
+        self.assertIsNone(source._handle)
+    
+    def test_wordlist_source_mmap(self):
+        """Test wordlist source yields zero-copy line slices."""
+        wordlist = 'test/test_wordlist.txt'
+        
+        with open(wordlist, 'wb') as f:
+            f.write(b'alpha\r\nbeta\n\ngamma delta\nlast')
+        
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['csv_path'] = wordlist
+        config['input']['shard_bytes'] = 8
+        
+        source = WordlistSource(config)
+        source.open()
+        
+        try:
+            items = []
+            for start, end in source.ranges():
+                for item in source.candidates(start, end):
+                    self.assertIsInstance(item, memoryview)
+                    items.append(bytes(item))
+                    del item
+        finally:
+            source.close()
+            os.remove(wordlist)
+        
+        self.assertEqual(items, [b'alpha', b'beta', b'gamma delta', b'last'])
+    
+    def test_birth_number_source(self):
+        """Test birth number keyspace yields only valid numbers per range."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['birth_date_from'] = '1990-01-01'
+        config['input']['birth_date_to'] = '1990-01-02'
+        config['general']['chunk_size'] = 700
+        
+        source = BirthNumberSource(config)
+        self.assertTrue(source.validate())
+        self.assertEqual(source.total(), 4000)
+        
+        numbers = []
+        for start, end in source.ranges():
+            numbers.extend(item.decode('ascii') for item in source.candidates(start, end))
+        
+        self.assertEqual(len(numbers), len(set(numbers)))
+        self.assertTrue(all(Validator.is_valid_birth_number(n) for n in numbers))
+        self.assertIn('9001010007', numbers)
+        self.assertIn('9051010001', numbers)
+        self.assertEqual(
+            sorted(numbers),
+            sorted(n for n in (f"{p}{s:04d}" for p in ('900101', '905101', '900102', '905102')
+                               for s in range(10000))
+                   if Validator.is_valid_birth_number(n))
+        )
+    
+    def test_birth_number_source_before_1954(self):
+        """Test birth numbers before 1954 have a 3-digit suffix."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['birth_date_from'] = '1950-06-15'
+        config['input']['birth_date_to'] = '1950-06-15'
+        
+        source = BirthNumberSource(config)
+        numbers = list(source.candidates(0, source.total()))
+        
+        self.assertEqual(len(numbers), 2000)
+        self.assertEqual(numbers[0], b'500615000')
+        self.assertEqual(numbers[-1], b'505615999')
+    
+    def test_mask_source(self):
+        """Test mask keyspace is index-addressable and splits exactly."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['mask'] = 'a?1?d'
+        config['input']['custom_charsets'] = {'1': 'xyz'}
+        config['general']['chunk_size'] = 7
+        
+        source = MaskSource(config)
+        self.assertTrue(source.validate())
+        self.assertEqual(source.total(), 30)
+        
+        expected = [f"a{c}{d}".encode() for c in 'xyz' for d in range(10)]
+        
+        self.assertEqual(list(source.candidates(0, 30)), expected)
+        self.assertEqual(source.candidate(13), b'ay3')
+        
+        split = []
+        for start, end in source.ranges():
+            split.extend(source.candidates(start, end))
+        self.assertEqual(split, expected)
+        
+        config['input']['keyspace_start'] = 25
+        self.assertEqual(list(source.ranges()), [(25, 30)])
+    
+    def test_mask_source_invalid(self):
+        """Test unknown mask charsets fail validation."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['mask'] = '?d?q'
+        
+        self.assertFalse(MaskSource(config).validate())
+    
     def test_task_queue(self):
         """Test task queue operations."""
         queue = TaskQueue()
@@ -117,6 +541,60 @@ class TestPipeline(unittest.TestCase):
         task2 = queue.get()
         self.assertEqual(task2, ['test3', 'test4'])
     
+    def test_task_queue_bounded(self):
+        """Test bounded task queue reports full."""
+        queue = TaskQueue(maxsize=1)
+        
+        queue.put(['test1'])
+        
+        self.assertTrue(queue.queue.full())
+        self.assertEqual(queue.get(), ['test1'])
+    
+    def test_task_queue_batches_and_statistics(self):
+        """Test batched tasks are handed out singly and counted across processes."""
+        queue = TaskQueue(maxsize=4, batch_size=3)
+        
+        queue.put_many([['a'], ['b'], ['c'], ['d']])
+        
+        # Two messages: a batch of three and a single task
+        self.assertEqual(queue.queue.qsize(), 2)
+        self.assertEqual(queue.size(), 4)
+        
+        with Manager() as manager:
+            taken = manager.list()
+            
+            def consume():
+                for _ in range(3):
+                    taken.append(queue.get())
+            
+            process = Process(target=consume)
+            process.start()
+            process.join(10)
+            
+            self.assertEqual(list(taken), [['a'], ['b'], ['c']])
+        
+        stats = queue.get_statistics()
+        self.assertEqual(stats['tasks_added'], 4)
+        self.assertEqual(stats['tasks_completed'], 3)
+        self.assertEqual(stats['current_size'], 1)
+        self.assertEqual(stats['peak_size'], 4)
+        self.assertEqual(queue.get(), ['d'])
+        self.assertTrue(queue.is_empty())
+    
+    def test_task_queue_measures_producer_stall(self):
+        """Test time blocked on a full queue is recorded."""
+        queue = TaskQueue(maxsize=1)
+        queue.put(['a'])
+        
+        timer = threading.Timer(0.2, queue.get)
+        timer.start()
+        queue.put(['b'])
+        timer.join()
+        
+        stats = queue.get_statistics()
+        self.assertEqual(stats['producer_stalls'], 1)
+        self.assertGreater(stats['producer_stall_seconds'], 0.1)
+    
     def test_task_queue_poison_pill(self):
         """Test poison pill mechanism."""
         queue = TaskQueue()
@@ -145,6 +623,795 @@ class TestPipeline(unittest.TestCase):
         
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]['original'], 'test')
+    
+    
+    def test_target_set_load_file(self):
+        """Test target set loads hash file into raw digests."""
+        hash_file = 'test/test_targets.txt'
+        
+        with open(hash_file, 'w', encoding='utf-8') as f:
+            f.write('# leaked hashes\n')
+            f.write('9F86D081884C7D659A2FEAA0C55AD015A3BF4F1B2B0B822CD15D6C15B0F00A08\n')
+            f.write('\n')
+            f.write('not-a-hash\n')
+            f.write('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08\n')
+        
+        try:
+            targets = TargetSet('SHA256')
+            added = targets.load_file(hash_file)
+        finally:
+            os.remove(hash_file)
+        
+        self.assertEqual(added, 2)
+        self.assertEqual(len(targets), 1)
+        self.assertEqual(targets.invalid_count, 1)
+        self.assertIn(bytes.fromhex('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'), targets)
+    
+    def test_target_set_mixed_algorithms(self):
+        """Test targets are tagged or inferred per algorithm."""
+        sha256 = Hasher.quick_hash('test1', 'SHA256')
+        sha512 = Hasher.quick_hash('test2', 'SHA512')
+        
+        targets = TargetSet(['SHA256', 'SHA512'])
+        
+        self.assertTrue(targets.add(sha256))
+        self.assertTrue(targets.add(sha512))
+        self.assertTrue(targets.add('SHA384:' + Hasher.quick_hash('test3', 'SHA384')))
+        self.assertFalse(targets.add('SHA256:' + sha512))
+        
+        self.assertEqual(targets.active_algorithms(), ['SHA256', 'SHA512', 'SHA384'])
+        self.assertEqual(targets.algorithm_of(bytes.fromhex(sha512)), 'SHA512')
+        self.assertEqual(targets.invalid_count, 1)
+        self.assertEqual(len(targets), 3)
+    
+    def test_result_channel_dispatches_messages(self):
+        """Test result channel hands every message to the handler in order."""
+        received = []
+        channel = ResultChannel(lambda kind, job_id, payload: received.append((kind, job_id, payload)))
+        channel.start()
+        
+        channel.put('task', 1, {'worker_id': 0, 'seq': 0, 'items': 3, 'matches': 0})
+        channel.put('worker', None, {'worker_id': 0, 'items_processed': 3})
+        channel.stop()
+        
+        self.assertEqual([message[0] for message in received], ['task', 'worker'])
+        self.assertEqual(received[0][1], 1)
+    
+    def test_pool_forks_before_result_thread(self):
+        """Test workers are forked before the result channel thread starts."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        pool = WorkerPool(config, worker_count=1)
+        threads = []
+        
+        with mock.patch.object(Worker, 'start', lambda worker: threads.append(pool.result_channel._thread)):
+            pool.start()
+        
+        self.assertEqual(threads, [None])
+        self.assertTrue(pool.result_channel._thread.is_alive())
+        
+        pool.result_channel.stop()
+    
+    def test_pool_routes_results_per_job(self):
+        """Test pool routes matches to their job and raises its stop flag."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        pool = WorkerPool(config, worker_count=1, max_jobs=2)
+        
+        first = TargetSet('SHA256')
+        first.add(Hasher.quick_hash('test'))
+        second = TargetSet('SHA256')
+        second.add(Hasher.quick_hash('other'))
+        
+        job_a = pool.create_job(config, first)
+        job_b = pool.create_job(config, second)
+        self.assertNotEqual(job_a.slot, job_b.slot)
+        
+        pool._handle_message('match', job_a.job_id, {
+            'key': 'match_0_1',
+            'record': {'worker_id': 0, 'original': 'test', 'hash': Hasher.quick_hash('test'), 'algorithm': 'SHA256'}
+        })
+        pool._handle_message('task', job_a.job_id, {'worker_id': 0, 'seq': 0, 'items': 5, 'matches': 1, 'seconds': 0.01})
+        
+        self.assertTrue(job_a.stopped)
+        self.assertTrue(pool.stop_signal.is_set(job_a.slot))
+        self.assertFalse(pool.stop_signal.is_set(job_b.slot))
+        self.assertEqual(len(Collector.collect_results(job_b.results)), 0)
+        self.assertEqual(Collector.collect_worker_stats(job_a.results)[0]['items_processed'], 5)
+        
+        pool.finish(job_a)
+        self.assertTrue(job_a.done.is_set())
+        self.assertNotIn(job_a.job_id, pool.jobs)
+        
+        # The freed slot is reused with a cleared flag
+        job_c = pool.create_job(config, first)
+        self.assertEqual(job_c.slot, job_a.slot)
+        self.assertFalse(pool.stop_signal.is_set(job_c.slot))
+    
+    def test_worker_pool_reuses_workers(self):
+        """Test one started pool runs several jobs with the same processes."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['general']['stop_when_found'] = False
+        
+        pool = WorkerPool(config, worker_count=2)
+        pool.start()
+        
+        try:
+            pids = [worker.pid for worker in pool.workers]
+            
+            for word in ('test1', 'test2'):
+                targets = TargetSet('SHA256')
+                targets.add(Hasher.quick_hash(word))
+                
+                job = pool.create_job(config, targets)
+                tasks = [['test1', 'test2'], ['test3'], ['test4', 'test5']]
+                
+                self.assertTrue(pool.run_job(job, tasks, timeout=30))
+                
+                results = Collector.collect_results(job.results)
+                self.assertEqual([r['original'] for r in results], [word])
+                self.assertEqual(job.items_processed, 5)
+            
+            self.assertEqual([worker.pid for worker in pool.workers], pids)
+            self.assertEqual(pool.jobs_completed, 2)
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertEqual(sum(stats['tasks_processed'] for stats in pool.worker_stats.values()), 6)
+    
+    def test_worker_pool_batched_tasks(self):
+        """Test a job sent in task batches completes with every task counted."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['general']['stop_when_found'] = False
+        config['general']['task_batch_size'] = 2
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test5'))
+        
+        pool = WorkerPool(config, worker_count=2)
+        pool.start()
+        
+        try:
+            job = pool.create_job(config, targets)
+            tasks = [['test1'], ['test2', 'test3'], ['test4'], ['test5', 'test6']]
+            
+            self.assertTrue(pool.run_job(job, tasks, timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertEqual([r['original'] for r in Collector.collect_results(job.results)], ['test5'])
+        self.assertEqual(job.items_processed, 6)
+        self.assertEqual(pool.task_queue.get_statistics()['tasks_completed'], 4)
+        self.assertEqual(pool.arena.get_statistics()['chunks_packed'], 4)
+    
+    def test_chunk_arena_recycles_blocks(self):
+        """Test packed chunks read back as bytes and blocks are reused."""
+        arena = ChunkArena(block_bytes=64)
+        
+        try:
+            chunk = arena.pack(['test1', '', 'héllo'])
+            
+            # A worker gets a copy without the parent's block handles
+            worker_arena = pickle.loads(pickle.dumps(arena))
+            self.assertEqual(list(worker_arena.items(chunk)), [b'test1', b'', 'héllo'.encode()])
+            worker_arena.detach()
+            
+            arena.release(chunk.name)
+            second = arena.pack(['test2'])
+            self.assertEqual(second.name, chunk.name)
+            
+            # Larger chunks get a block of their own
+            large = arena.pack(['x' * 100])
+            self.assertNotEqual(large.name, chunk.name)
+            
+            stats = arena.get_statistics()
+            self.assertEqual(stats['blocks'], 2)
+            self.assertEqual(stats['blocks_reused'], 1)
+        finally:
+            arena.close()
+    
+    def test_chunk_arena_skips_unencodable_items(self):
+        """Test an item that is not valid UTF-8 is skipped without losing the chunk."""
+        config = ConfigLoader(self.test_config).load()
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            job = pool.create_job(config, targets)
+            self.assertTrue(pool.run_job(job, [['bad\ud800', 'test']], timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertEqual([r['original'] for r in Collector.collect_results(job.results)], ['test'])
+        self.assertEqual(pool.get_statistics()['arena']['items_skipped'], 1)
+    
+    def test_chunk_arena_rules_see_words(self):
+        """Test rules act on decoded words, not UTF-8 bytes, when chunks travel through the arena."""
+        config = ConfigLoader(self.test_config).load()
+        config['input']['rules'] = ['u', 'r']
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('ČENĚK'))
+        targets.add(Hasher.quick_hash('kěneČ'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            self.assertIsNotNone(pool.arena)
+            job = pool.create_job(config, targets)
+            self.assertTrue(pool.run_job(job, [['Čeněk']], timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        found = sorted(r['original'] for r in Collector.collect_results(job.results))
+        self.assertEqual(found, ['kěneČ', 'ČENĚK'])
+    
+    def test_pool_releases_blocks_of_finished_jobs(self):
+        """Test a task acknowledged after its job completed still frees its block."""
+        config = ConfigLoader(self.test_config).load()
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        
+        try:
+            job = pool.create_job(config, targets)
+            pool.put_task(job, ['test1', 'test2'])
+            pool._complete(job)
+            
+            pool._handle_message('task', job.job_id, {
+                'worker_id': 0, 'seq': 0, 'items': 2, 'matches': 0, 'seconds': 0.0
+            })
+            
+            self.assertEqual(pool.get_statistics()['arena']['free_blocks'], 1)
+            self.assertEqual(pool._leases, {})
+        finally:
+            pool._close_arena()
+    
+    def test_pool_drops_tasks_of_cancelled_jobs(self):
+        """Test a cancelled job takes no more tasks and completes once finished."""
+        config = ConfigLoader(self.test_config).load()
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            job = pool.create_job(config, targets)
+            pool.put_task(job, ['one'])
+            pool.cancel(job)
+            pool.put_task(job, ['test'])
+            
+            self.assertFalse(job.done.is_set())
+            self.assertEqual(job.tasks_submitted, 1)
+            
+            pool.finish(job)
+            self.assertTrue(job.wait(30))
+            
+            pool.put_task(job, ['test'])
+            self.assertEqual(job.tasks_submitted, 1)
+            
+            # The worker did not get stuck on the forgotten job
+            second = pool.create_job(config, targets)
+            self.assertTrue(pool.run_job(second, [['test']], timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertEqual(Collector.collect_results(job.results), [])
+        self.assertEqual(len(Collector.collect_results(second.results)), 1)
+    
+    def test_worker_skips_items_that_fail(self):
+        """Test an item that cannot be hashed does not drop the rest of its chunk."""
+        config = ConfigLoader(self.test_config).load()
+        config['general']['shared_memory'] = False
+        config['general']['stop_when_found'] = False
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test'))
+        targets.add(Hasher.quick_hash('test2'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            job = pool.create_job(config, targets)
+            tasks = [['bad\ud800', 'test', 'x\udfff', 'test2']]
+            self.assertTrue(pool.run_job(job, tasks, timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        results = Collector.collect_results(job.results)
+        self.assertEqual(sorted(r['original'] for r in results), ['test', 'test2'])
+        self.assertEqual(job.items_processed, 2)
+    
+    def test_worker_pool_without_shared_memory(self):
+        """Test list tasks still travel pickled with shared memory disabled."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['general']['shared_memory'] = False
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test3'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        pool.start()
+        
+        try:
+            job = pool.create_job(config, targets)
+            self.assertTrue(pool.run_job(job, [['test1', 'test2'], ['test3']], timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        self.assertIsNone(pool.arena)
+        self.assertEqual([r['original'] for r in Collector.collect_results(job.results)], ['test3'])
+        
+        # Without multiprocessing.shared_memory the arena is skipped as well
+        config['general']['shared_memory'] = True
+        with mock.patch.object(ChunkArena, 'AVAILABLE', False):
+            self.assertIsNone(WorkerPool(config, worker_count=1).arena)
+    
+    def test_worker_pool_mixed_algorithms(self):
+        """Test one job cracks targets of several algorithms in one pass."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['general']['stop_when_found'] = False
+        
+        targets = TargetSet(['SHA256', 'SHA512'])
+        targets.add(Hasher.quick_hash('test2', 'SHA256'))
+        targets.add(Hasher.quick_hash('test4', 'SHA512'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        job = pool.create_job(config, targets)
+        pool.start()
+        
+        try:
+            self.assertTrue(pool.run_job(job, [['test1', 'test2', 'test3', 'test4']], timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        found = {r['original']: r['algorithm'] for r in Collector.collect_results(job.results)}
+        self.assertEqual(found, {'test2': 'SHA256', 'test4': 'SHA512'})
+        self.assertEqual(job.items_processed, 4)
+    
+    def test_worker_skips_work_after_stop(self):
+        """Test worker hashes nothing once its job's stop flag is set."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test2'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        job = pool.create_job(config, targets)
+        pool.stop_signal.set(job.slot)
+        
+        worker = Worker(0, pool.task_queue, pool.result_channel, MPQueue(),
+                        pool.stop_signal, config, jobs=pool.jobs)
+        worker._activate(job.job_id)
+        
+        worker._process_chunk(['test1', 'test2', 'test3'], worker.hasher, Logger.get_instance())
+        
+        self.assertEqual(worker.items_processed, 0)
+        self.assertEqual(worker.matches_found, 0)
+    
+    def test_receiver_offsets(self):
+        """Test receiver yields byte offsets that read back the same record."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        receiver = Receiver(config)
+        pairs = list(receiver.iter_offsets())
+        
+        self.assertEqual([record for _, record in pairs], receiver.read_all())
+        self.assertEqual(pairs[1], (6, 'test2'))
+        
+        for offset, record in pairs:
+            self.assertEqual(receiver.record_at(offset), record)
+    
+    def test_hash_index_csv(self):
+        """Test index built in several runs resolves CSV targets."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['index'] = {'prefix_bytes': 1, 'run_entries': 3}
+        index_path = 'test/test_index.idx'
+        
+        try:
+            self.assertEqual(HashIndex.build(config, index_path), 10)
+            
+            with HashIndex(index_path, config) as index:
+                self.assertEqual(index.entries, 10)
+                self.assertEqual(index.lookup(bytes.fromhex(Hasher.quick_hash('admin'))), 'admin')
+                self.assertIsNone(index.lookup(bytes.fromhex(Hasher.quick_hash('missing'))))
+                
+                prefixes = [index._prefix_at(i) for i in range(index.entries)]
+                self.assertEqual(prefixes, sorted(prefixes))
+        finally:
+            os.remove(index_path)
+    
+    def test_hash_index_keyspace(self):
+        """Test index over a generated keyspace stores candidate indexes."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input'] = {'mode': 'birth_numbers', 'birth_date_from': '1990-01-01',
+                           'birth_date_to': '1990-01-01'}
+        index_path = 'test/test_index.idx'
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('9051010001'))
+        targets.add(Hasher.quick_hash('0000000000'))
+        
+        try:
+            HashIndex.build(config, index_path)
+            
+            with HashIndex(index_path, config) as index:
+                results = index.lookup_targets(targets)
+        finally:
+            os.remove(index_path)
+        
+        self.assertEqual([r['original'] for r in results], ['9051010001'])
+    
+    def test_hash_index_wordlist_verbatim(self):
+        """Test wordlist lines are indexed verbatim, as workers hash them."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input'] = {'mode': 'wordlist', 'csv_path': 'test/test_wordlist.txt'}
+        index_path = 'test/test_index.idx'
+        lines = [b'  spaced  ', b'pass,extra', b'"quoted"', b'\xffbad', b'plain']
+        
+        with open(config['input']['csv_path'], 'wb') as f:
+            f.write(b'\r\n'.join(lines) + b'\n\n')
+        
+        try:
+            self.assertEqual(HashIndex.build(config, index_path), len(lines))
+            
+            with HashIndex(index_path, config) as index:
+                for line in lines:
+                    digest = bytes.fromhex(Hasher('SHA256').hash_bytes(line))
+                    self.assertEqual(index.lookup(digest), line.decode('utf-8', errors='replace'))
+        finally:
+            os.remove(index_path)
+            os.remove(config['input']['csv_path'])
+    
+    def test_hash_index_rejects_rules(self):
+        """Test rules are rejected instead of being silently ignored."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['rules'] = ['u']
+        
+        with self.assertRaises(ValueError):
+            HashIndex.build(config, 'test/test_index.idx')
+        
+        with self.assertRaises(ValueError):
+            HashIndex('test/test_index.idx', config).open()
+    
+    def test_hash_index_rejects_salted(self):
+        """Test PBKDF2 cannot be indexed."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['hash']['algorithm'] = 'PBKDF2'
+        
+        with self.assertRaises(ValueError):
+            HashIndex.build(config, 'test/test_index.idx')
+    
+    def test_checkpoint_merges_ranges(self):
+        """Test finished spans collapse into intervals and survive a reload."""
+        path = 'test/test_checkpoint.json'
+        checkpoint = Checkpoint(path, 'abc')
+        
+        for start, end in [(0, 10), (50, 60), (30, 40), (10, 20), (20, 30), (55, 70)]:
+            checkpoint.mark_done(start, end)
+        
+        self.assertEqual(checkpoint.completed, [[0, 40], [50, 70]])
+        self.assertTrue(checkpoint.is_done(39))
+        self.assertFalse(checkpoint.is_done(40))
+        self.assertEqual(list(checkpoint.remaining(5, 100)), [(40, 50), (70, 100)])
+        
+        checkpoint.add_match({'worker_id': 0, 'original': 'test', 'hash': 'aa', 'algorithm': 'SHA256'})
+        
+        try:
+            checkpoint.save()
+            loaded = Checkpoint.load(path, 'abc')
+            
+            self.assertEqual(loaded.completed, [[0, 40], [50, 70]])
+            self.assertEqual(loaded.units_done(), 60)
+            self.assertEqual(list(loaded.cracked), ['aa'])
+            
+            with self.assertRaises(ValueError):
+                Checkpoint.load(path, 'other')
+        finally:
+            checkpoint.remove()
+        
+        self.assertIsNone(Checkpoint.load(path, 'abc'))
+    
+    def test_job_checkpoint_skips_stopped_tasks(self):
+        """Test only tasks finished before a stop are recorded as done."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test1'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        job = pool.create_job(config, targets)
+        job.checkpoint = Checkpoint('test/test_checkpoint.json', 'abc', interval=3600)
+        job.spans = {0: (0, 100), 1: (100, 200)}
+        
+        job.record_task_done(0, 100, 0, seq=0)
+        pool.cancel(job)
+        job.record_task_done(0, 0, 0, seq=1)
+        
+        self.assertEqual(job.checkpoint.completed, [[0, 100]])
+        self.assertEqual(job.checkpoint.saves, 0)
+        self.assertEqual(job.spans, {})
+    
+    def test_resume_after_interrupt(self):
+        """Test an interrupted range run resumes without hashing a candidate twice or missing one."""
+        words = [f"word{i:04d}" for i in range(2000)]
+        wordlist = 'test/test_resume.csv'
+        hashed_log = 'test/test_resume_hashed.txt'
+        checkpoint_path = 'test/test_resume_checkpoint.json'
+        
+        with open(wordlist, 'w', encoding='utf-8') as f:
+            f.write(''.join(f"{word}\n" for word in words))
+        
+        # One range holds the whole file, so only finished claims can reach the checkpoint
+        config = ConfigLoader(self.test_config).load()
+        config['general'].update({'worker_count': 1, 'stop_check_items': 50, 'checkpoint_interval': 0})
+        config['input'].update({'mode': 'sharded', 'csv_path': wordlist, 'shard_bytes': 1 << 20})
+        config['output']['checkpoint_path'] = checkpoint_path
+        config['target'] = {'hash_to_find': Hasher.quick_hash('absent')}
+        
+        process_chunk = Worker._process_chunk
+        
+        def hashed():
+            if not os.path.exists(hashed_log):
+                return []
+            with open(hashed_log, 'r', encoding='utf-8') as f:
+                return f.read().split()
+        
+        def recorded(worker, chunk, hasher, logger):
+            chunk = list(chunk)
+            with open(hashed_log, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"{word}\n" for word in chunk))
+            process_chunk(worker, chunk, hasher, logger)
+        
+        def interrupted(worker, chunk, hasher, logger):
+            done = len(hashed())
+            
+            if done >= 500:
+                # Ctrl+C once the checkpoint holds every candidate hashed so far
+                deadline = time.time() + 10
+                while time.time() < deadline:
+                    try:
+                        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                            completed = json.load(f)['completed']
+                        if sum(end - start for start, end in completed) >= done * 9:
+                            break
+                    except (OSError, ValueError):
+                        pass
+                    time.sleep(0.01)
+                
+                os.kill(os.getppid(), signal.SIGINT)
+                time.sleep(30)
+            
+            recorded(worker, chunk, hasher, logger)
+        
+        try:
+            with mock.patch.object(Worker, '_process_chunk', interrupted):
+                self.assertFalse(HashCrackingPipeline(config).run())
+            
+            first_run = hashed()
+            self.assertGreaterEqual(len(first_run), 500)
+            self.assertLess(len(first_run), len(words))
+            
+            with mock.patch.object(Worker, '_process_chunk', recorded):
+                self.assertTrue(HashCrackingPipeline(config, resume=True).run())
+            
+            self.assertEqual(sorted(hashed()), words)
+        finally:
+            for path in (wordlist, hashed_log, checkpoint_path):
+                if os.path.exists(path):
+                    os.remove(path)
+    
+    def test_chunk_sizer_targets_latency(self):
+        """Test chunk size grows for fast chunks and shrinks for slow ones."""
+        sizer = ChunkSizer(target_seconds=0.2, min_size=10, max_size=100000)
+        
+        self.assertEqual(sizer.size(), 10)
+        
+        # 1 ms per unit: growth is capped at 4x per measurement
+        sizer.observe(10, 0.01)
+        self.assertEqual(sizer.size(), 40)
+        
+        for _ in range(20):
+            sizer.observe(sizer.size(), sizer.size() * 0.001)
+        self.assertEqual(sizer.size(), 200)
+        
+        # Much slower chunks shrink at once, down to min_size
+        sizer.observe(200, 200.0)
+        self.assertEqual(sizer.size(), 10)
+        
+        stats = sizer.get_statistics()
+        self.assertEqual(stats['largest_size'], 200)
+        self.assertEqual(stats['final_size'], 10)
+    
+    def test_receiver_spans(self):
+        """Test record spans follow the size callable and skip finished records."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        receiver = Receiver(config)
+        
+        sizes = iter([2, 1, 100])
+        spans = list(receiver.read_spans(lambda: next(sizes), done=lambda position: position == 3))
+        
+        self.assertEqual(spans, [
+            ((0, 2), ['test1', 'test2']),
+            ((2, 3), ['test3']),
+            ((4, 10), ['world', 'password', '123456', 'admin', 'user', 'test'])
+        ])
+    
+    def test_range_board_steal(self):
+        """Test an idle worker takes the upper half of a busy worker's range."""
+        board = RangeBoard(3)
+        
+        def align(offset):
+            return offset - offset % 10
+        
+        board.begin(0, 1, 5, 0, 1000)
+        self.assertEqual(board.claim(0, 100, align), (0, 100))
+        
+        self.assertEqual(board.steal(1, lambda job_id: (align, 100)), (1, 5, 550, 1000))
+        self.assertIsNone(board.steal(1, lambda job_id: None))
+        
+        # The stolen half is split again by the next idle worker
+        self.assertEqual(board.steal(2, lambda job_id: (align, 100)), (1, 5, 320, 550))
+        
+        pieces = []
+        for worker_id in range(3):
+            while True:
+                piece = board.claim(worker_id, 100, align)
+                if piece is None:
+                    break
+                pieces.append(piece)
+        
+        covered = sorted(pieces + [(0, 100)])
+        self.assertEqual(covered[0][0], 0)
+        self.assertEqual(covered[-1][1], 1000)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(covered, covered[1:])))
+        
+        self.assertEqual(board.finish(0), (320, 320))
+        self.assertEqual(board.finish(1), (1000, 1000))
+        self.assertEqual(board.finish(2), (550, 550))
+        self.assertIsNone(board.steal(0, lambda job_id: (align, 1)))
+    
+    def test_range_board_aligns_outside_lock(self):
+        """Test split points are aligned without holding the board lock."""
+        board = RangeBoard(2)
+        stolen = []
+        
+        def align(offset):
+            self.assertTrue(board.lock.acquire(block=False))
+            board.lock.release()
+            return offset - offset % 10
+        
+        def align_and_steal(offset):
+            # An idle worker splits the range while the owner is aligning
+            if not stolen:
+                stolen.append(board.steal(1, lambda job_id: (align, 100)))
+            return align(offset)
+        
+        board.begin(0, 1, 5, 0, 1000)
+        self.assertEqual(board.claim(0, 100, align), (0, 100))
+        self.assertEqual(board.claim(0, 600, align_and_steal), (100, 550))
+        self.assertEqual(stolen, [(1, 5, 550, 1000)])
+        
+        self.assertIsNone(board.claim(0, 100, align))
+        self.assertEqual(board.finish(0), (550, 550))
+    
+    def test_job_waits_for_stolen_pieces(self):
+        """Test a split task completes only after every stolen piece is back."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('test1'))
+        
+        pool = WorkerPool(config, worker_count=1)
+        job = pool.create_job(config, targets)
+        job.checkpoint = Checkpoint('test/test_checkpoint.json', 'abc', interval=3600)
+        job.spans = {0: (0, 1000)}
+        job.tasks_submitted = 1
+        
+        # Pieces split off pieces, acknowledged before the ones they came from
+        self.assertFalse(job.record_task_done(2, 30, 0, seq=0, span=(750, 1000), owned=(750, 1000)))
+        self.assertFalse(job.finish_submitting(1))
+        self.assertFalse(job.record_task_done(0, 30, 0, seq=0, span=(0, 500), owned=(0, 500)))
+        self.assertTrue(job.record_task_done(1, 30, 0, seq=0, span=(500, 750), owned=(500, 750)))
+        
+        self.assertEqual(job.checkpoint.completed, [[0, 1000]])
+        self.assertEqual(job.items_processed, 90)
+        self.assertEqual(job.tasks_done, 1)
+        self.assertEqual(job.spans, {})
+    
+    def test_worker_pool_steals_ranges(self):
+        """Test a single keyspace task spread over workers hashes every candidate once."""
+        loader = ConfigLoader(self.test_config)
+        config = loader.load()
+        config['input']['mask'] = '?d?d?d?d'
+        config['general']['stop_when_found'] = False
+        config['general']['chunk_size'] = 100
+        
+        targets = TargetSet('SHA256')
+        targets.add(Hasher.quick_hash('0042'))
+        targets.add(Hasher.quick_hash('9999'))
+        
+        source = MaskSource(config)
+        pool = WorkerPool(config, worker_count=2)
+        job = pool.create_job(config, targets, source)
+        pool.start()
+        
+        try:
+            self.assertTrue(pool.run_job(job, [(0, source.total())], timeout=30))
+        finally:
+            pool.shutdown(timeout=10)
+        
+        found = sorted(r['original'] for r in Collector.collect_results(job.results))
+        self.assertEqual(found, ['0042', '9999'])
+        self.assertEqual(job.items_processed, 10000)
+        self.assertEqual(job.pending, {})
+    
+    def test_collector_uncracked_targets(self):
+        """Test collector reports targets without a match."""
+        targets = TargetSet('SHA256')
+        targets.add('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08')
+        targets.add('2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824')
+        
+        results = [{
+            'worker_id': 0,
+            'original': 'test',
+            'hash': '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08',
+            'algorithm': 'SHA256'
+        }]
+        
+        uncracked = Collector.uncracked_targets(results, targets)
+        
+        self.assertEqual(uncracked, ['2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824'])
+    
+    def test_collector_saves_atomically(self):
+        """Test results are renamed into place and an empty results_path saves nothing."""
+        config = ConfigLoader(self.test_config).load()
+        results_dict = {'match_0_1': {'worker_id': 0, 'original': 'test', 'hash': Hasher.quick_hash('test'),
+                                      'algorithm': 'SHA256'}}
+        
+        with mock.patch('src.pipeline.collector.os.replace', wraps=os.replace) as replace:
+            Collector(results_dict, config).run()
+        
+        replace.assert_called_once()
+        self.assertEqual(replace.call_args[0][1], 'test/results.json')
+        self.assertFalse(os.path.exists(replace.call_args[0][0]))
+        
+        with open('test/results.json', 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['matches'][0]['original'], 'test')
+        
+        os.remove('test/results.json')
+        config['output']['results_path'] = ''
+        
+        with mock.patch('src.pipeline.collector.open') as opened:
+            Collector(results_dict, config).run()
+        
+        opened.assert_not_called()
 
 
 if __name__ == '__main__':
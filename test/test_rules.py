@@ -0,0 +1,74 @@
+"""
+Parallel Hash Cracking Engine - Rule Engine Tests
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Unit tests for hashcat-style candidate mutation rules
+"""
+
+import unittest
+from src.pipeline.rules import RuleEngine
+
+
+class TestRules(unittest.TestCase):
+    """Test cases for RuleEngine class."""
+    
+    def test_case_rules(self):
+        """Test case toggling rules."""
+        engine = RuleEngine(['l', 'u', 'c', 'C', 't', 'T2'])
+        
+        self.assertEqual(
+            engine.apply('pAssword'),
+            ['password', 'PASSWORD', 'Password', 'pASSWORD', 'PaSSWORD', 'pASsword']
+        )
+    
+    def test_append_prepend_rules(self):
+        """Test appended digits/years and prepended characters."""
+        engine = RuleEngine(['$1', '$1$9$9$0', '^!', 'c $2 $0 $2 $4'])
+        
+        self.assertEqual(engine.apply('admin'), ['admin1', 'admin1990', '!admin', 'Admin2024'])
+    
+    def test_leetspeak_and_reverse(self):
+        """Test substitution, purge and reversal rules."""
+        engine = RuleEngine(['sa@ se3 so0', 'r', 'd', 'f', '@s', '[', ']', '{', '}', "'3", 'D0'])
+        
+        self.assertEqual(
+            engine.apply('password'),
+            ['p@ssw0rd', 'drowssap', 'passwordpassword', 'passworddrowssap', 'paword',
+             'assword', 'passwor', 'asswordp', 'dpasswor', 'pas', 'assword']
+        )
+    
+    def test_insert_overwrite(self):
+        """Test positional insert and overwrite rules."""
+        engine = RuleEngine(['i0X', 'o0X', 'iZX'])
+        
+        self.assertEqual(engine.apply('abc'), ['Xabc', 'Xbc', 'abc'])
+    
+    def test_binary_rules(self):
+        """Test rules compiled for bytes candidates."""
+        engine = RuleEngine([':', 'u', 'sa@ $!'], binary=True)
+        
+        expanded = list(engine.expand([memoryview(b'alpha'), b'beta']))
+        
+        self.assertEqual(expanded, [b'alpha', b'ALPHA', b'@lph@!', b'beta', b'BETA', b'bet@!'])
+    
+    def test_expand_order(self):
+        """Test expansion applies all rules to each word in order."""
+        engine = RuleEngine([':', '$1'])
+        
+        self.assertEqual(list(engine.expand(['a', 'b'])), ['a', 'a1', 'b', 'b1'])
+    
+    def test_invalid_rule(self):
+        """Test malformed rules raise ValueError."""
+        with self.assertRaises(ValueError):
+            RuleEngine(['X'])
+        
+        with self.assertRaises(ValueError):
+            RuleEngine(['$'])
+        
+        with self.assertRaises(ValueError):
+            RuleEngine(['T!'])
+
+
+if __name__ == '__main__':
+    unittest.main()
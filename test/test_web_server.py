@@ -0,0 +1,371 @@
+"""
+Parallel Hash Cracking Engine - Web Server Tests
+
+Author: Sebastian Lodin
+Date: November 2025
+Description: Tests for the asynchronous job API and streamed uploads
+"""
+
+import unittest
+import http.client
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+import web_server
+
+
+TEST_HASH = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"  # SHA256 of 'test'
+
+
+def make_config():
+    """Build the pipeline configuration the web UI submits."""
+    return {
+        "general": {
+            "worker_count": 2,
+            "chunk_size": 2,
+            "max_workers": 4,
+            "timeout_seconds": 30
+        },
+        "hash": {
+            "algorithm": "SHA256",
+            "pbkdf2_iterations": 100000,
+            "pbkdf2_salt_length": 32
+        },
+        "input": {
+            "csv_path": "",
+            "csv_encoding": "utf-8",
+            "csv_delimiter": ","
+        },
+        "output": {
+            "log_path": "",
+            "results_path": "",
+            "verbose": False
+        },
+        "target": {
+            "hash_to_find": TEST_HASH
+        }
+    }
+
+
+class TestWebJobs(unittest.TestCase):
+    """Test cases for the /api/jobs endpoints."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Start the server on an ephemeral port."""
+        cls.temp_dir = tempfile.mkdtemp()
+        
+        web_config = dict(web_server.WEB_CONFIG)
+        web_config['output'] = {
+            'log_path': os.path.join(cls.temp_dir, 'web_hasher.log')
+        }
+        web_config['pool'] = {'worker_count': 2, 'max_jobs': 8, 'queue_size': 6}
+        web_config['jobs'] = {'max_finished': 2, 'progress_interval': 0.05}
+        
+        # Earlier runs must not answer the targets of these jobs
+        cls.patches = [
+            mock.patch.object(web_server, 'WEB_CONFIG', web_config),
+            mock.patch.object(web_server, 'RESULT_CACHE', None),
+            mock.patch.object(web_server, 'POTFILE', None),
+            mock.patch.object(web_server.HashServerHandler, 'log_message')
+        ]
+        for patch in cls.patches:
+            patch.start()
+        
+        cls.server = ThreadingHTTPServer(('localhost', 0), web_server.HashServerHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server and the shared worker pool."""
+        cls.server.shutdown()
+        cls.server.server_close()
+        
+        if web_server.WORKER_POOL is not None:
+            web_server.WORKER_POOL.shutdown(5)
+            web_server.WORKER_POOL = None
+        
+        for patch in reversed(cls.patches):
+            patch.stop()
+        
+        with web_server.JOBS_LOCK:
+            web_server.JOBS.clear()
+        
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+    
+    def request(self, method, path, body=None, headers=None):
+        """Send a request and return the status and the raw response body."""
+        connection = http.client.HTTPConnection('localhost', self.server.server_address[1], timeout=30)
+        
+        try:
+            connection.request(method, path, body, headers or {})
+            response = connection.getresponse()
+            return response.status, response.read()
+        finally:
+            connection.close()
+    
+    def submit(self, csv_data='hello\ntest\nworld\n'):
+        """Submit a job and return its ID."""
+        body = json.dumps({'csv_data': csv_data, 'config': make_config()})
+        status, data = self.request('POST', '/api/jobs', body, {'Content-Type': 'application/json'})
+        
+        self.assertEqual(status, 202)
+        return json.loads(data)['job_id']
+    
+    def wait_for(self, job_id, states, timeout=30):
+        """Poll a job until it reaches one of `states` and return its progress."""
+        deadline = time.time() + timeout
+        
+        while time.time() < deadline:
+            status, data = self.request('GET', f"/api/jobs/{job_id}")
+            self.assertEqual(status, 200)
+            
+            progress = json.loads(data)
+            if progress['state'] in states:
+                return progress
+            
+            time.sleep(0.02)
+        
+        self.fail(f"Job {job_id} did not reach {states}")
+    
+    def test_submit_returns_job_id(self):
+        """Test a submitted job is accepted with its ID and URLs."""
+        body = json.dumps({'csv_data': 'test\n', 'config': make_config()})
+        status, data = self.request('POST', '/api/jobs', body, {'Content-Type': 'application/json'})
+        
+        self.assertEqual(status, 202)
+        
+        response = json.loads(data)
+        self.assertTrue(response['success'])
+        self.assertTrue(response['job_id'])
+        self.assertEqual(response['status_url'], f"/api/jobs/{response['job_id']}")
+        self.assertEqual(response['events_url'], f"/api/jobs/{response['job_id']}/events")
+        
+        self.wait_for(response['job_id'], ('done', 'failed'))
+    
+    def test_progress_running_then_done(self):
+        """Test progress reports a running job and then its matches."""
+        release = threading.Event()
+        run_pipeline = web_server.run_pipeline
+        
+        def held_pipeline(*args):
+            release.wait(30)
+            return run_pipeline(*args)
+        
+        with mock.patch.object(web_server, 'run_pipeline', held_pipeline):
+            job_id = self.submit()
+            progress = self.wait_for(job_id, ('running',))
+            
+            self.assertNotIn('result', progress)
+            
+            release.set()
+            progress = self.wait_for(job_id, ('done', 'failed'))
+        
+        self.assertEqual(progress['state'], 'done')
+        self.assertEqual(progress['percent'], 100.0)
+        self.assertEqual(progress['result']['matches_found'], 1)
+        self.assertEqual([match['original'] for match in progress['matches']], ['test'])
+    
+    def test_events_end_with_done(self):
+        """Test the event stream ends with a done event carrying the result."""
+        job_id = self.submit()
+        status, data = self.request('GET', f"/api/jobs/{job_id}/events")
+        
+        self.assertEqual(status, 200)
+        
+        events = [block for block in data.decode('utf-8').split('\n\n') if block]
+        event, payload = events[-1].split('\n')
+        
+        self.assertEqual(event, 'event: done')
+        self.assertTrue(all(block.startswith('event: progress') for block in events[:-1]))
+        
+        progress = json.loads(payload[len('data: '):])
+        self.assertEqual(progress['state'], 'done')
+        self.assertEqual(progress['result']['matches_found'], 1)
+    
+    def test_finished_jobs_evicted(self):
+        """Test the oldest finished jobs are forgotten past jobs.max_finished."""
+        job_ids = []
+        
+        for _ in range(4):
+            job_ids.append(self.submit())
+            self.wait_for(job_ids[-1], ('done', 'failed'))
+        
+        for job_id in job_ids[:2]:
+            status, _ = self.request('GET', f"/api/jobs/{job_id}")
+            self.assertEqual(status, 404)
+        
+        for job_id in job_ids[2:]:
+            status, _ = self.request('GET', f"/api/jobs/{job_id}")
+            self.assertEqual(status, 200)
+    
+    def test_upload_job(self):
+        """Test a candidate list sent as the request body is hashed."""
+        body = b'hello\ntest\nworld\n'
+        status, data = self.request('POST', '/api/jobs/upload', body,
+                                    {'Content-Type': 'text/csv', 'X-Config': json.dumps(make_config())})
+        
+        self.assertEqual(status, 202)
+        
+        response = json.loads(data)
+        self.assertEqual(response['bytes_received'], len(body))
+        
+        progress = self.wait_for(response['job_id'], ('done', 'failed'))
+        self.assertEqual(progress['result']['matches_found'], 1)
+    
+    def test_upload_malformed_chunk_fails_job(self):
+        """Test a malformed chunk size fails the upload and its job."""
+        connection = http.client.HTTPConnection('localhost', self.server.server_address[1], timeout=30)
+        
+        try:
+            connection.putrequest('POST', '/api/jobs/upload')
+            connection.putheader('Transfer-Encoding', 'chunked')
+            connection.putheader('X-Config', json.dumps(make_config()))
+            connection.endheaders()
+            connection.send(b'6\r\nhello\n\r\nzz\r\ntest\n\r\n0\r\n\r\n')
+            
+            response = connection.getresponse()
+            status, data = response.status, json.loads(response.read())
+        finally:
+            connection.close()
+        
+        self.assertEqual(status, 400)
+        self.assertFalse(data['success'])
+        self.assertIn('Malformed chunk header', data['error'])
+        
+        progress = self.wait_for(data['job_id'], ('done', 'failed'))
+        self.assertEqual(progress['state'], 'failed')
+    
+    def test_job_ends_before_upload(self):
+        """Test a job that cracks every target stops reading the upload."""
+        config = make_config()
+        config['general']['stop_when_found'] = True
+        
+        body = b'test\n' + b'filler\n' * 200000
+        upload = web_server.UploadStream(io.BytesIO(body), len(body))
+        
+        web_job = web_server.submit_job(io.BufferedReader(upload, web_server.UPLOAD_BUFFER), config)
+        self.assertTrue(web_job.finished.wait(30))
+        
+        self.assertEqual(web_job.state, 'done')
+        self.assertEqual(web_job.result['matches_found'], 1)
+        self.assertFalse(upload.complete.is_set())
+        self.assertLess(upload.bytes_received, len(body))
+    
+    def test_pool_built_from_web_config(self):
+        """Test the shared pool takes its settings from web_config.json, not a job."""
+        config = make_config()
+        config['general']['worker_count'] = 3
+        config['output']['verbose'] = True
+        
+        web_job = web_server.submit_job('test\n', config)
+        self.assertTrue(web_job.finished.wait(30))
+        
+        pool = web_server.WORKER_POOL
+        self.assertEqual(pool.worker_count, 2)
+        self.assertEqual(pool.config['general']['queue_size'], 6)
+        self.assertNotIn('target', pool.config)
+        self.assertEqual(pool.config['output']['log_path'], web_server.WEB_CONFIG['output']['log_path'])
+    
+    def test_conflicting_pool_settings_rejected(self):
+        """Test a job asking for other pool settings than the server's is refused."""
+        config = make_config()
+        config['general']['work_stealing'] = False
+        
+        body = json.dumps({'csv_data': 'test\n', 'config': config})
+        for path in ('/api/run', '/api/jobs'):
+            status, data = self.request('POST', path, body, {'Content-Type': 'application/json'})
+            
+            self.assertEqual(status, 400)
+            self.assertIn('general.work_stealing', json.loads(data)['error'])
+        
+        status, data = self.request('POST', '/api/jobs/upload', b'test\n',
+                                    {'Content-Type': 'text/csv', 'X-Config': json.dumps(config)})
+        
+        self.assertEqual(status, 400)
+        self.assertIn('general.work_stealing', json.loads(data)['error'])
+        
+        config['general']['work_stealing'] = True
+        web_job = web_server.submit_job('test\n', config)
+        self.assertTrue(web_job.finished.wait(30))
+        self.assertEqual(web_job.state, 'done')
+    
+    def test_unknown_job(self):
+        """Test an unknown job ID is answered with 404."""
+        status, data = self.request('GET', '/api/jobs/doesnotexist')
+        
+        self.assertEqual(status, 404)
+        self.assertFalse(json.loads(data)['success'])
+        
+        status, _ = self.request('GET', '/api/jobs/doesnotexist/events')
+        self.assertEqual(status, 404)
+
+
+class TestUploadStream(unittest.TestCase):
+    """Test cases for reading streamed upload bodies."""
+    
+    def read(self, body, length=None):
+        """Read an upload body to its end and return the data and the stream."""
+        upload = web_server.UploadStream(io.BytesIO(body), length)
+        return io.BufferedReader(upload, 4).read(), upload
+    
+    def test_chunked_body(self):
+        """Test chunk extensions and trailer fields are skipped."""
+        body = (b'6;name=value\r\nhello\n\r\n'
+                b'5\r\ntest\n\r\n'
+                b'0;last\r\nX-Checksum: abc\r\nX-Other: 1\r\n\r\n'
+                b'next request')
+        data, upload = self.read(body)
+        
+        self.assertEqual(data, b'hello\ntest\n')
+        self.assertEqual(upload.bytes_received, 11)
+        self.assertTrue(upload.complete.is_set())
+        self.assertIsNone(upload.error)
+    
+    def test_content_length_body(self):
+        """Test a Content-Length body is read up to its length only."""
+        data, upload = self.read(b'hello\ntest\nnext request', 11)
+        
+        self.assertEqual(data, b'hello\ntest\n')
+        self.assertTrue(upload.complete.is_set())
+        self.assertIsNone(upload.error)
+        
+        data, upload = self.read(b'', 0)
+        
+        self.assertEqual(data, b'')
+        self.assertTrue(upload.complete.is_set())
+    
+    def test_malformed_chunk_size(self):
+        """Test a malformed chunk size fails the stream."""
+        upload = web_server.UploadStream(io.BytesIO(b'6\r\nhello\n\r\nzz\r\ntest\n\r\n'))
+        stream = io.BufferedReader(upload, 4)
+        
+        with self.assertRaises(ValueError):
+            stream.read()
+        
+        self.assertIn('Malformed chunk header', upload.error)
+        self.assertTrue(upload.complete.is_set())
+        self.assertEqual(stream.read(), b'')
+    
+    def test_truncated_body(self):
+        """Test a body that ends early fails the stream instead of hanging."""
+        for body, length in ((b'10\r\nhello', None), (b'4\r\ntest\r\n', None), (b'hello', 100)):
+            upload = web_server.UploadStream(io.BytesIO(body), length)
+            
+            with self.assertRaises(ConnectionError):
+                io.BufferedReader(upload, 4).read()
+            
+            self.assertIsNotNone(upload.error)
+            self.assertTrue(upload.complete.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,17 +7,24 @@ Date: November 2025
 Description: HTTP server providing web UI interface for hash cracking engine
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import io
 import json
 import os
 import sys
-import tempfile
+import threading
+import time
+import uuid
 from urllib.parse import urlparse
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.main import HashCrackingPipeline
 from src.config_loader import ConfigLoader
+from src.pipeline.collector import Collector
+from src.pipeline.potfile import Potfile
+from src.pipeline.result_cache import ResultCache
+from src.pipeline.worker_pool import WorkerPool
 
 
 # Load web server configuration
@@ -37,24 +44,383 @@ def load_web_config():
     return {
         'server': {'host': 'localhost', 'port': 8080},
         'paths': {
-            'html_file': 'web/index.html',
-            'temp_csv_prefix': 'temp_input',
-            'temp_config_prefix': 'temp_config'
+            'html_file': 'web/index.html'
         },
         'output': {
             'log_path': 'logs/web_hasher.log',
-            'results_path': 'logs/web_results.json'
+            'potfile_path': ''
         },
-        'defaults': {'encoding': 'utf-8', 'worker_timeout': 5}
+        'defaults': {'encoding': 'utf-8', 'worker_timeout': 5},
+        'pool': {'worker_count': 4, 'max_jobs': 64},
+        'jobs': {'max_finished': 100, 'progress_interval': 0.5},
+        'cache': {'enabled': True, 'path': 'logs/web_cache.json', 'max_entries': 100000}
     }
 
 WEB_CONFIG = load_web_config()
 
+# Worker pool shared by all requests, started on first use
+WORKER_POOL = None
+WORKER_POOL_LOCK = threading.Lock()
+
+# Jobs submitted through /api/jobs, by job id
+JOBS = {}
+JOBS_LOCK = threading.Lock()
+
+# Read size for streamed uploads
+UPLOAD_BUFFER = 1 << 16
+
+
+def load_result_cache():
+    """
+    Load the result cache shared by all requests.
+    
+    Returns:
+        ResultCache, or None if the cache is disabled
+    """
+    cache_config = WEB_CONFIG.get('cache', {})
+    
+    if not cache_config.get('enabled', True):
+        return None
+    
+    return ResultCache.load(
+        cache_config.get('path', 'logs/web_cache.json'),
+        cache_config.get('max_entries', 100000)
+    )
+
+# Cracked and known-absent targets of earlier requests
+RESULT_CACHE = load_result_cache()
+
+# Every target cracked by any run, read once for all requests
+POTFILE_PATH = WEB_CONFIG['output'].get('potfile_path', '')
+POTFILE = Potfile.load(POTFILE_PATH) if POTFILE_PATH else None
+
+
+def pool_settings():
+    """
+    Get the settings that belong to the shared worker pool.
+    
+    They come from the `pool` section of web_config.json only, so no
+    client request can change them for the life of the server.
+    
+    Returns:
+        dict: `general` settings of the pool
+    """
+    pool_config = WEB_CONFIG.get('pool', {})
+    worker_count = pool_config.get('worker_count', 4)
+    
+    return {
+        'worker_count': worker_count,
+        'queue_size': pool_config.get('queue_size', worker_count * 4),
+        'task_batch_size': pool_config.get('task_batch_size', 1),
+        'work_stealing': pool_config.get('work_stealing', True),
+        'shared_memory': pool_config.get('shared_memory', True)
+    }
+
+
+def check_job_config(config):
+    """
+    Check that a job does not ask for pool settings other than the server's.
+    
+    Args:
+        config: Pipeline configuration from the client
+    
+    Returns:
+        str: Error message, or None if the job can run on the shared pool
+    """
+    general = config.get('general', {}) if isinstance(config, dict) else {}
+    settings = pool_settings()
+    
+    for key in ('queue_size', 'task_batch_size', 'work_stealing', 'shared_memory'):
+        if key in general and general[key] != settings[key]:
+            return (f"general.{key} is a setting of the shared worker pool "
+                    f"({settings[key]!r}) and cannot be changed per job")
+    
+    return None
+
+
+def get_worker_pool():
+    """
+    Get the shared worker pool, starting it on first use.
+    
+    Workers stay alive between requests, so a job only pays for
+    queueing its tasks instead of spawning processes. The pool is built
+    from web_config.json, never from a client's configuration.
+    
+    Returns:
+        WorkerPool: Started worker pool
+    """
+    global WORKER_POOL
+    
+    with WORKER_POOL_LOCK:
+        if WORKER_POOL is None:
+            config = ConfigLoader().load_dict({
+                'general': dict(pool_settings(), chunk_size=1),
+                'hash': {'algorithm': 'SHA256'},
+                'input': {},
+                'output': {
+                    'log_path': WEB_CONFIG['output']['log_path'],
+                    'verbose': WEB_CONFIG['output'].get('verbose', True)
+                }
+            })
+            
+            WORKER_POOL = WorkerPool(
+                config,
+                config['general']['worker_count'],
+                WEB_CONFIG.get('pool', {}).get('max_jobs', 64)
+            )
+            WORKER_POOL.start()
+    
+    return WORKER_POOL
+
+
+def run_pipeline(csv_data, config, web_job=None):
+    """
+    Run the hash cracking pipeline on the shared worker pool.
+    
+    The configuration and the candidates are handed to the pipeline in
+    memory, and matches and the log of this run are read back from it,
+    so a request touches no temporary files. Targets answered by the
+    potfile or the result cache are not hashed again.
+    
+    Args:
+        csv_data: Candidate records, one per line, as text or a binary stream
+        config: Pipeline configuration from the client
+        web_job: WebJob to attach the pipeline to for live progress
+    
+    Returns:
+        dict: Result of the run
+    """
+    config['output']['log_path'] = WEB_CONFIG['output']['log_path']
+    # Every job returns its matches, so concurrent jobs share no results file
+    config['output']['results_path'] = ''
+    
+    pipeline = HashCrackingPipeline(config, pool=get_worker_pool(), candidates=csv_data,
+                                    cache=RESULT_CACHE, potfile=POTFILE)
+    
+    if web_job is not None:
+        web_job.pipeline = pipeline
+    
+    start_time = time.time()
+    
+    with pipeline.logger.capture() as log:
+        success = pipeline.run()
+    
+    total_time = time.time() - start_time
+    
+    results_data = pipeline.results
+    stats = pipeline.get_statistics()
+    
+    return {
+        'success': success,
+        'matches_found': len(results_data),
+        'results': results_data,
+        'time': total_time,
+        'log': log.getvalue(),
+        'stats': {
+            'total_items': stats['records'],
+            'matches_found': len(results_data),
+            'total_time': total_time,
+            'rate': stats['records'] / total_time if total_time > 0 else 0,
+            'potfile_matches': stats['potfile_matches'],
+            'cached_matches': stats['cached_matches'],
+            'cached_absent': stats['cached_absent'],
+            'cache': RESULT_CACHE.get_statistics() if RESULT_CACHE is not None else None
+        }
+    }
+
+
+class UploadStream(io.RawIOBase):
+    """
+    Body of a streamed upload as a readable binary stream.
+    
+    The body, sent with Content-Length or with chunked transfer encoding,
+    is read from the socket only as the pipeline asks for more records.
+    Chunks are hashed while the rest of the upload is still arriving, and
+    the bounded task queue holds the client back when workers fall
+    behind, so no copy of the whole upload is ever kept in memory.
+    `complete` is set once the body is read to its end or fails.
+    """
+    
+    MAX_LINE = 65537
+    
+    def __init__(self, rfile, length=None):
+        self.rfile = rfile
+        self.chunked = length is None
+        self.left = length or 0  # bytes left in the body or in the current chunk
+        self.bytes_received = 0
+        self.error = None
+        self.complete = threading.Event()
+        
+        if length == 0:
+            self.complete.set()
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        """Read the next bytes of the body into `buffer`."""
+        if self.complete.is_set():
+            return 0
+        
+        try:
+            if self.chunked and self.left == 0:
+                self.left = self._next_chunk()
+                
+                if self.left == 0:
+                    self.complete.set()
+                    return 0
+            
+            count = self.rfile.readinto(memoryview(buffer)[:min(len(buffer), self.left)])
+            if not count:
+                raise ConnectionError("Upload ended before the end of the body")
+        except (OSError, ValueError) as e:
+            self.error = str(e)
+            self.complete.set()
+            raise
+        
+        self.left -= count
+        self.bytes_received += count
+        
+        if self.left == 0:
+            if self.chunked:
+                self.rfile.readline(self.MAX_LINE)  # CRLF after the chunk data
+            else:
+                self.complete.set()
+        
+        return count
+    
+    def _next_chunk(self):
+        """Read a chunk header and return the chunk size, 0 at the end of the body."""
+        line = self.rfile.readline(self.MAX_LINE)
+        
+        if not line:
+            raise ConnectionError("Upload ended before the end of the body")
+        
+        try:
+            size = int(line.split(b';', 1)[0], 16)
+        except ValueError:
+            raise ValueError(f"Malformed chunk header in upload: {line[:40]!r}")
+        
+        if size == 0:
+            # Skip trailer fields up to the blank line that ends the body
+            while self.rfile.readline(self.MAX_LINE) not in (b'\r\n', b'\n', b''):
+                pass
+        
+        return size
+
+
+class WebJob:
+    """
+    Pipeline run submitted through the asynchronous job API.
+    
+    The run executes in a background thread on the shared worker pool,
+    so the request that submitted it returns at once and any number of
+    jobs run side by side. Progress is read live from the pool's Job.
+    """
+    
+    def __init__(self, csv_data, config):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.csv_data = csv_data
+        self.config = config
+        self.state = 'queued'
+        self.pipeline = None
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.finished = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"web-job-{self.job_id}", daemon=True)
+    
+    def start(self):
+        """Start the run in the background."""
+        self.thread.start()
+    
+    def _run(self):
+        """Run the pipeline and keep its result."""
+        self.state = 'running'
+        
+        try:
+            self.result = run_pipeline(self.csv_data, self.config, self)
+            self.state = 'done' if self.result['success'] else 'failed'
+        except Exception as e:
+            self.error = str(e)
+            self.state = 'failed'
+        finally:
+            self.csv_data = None
+            self.finished.set()
+    
+    def progress(self):
+        """
+        Get live progress of the job.
+        
+        Returns:
+            dict: State, candidates hashed and per second, percent of
+                tasks done, matches so far and, once finished, the result
+        """
+        job = self.pipeline.job if self.pipeline is not None else None
+        stats = job.get_statistics() if job is not None else None
+        
+        data = {
+            'job_id': self.job_id,
+            'state': self.state,
+            'items_processed': 0,
+            'rate': 0.0,
+            'percent': None,
+            'matches': []
+        }
+        
+        if stats is not None:
+            elapsed = stats['elapsed']
+            data['items_processed'] = stats['items_processed']
+            data['rate'] = stats['items_processed'] / elapsed if elapsed > 0 else 0.0
+            data['elapsed'] = elapsed
+            data['tasks_done'] = stats['tasks_done']
+            data['tasks_total'] = stats['tasks_total']
+            
+            # The total is known once every chunk is queued
+            if stats['tasks_total']:
+                data['percent'] = min(100.0, 100.0 * stats['tasks_done'] / stats['tasks_total'])
+            
+            data['matches'] = Collector.collect_results(dict(job.results))
+        
+        if self.finished.is_set():
+            data['percent'] = 100.0 if self.state == 'done' else data['percent']
+            data['result'] = self.result
+            data['error'] = self.error
+        
+        return data
+
+
+def submit_job(csv_data, config):
+    """
+    Register and start a job, forgetting the oldest finished ones.
+    
+    Args:
+        csv_data: Candidate records, one per line, as text or a binary stream
+        config: Pipeline configuration from the client
+    
+    Returns:
+        WebJob: Started job
+    """
+    web_job = WebJob(csv_data, config)
+    max_finished = WEB_CONFIG.get('jobs', {}).get('max_finished', 100)
+    
+    with JOBS_LOCK:
+        finished = [job for job in JOBS.values() if job.finished.is_set()]
+        finished.sort(key=lambda job: job.submitted)
+        
+        for job in finished[:max(0, len(finished) - max_finished + 1)]:
+            del JOBS[job.job_id]
+        
+        JOBS[web_job.job_id] = web_job
+    
+    web_job.start()
+    return web_job
+
 
 class HashServerHandler(BaseHTTPRequestHandler):
     
     def do_GET(self):
-        """Serve HTML page and CSS file"""
+        """Serve HTML page, CSS file and job progress"""
         parsed_path = urlparse(self.path)
         
         if parsed_path.path == '/' or parsed_path.path == '/index.html':
@@ -73,104 +439,165 @@ class HashServerHandler(BaseHTTPRequestHandler):
             css_file = 'web/style.css'
             with open(css_file, 'rb') as f:
                 self.wfile.write(f.read())
+        elif parsed_path.path == '/api/jobs':
+            with JOBS_LOCK:
+                jobs = list(JOBS.values())
+            
+            self.send_json(200, {
+                'jobs': [{'job_id': job.job_id, 'state': job.state} for job in jobs]
+            })
+        elif parsed_path.path.startswith('/api/jobs/'):
+            parts = parsed_path.path[len('/api/jobs/'):].split('/')
+            
+            with JOBS_LOCK:
+                web_job = JOBS.get(parts[0])
+            
+            if web_job is None:
+                self.send_json(404, {'success': False, 'error': 'Unknown job'})
+            elif len(parts) == 1:
+                self.send_json(200, web_job.progress())
+            elif parts[1:] == ['events']:
+                self.stream_events(web_job)
+            else:
+                self.send_response(404)
+                self.end_headers()
         else:
             self.send_response(404)
             self.end_headers()
     
     def do_POST(self):
         """Handle API requests"""
-        if self.path == '/api/run':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
-            try:
-                data = json.loads(post_data.decode('utf-8'))
-                csv_data = data.get('csv_data', '')
-                config = data.get('config', {})
-                
-                result = self.run_pipeline(csv_data, config)
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps(result).encode('utf-8'))
-                
-            except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                error_response = {
-                    'success': False,
-                    'error': str(e)
-                }
-                self.wfile.write(json.dumps(error_response).encode('utf-8'))
-        else:
+        if self.path == '/api/jobs/upload':
+            self.upload_job()
+            return
+        
+        if self.path not in ('/api/run', '/api/jobs'):
             self.send_response(404)
             self.end_headers()
-    
-    def run_pipeline(self, csv_data, config):
-        """Run the hash cracking pipeline"""
-        encoding = WEB_CONFIG['defaults']['encoding']
-        csv_prefix = WEB_CONFIG['paths']['temp_csv_prefix']
-        config_prefix = WEB_CONFIG['paths']['temp_config_prefix']
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', 
-                                         prefix=csv_prefix, encoding=encoding) as csv_file:
-            csv_file.write(csv_data)
-            csv_path = csv_file.name
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json',
-                                         prefix=config_prefix, encoding=encoding) as config_file:
-            config['input']['csv_path'] = csv_path
-            config['output']['log_path'] = WEB_CONFIG['output']['log_path']
-            config['output']['results_path'] = WEB_CONFIG['output']['results_path']
-            json.dump(config, config_file, indent=2)
-            config_path = config_file.name
+            return
+        
+        content_length = int(self.headers['Content-Length'])
+        post_data = self.rfile.read(content_length)
         
         try:
-            pipeline = HashCrackingPipeline(config_path)
-            
-            import time
-            start_time = time.time()
-            success = pipeline.run()
-            total_time = time.time() - start_time
-            
-            results_path = config['output']['results_path']
-            results_data = []
-            
-            if os.path.exists(results_path):
-                with open(results_path, 'r', encoding='utf-8') as f:
-                    results_json = json.load(f)
-                    results_data = results_json.get('matches', [])
-            
-            log_path = config['output']['log_path']
-            log_content = ''
+            data = json.loads(post_data.decode('utf-8'))
+            csv_data = data.get('csv_data', '')
+            config = data.get('config', {})
+        except ValueError as e:
+            self.send_json(400, {'success': False, 'error': str(e)})
+            return
+        
+        error = check_job_config(config)
+        if error is not None:
+            self.send_json(400, {'success': False, 'error': error})
+            return
+        
+        if self.path == '/api/jobs':
+            web_job = submit_job(csv_data, config)
             
-            if os.path.exists(log_path):
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    log_content = f.read()
+            self.send_json(202, {
+                'success': True,
+                'job_id': web_job.job_id,
+                'status_url': f"/api/jobs/{web_job.job_id}",
+                'events_url': f"/api/jobs/{web_job.job_id}/events"
+            })
+            return
+        
+        try:
+            result = run_pipeline(csv_data, config)
+            self.send_json(200, result)
+        except Exception as e:
+            self.send_json(500, {
+                'success': False,
+                'error': str(e)
+            })
+    
+    def upload_job(self):
+        """
+        Start a job on a candidate list streamed as the request body.
+        
+        The body is the raw CSV, sent with Content-Length or chunked, and
+        the pipeline configuration is JSON in the `X-Config` header. The
+        job reads the body while it runs; the response (HTTP 202 with the
+        job ID) is sent once the upload is read. If the job ends first,
+        e.g. because every target was cracked, the rest of the body is
+        not read and the connection is closed after the response.
+        """
+        try:
+            config = json.loads(self.headers.get('X-Config', ''))
             
-            stats = pipeline.receiver.get_statistics()
+            if 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+                length = None
+            else:
+                length = int(self.headers.get('Content-Length', 0))
             
-            return {
-                'success': success,
-                'matches_found': len(results_data),
-                'results': results_data,
-                'time': total_time,
-                'log': log_content,
-                'stats': {
-                    'total_items': stats['valid_lines'],
-                    'matches_found': len(results_data),
-                    'total_time': total_time,
-                    'rate': stats['valid_lines'] / total_time if total_time > 0 else 0
-                }
-            }
+            error = check_job_config(config)
+            if error is not None:
+                raise ValueError(error)
+        except ValueError as e:
+            self.close_connection = True
+            self.send_json(400, {'success': False, 'error': f"Invalid upload request: {e}"})
+            return
         
-        finally:
-            if os.path.exists(csv_path):
-                os.unlink(csv_path)
-            if os.path.exists(config_path):
-                os.unlink(config_path)
+        upload = UploadStream(self.rfile, length)
+        web_job = submit_job(io.BufferedReader(upload, UPLOAD_BUFFER), config)
+        
+        while not upload.complete.wait(0.1):
+            if web_job.finished.is_set():
+                self.close_connection = True
+                break
+        
+        response = {
+            'success': upload.error is None,
+            'job_id': web_job.job_id,
+            'bytes_received': upload.bytes_received,
+            'status_url': f"/api/jobs/{web_job.job_id}",
+            'events_url': f"/api/jobs/{web_job.job_id}/events"
+        }
+        
+        if upload.error is not None:
+            self.close_connection = True
+            response['error'] = f"Upload failed: {upload.error}"
+            self.send_json(400, response)
+        else:
+            self.send_json(202, response)
+    
+    def send_json(self, status, data):
+        """Send a JSON response"""
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode('utf-8'))
+    
+    def stream_events(self, web_job):
+        """
+        Stream job progress as server-sent events until the job finishes.
+        
+        A `progress` event is sent every `jobs.progress_interval` seconds
+        and a final `done` event carries the result.
+        """
+        interval = WEB_CONFIG.get('jobs', {}).get('progress_interval', 0.5)
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        
+        try:
+            while True:
+                finished = web_job.finished.is_set()
+                event = 'done' if finished else 'progress'
+                
+                message = f"event: {event}\ndata: {json.dumps(web_job.progress())}\n\n"
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+                
+                if finished:
+                    break
+                
+                web_job.finished.wait(interval)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
     
     def log_message(self, format, *args):
         """Custom log message"""
@@ -182,7 +609,7 @@ def main():
     host = WEB_CONFIG['server']['host']
     port = WEB_CONFIG['server']['port']
     server_address = (host, port)
-    httpd = HTTPServer(server_address, HashServerHandler)
+    httpd = ThreadingHTTPServer(server_address, HashServerHandler)
     
     print("=" * 60)
     print("Parallel Hash Cracking Engine - Web UI")
@@ -195,6 +622,9 @@ def main():
     except KeyboardInterrupt:
         print("\n\nServer stopped.")
         httpd.server_close()
+    finally:
+        if WORKER_POOL is not None:
+            WORKER_POOL.shutdown(WEB_CONFIG['defaults']['worker_timeout'])
 
 
 if __name__ == '__main__':